@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 {
     'name': 'Contract Management System',
-    'version': '18.0.1.0.1',
+    'version': '18.0.1.1.0',
     'category': 'Sales',
     'summary': 'Contract Management System for managing contracts',
     'description': """
@@ -17,7 +17,7 @@
     """,
     'author': 'Your Company',
     'website': 'https://www.yourcompany.com',
-    'depends': ['base', 'mail'],
+    'depends': ['base', 'mail', 'attachment_indexation'],
     'data': [
         'security/groups.xml',
         'security/ir.model.access.csv',
@@ -32,9 +32,15 @@
         'views/contract_termination_wizard_views.xml',
         'views/performance_guaranty_views.xml',
         'views/wizard_views.xml',
+        'views/deliverable_import_wizard_views.xml',
         'views/menu.xml',
         'views/contract_configuration_views.xml',
         'views/res_partner_views.xml',
+        'views/contract_expiry_alert_views.xml',
+        'views/contract_report_views.xml',
+        'views/contract_timeline_views.xml',
+        'views/contract_guaranty_exposure_views.xml',
+        'views/contract_archive_job_views.xml',
     ],
     'demo': [],
     'installable': True,
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from odoo import http
+from odoo.http import request
+
+
+class ContractManagementController(http.Controller):
+
+    @http.route('/contract_management/amendment/<int:amendment_id>/diff', type='json', auth='user')
+    def amendment_diff(self, amendment_id, compare_to=False, changed_only=True):
+        """Structured diff between an amendment and the current contract
+        (or another amendment when ``compare_to`` is given)"""
+        amendment = request.env['contract.management.amendment'].browse(amendment_id).exists()
+        if not amendment:
+            return []
+        return amendment.get_version_diff(compare_to=compare_to, changed_only=changed_only)
+
+    @http.route('/contract_management/contract/<int:contract_id>/version', type='json', auth='user')
+    def contract_version(self, contract_id, version=False):
+        """Field values of a contract version"""
+        contract = request.env['contract.management'].browse(contract_id).exists()
+        if not contract:
+            return {}
+        return contract.get_version_values(version)
+
+    @http.route('/contract_management/timeline', type='json', auth='user')
+    def timeline(self, date_from, date_to, manager_ids=None, cursor=None, limit=None):
+        """Deliverables and guaranty expiries between two dates, paginated
+        by date cursor"""
+        Timeline = request.env['contract.timeline']
+        kwargs = {'limit': min(int(limit), 1000)} if limit else {}
+        return Timeline.get_timeline(
+            date_from, date_to, manager_ids=manager_ids, cursor=cursor, **kwargs)
+
+    @http.route('/contract_management/search', type='json', auth='user')
+    def search(self, query, limit=80):
+        """Ranked full-text search over contracts"""
+        return request.env['contract.management'].search_fulltext(query, limit=min(int(limit), 500))
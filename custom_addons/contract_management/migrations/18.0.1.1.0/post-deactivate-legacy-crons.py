@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Deactivate the legacy expiry crons.
+
+The per-source expiry crons are superseded by the expiry alert scheduler.
+They are noupdate records, so upgraded databases would keep them active
+next to the scheduler and send every alert twice.
+"""
+import logging
+
+_logger = logging.getLogger(__name__)
+
+LEGACY_CRONS = (
+    'ir_cron_check_expiring_contracts',
+    'ir_cron_check_expiring_deliverables',
+    'ir_cron_check_expiring_performance_guaranties',
+)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    cr.execute("""
+        UPDATE ir_cron SET active = FALSE
+        WHERE active AND id IN (
+            SELECT res_id FROM ir_model_data
+            WHERE module = 'contract_management'
+              AND model = 'ir.cron'
+              AND name IN %s
+        )
+    """, (LEGACY_CRONS,))
+    _logger.info('Deactivated %s legacy expiry crons', cr.rowcount)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Convert full-copy amendments into snapshot storage.
+
+Amendments created before 18.0.1.1.0 stored every contract field in its own
+column. They become full snapshots: the old columns and relation tables are
+read once and serialized into snapshot_data, and the copied documents are
+moved to the snapshot_* binary fields.
+"""
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
+
+SCALAR_COLUMNS = [
+    'contract_type_id', 'facility_project', 'contract_manager_id',
+    'effective_date', 'expiry_date', 'notice_period_days',
+    'contract_document_name', 'contract_document_size',
+    'additional_document_name', 'additional_document_size',
+    'document_count', 'compliance_notes', 'description', 'notes',
+]
+
+RELATIONS = {
+    'classification_ids': ('contract_amendment_classification_rel', 'classification_id'),
+    'category_ids': ('contract_amendment_category_rel', 'category_id'),
+    'department_ids': ('contract_amendment_department_rel', 'department_id'),
+}
+
+DOCUMENTS = ('contract_documents', 'additional_documents')
+
+
+def _existing_columns(cr):
+    cr.execute("""
+        SELECT column_name FROM information_schema.columns
+        WHERE table_name = 'contract_management_amendment'
+    """)
+    return {row[0] for row in cr.fetchall()}
+
+
+def _table_exists(cr, table):
+    cr.execute("SELECT 1 FROM information_schema.tables WHERE table_name = %s", (table,))
+    return bool(cr.fetchone())
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    columns = [c for c in SCALAR_COLUMNS if c in _existing_columns(cr)]
+    cr.execute("""
+        SELECT %s FROM contract_management_amendment
+        WHERE snapshot_data IS NULL
+    """ % ', '.join(['id'] + columns))
+    rows = cr.fetchall()
+    if not rows:
+        return
+
+    snapshots = {}
+    for row in rows:
+        data = dict(zip(columns, row[1:]))
+        for key, value in data.items():
+            if hasattr(value, 'isoformat'):
+                data[key] = value.isoformat()
+            elif value is None:
+                data[key] = False
+        for field_name in RELATIONS:
+            data[field_name] = []
+        snapshots[row[0]] = data
+
+    ids = tuple(snapshots)
+    for field_name, (table, column) in RELATIONS.items():
+        if not _table_exists(cr, table):
+            continue
+        cr.execute("""
+            SELECT amendment_id, array_agg(%s ORDER BY %s)
+            FROM %s WHERE amendment_id IN %%s
+            GROUP BY amendment_id
+        """ % (column, column, table), (ids,))
+        for amendment_id, related_ids in cr.fetchall():
+            snapshots[amendment_id][field_name] = related_ids
+
+    # Copied documents become the snapshot documents of the amendment
+    cr.execute("""
+        UPDATE ir_attachment
+        SET res_field = 'snapshot_' || res_field
+        WHERE res_model = 'contract.management.amendment'
+          AND res_field IN %s
+          AND res_id IN %s
+    """, (DOCUMENTS, ids))
+    cr.execute("""
+        SELECT res_id, res_field, checksum FROM ir_attachment
+        WHERE res_model = 'contract.management.amendment'
+          AND res_field IN %s
+          AND res_id IN %s
+    """, (tuple('snapshot_%s' % f for f in DOCUMENTS), ids))
+    for res_id, res_field, checksum in cr.fetchall():
+        snapshots[res_id][res_field[len('snapshot_'):]] = checksum
+
+    for amendment_id, data in snapshots.items():
+        cr.execute("""
+            UPDATE contract_management_amendment
+            SET snapshot_data = %s, is_full_snapshot = TRUE, snapshot_sequence = 0
+            WHERE id = %s
+        """, (json.dumps(data), amendment_id))
+    _logger.info('Converted %s amendments to full snapshots', len(snapshots))
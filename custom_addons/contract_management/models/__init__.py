@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+from . import contract_temporal
 from . import contract
 from . import contract_deliverables
+from . import contract_deliverable_import_wizard
 from . import contract_reports
 from . import contract_amendment
 from . import contract_amendment_wizard
@@ -10,4 +12,10 @@ from . import contract_configuration
 from . import contract_performance_guaranty
 from . import deliverable_expiration_cron
 from . import performance_guaranty_expiration_cron
+from . import contract_expiry_alert
+from . import contract_archive_job
+from . import contract_portfolio_stats
+from . import contract_timeline
+from . import contract_search_index
+from . import contract_guaranty_exposure
 from . import res_partner
@@ -8,10 +8,14 @@ import logging
 
 _logger = logging.getLogger(__name__)
 
+# Marks attachments moved out of the document fields when archiving
+COLD_STORAGE_DESCRIPTION = 'contract_management: archived document'
+
 
 class Contract(models.Model):
     _name = 'contract.management'
     _description = 'Contract Management'
+    _inherit = ['contract.temporal.mixin']
     _order = 'create_date desc'
 
     # Note: We override search() method, not _search()
@@ -67,109 +71,41 @@ class Contract(models.Model):
         return super().search(domain, offset=offset, limit=limit, order=order)
     
     @api.model
-    def get_view(self, view_id=None, view_type='form', **options):
-        """Override get_view (Odoo 18) to hide New button for Contract Users"""
-        result = super().get_view(view_id=view_id, view_type=view_type, **options)
-        return self._modify_view_for_create_button(result, view_type)
-    
+    def _get_contract_role_profile(self):
+        """Return the (create, delete, duplicate) rights of the current user
+
+        Contract Managers and Procurement can create contracts, only
+        Procurement can delete or duplicate them.
+        """
+        user = self.env.user
+        has_contract_manager = user.has_group('contract_management.group_contract_manager')
+        has_contract_procurement = user.has_group('contract_management.group_contract_procurement')
+        return (
+            has_contract_manager or has_contract_procurement,
+            has_contract_procurement,
+            has_contract_procurement,
+        )
+
     @api.model
-    def fields_view_get(self, view_id=None, view_type='form', toolbar=False, submenu=False):
-        """Override fields_view_get (legacy method) to hide New button for Contract Users"""
-        result = super().fields_view_get(view_id=view_id, view_type=view_type, toolbar=toolbar, submenu=submenu)
-        return self._modify_view_for_create_button(result, view_type)
-    
-    def _modify_view_for_create_button(self, result, view_type):
-        """Modify view XML to control New button visibility"""
-        # Check if user is Contract User ONLY (without Manager/Procurement)
-        has_contract_user = self.env.user.has_group('contract_management.group_contract_user')
-        has_contract_manager = self.env.user.has_group('contract_management.group_contract_manager')
-        has_contract_procurement = self.env.user.has_group('contract_management.group_contract_procurement')
-        
-        is_contract_user_only = has_contract_user and not has_contract_manager and not has_contract_procurement
-        
-        # Control New button visibility based on user groups
-        if view_type in ('list', 'tree', 'form'):
-            arch = result.get('arch', '')
-            if arch:
-                import re
-                # Map view_type to XML tag name
-                if view_type in ('list', 'tree'):
-                    tag_name = 'list'
-                else:
-                    tag_name = 'form'
-                
-                # Determine create attribute value
-                if is_contract_user_only:
-                    # Contract User ONLY: Hide New button
-                    create_value = '0'
-                elif has_contract_manager or has_contract_procurement:
-                    # Contract Manager or Procurement: Show New button
-                    create_value = '1'
-                else:
-                    # Other users: Keep default (usually hidden)
-                    create_value = '0'
-                
-                # Determine delete attribute value
-                # Only Contract Procurement can delete contracts
-                if has_contract_procurement:
-                    delete_value = '1'
-                else:
-                    # Contract User and Contract Manager cannot delete
-                    delete_value = '0'
-                
-                # Determine duplicate attribute value
-                # Only Contract Procurement can duplicate contracts
-                if has_contract_procurement:
-                    duplicate_value = '1'
-                else:
-                    # Contract User and Contract Manager cannot duplicate
-                    duplicate_value = '0'
-                
-                # FORCE remove ALL existing create, delete, and duplicate attributes
-                # Match both numeric (0, 1) and boolean (true, false) values, with or without quotes
-                # Be very aggressive - match any value after the equals sign until space or >
-                arch = re.sub(
-                    r'\s+create\s*=\s*["\']?[^"\'>\s]+["\']?',
-                    '',
-                    arch,
-                    flags=re.IGNORECASE
-                )
-                arch = re.sub(
-                    r'\s+delete\s*=\s*["\']?[^"\'>\s]+["\']?',
-                    '',
-                    arch,
-                    flags=re.IGNORECASE
-                )
-                arch = re.sub(
-                    r'\s+duplicate\s*=\s*["\']?[^"\'>\s]+["\']?',
-                    '',
-                    arch,
-                    flags=re.IGNORECASE
-                )
-                
-                # Find the opening tag and FORCE add create, delete, and duplicate attributes
-                # Try multiple patterns to ensure we catch it
-                attrs = f'create="{create_value}" delete="{delete_value}" duplicate="{duplicate_value}"'
-                patterns = [
-                    (r'(<' + tag_name + r')(\s+[^>]*?)(>)', 
-                     r'\1\2 ' + attrs + r'\3'),  # With attributes
-                    (r'(<' + tag_name + r')(\s+)(>)', 
-                     r'\1\2' + attrs + r'\3'),  # With whitespace only
-                    (r'(<' + tag_name + r')(>)', 
-                     r'\1 ' + attrs + r'\2'),  # No attributes
-                ]
-                
-                modified = False
-                for pattern, replacement in patterns:
-                    if re.search(pattern, arch):
-                        arch = re.sub(pattern, replacement, arch, count=1)
-                        modified = True
-                        break
-                
-                if modified:
-                    result['arch'] = arch
-        
-        return result
+    def _get_view_cache_key(self, view_id=None, view_type='form', **options):
+        """Cache the prepared views per role profile"""
+        key = super()._get_view_cache_key(view_id, view_type, **options)
+        return key + self._get_contract_role_profile()
+
+    @api.model
+    def _get_view(self, view_id=None, view_type='form', **options):
+        """Set the create/delete/duplicate buttons on the list and form root node
+
+        The result is cached by ``get_view`` under the role profile key, so
+        this only runs once per view and profile.
+        """
+        arch, view = super()._get_view(view_id, view_type, **options)
+        if view_type in ('list', 'form'):
+            can_create, can_delete, can_duplicate = self._get_contract_role_profile()
+            arch.set('create', '1' if can_create else '0')
+            arch.set('delete', '1' if can_delete else '0')
+            arch.set('duplicate', '1' if can_duplicate else '0')
+        return arch, view
 
     # Basic Information
     name = fields.Char(
@@ -274,7 +210,8 @@ class Contract(models.Model):
     expiry_date = fields.Date(
         string='Expiry Date',
         required=True,
-        tracking=True
+        tracking=True,
+        index=True
     )
     
     notice_period_days = fields.Integer(
@@ -384,15 +321,55 @@ class Contract(models.Model):
     
     deliverable_count = fields.Integer(
         string='Deliverable Count',
-        compute='_compute_deliverable_count',
+        compute='_compute_portfolio_stats',
         store=True
     )
     
     overdue_deliverable_count = fields.Integer(
         string='Overdue Deliverables',
-        compute='_compute_overdue_deliverable_count',
+        compute='_compute_portfolio_stats',
         store=True
     )
+
+    overdue_deliverable_amount = fields.Monetary(
+        string='Overdue Amount',
+        currency_field='currency_id',
+        compute='_compute_portfolio_stats',
+        store=True,
+        help='Payment amount of the overdue deliverables'
+    )
+
+    next_deliverable_date = fields.Date(
+        string='Next Deliverable',
+        compute='_compute_portfolio_stats',
+        store=True,
+        help='Earliest due date of the pending deliverables that are not overdue'
+    )
+
+    # Deliverable Amounts (aggregated in SQL, used for amount validation)
+    deliverable_total_amount = fields.Monetary(
+        string='Deliverables Total',
+        currency_field='currency_id',
+        compute='_compute_deliverable_amounts',
+        store=True,
+        help='Sum of the payment amounts of all deliverables'
+    )
+
+    deliverable_committed_amount = fields.Monetary(
+        string='Deliverables Completed',
+        currency_field='currency_id',
+        compute='_compute_deliverable_amounts',
+        store=True,
+        help='Sum of the payment amounts of completed deliverables'
+    )
+
+    deliverable_remaining_amount = fields.Monetary(
+        string='Unallocated Value',
+        currency_field='currency_id',
+        compute='_compute_deliverable_amounts',
+        store=True,
+        help='Contract value not yet allocated to deliverables'
+    )
     
     # Compliance and Evidence
     compliance_notes = fields.Text(
@@ -417,7 +394,15 @@ class Contract(models.Model):
     
     is_expiring_soon = fields.Boolean(
         string='Expiring Soon',
-        compute='_compute_is_expiring_soon'
+        compute='_compute_is_expiring_soon',
+        search='_search_is_expiring_soon'
+    )
+
+    fulltext_search = fields.Char(
+        string='Full Text',
+        compute='_compute_fulltext_search',
+        search='_search_fulltext',
+        help='Search title, vendor, deliverables, notes and document contents'
     )
     
     # Amendment Tracking (UR-04)
@@ -430,13 +415,13 @@ class Contract(models.Model):
     
     amendment_count = fields.Integer(
         string='Amendment Count',
-        compute='_compute_amendment_count',
+        compute='_compute_portfolio_stats',
         store=True
     )
     
     current_version = fields.Char(
         string='Current Version',
-        compute='_compute_current_version',
+        compute='_compute_portfolio_stats',
         store=True
     )
     
@@ -477,7 +462,7 @@ class Contract(models.Model):
     
     performance_guaranty_count = fields.Integer(
         string='Performance Guaranty Count',
-        compute='_compute_performance_guaranty_count',
+        compute='_compute_portfolio_stats',
         store=True
     )
 
@@ -507,11 +492,6 @@ class Contract(models.Model):
                 count += 1
             contract.document_count = count
 
-    @api.depends('deliverable_ids')
-    def _compute_deliverable_count(self):
-        for contract in self:
-            contract.deliverable_count = len(contract.deliverable_ids)
-    
     can_edit_as_manager = fields.Boolean(
         string='Can Edit as Manager',
         compute='_compute_can_edit_as_manager',
@@ -568,36 +548,76 @@ class Contract(models.Model):
         for record in self:
             record.is_contract_user_only = is_contract_user_only
     
-    @api.depends('amendment_ids')
-    def _compute_amendment_count(self):
-        for contract in self:
-            contract.amendment_count = len(contract.amendment_ids)
-    
-    @api.depends('amendment_ids', 'amendment_ids.version')
-    def _compute_current_version(self):
+    @api.depends('deliverable_ids', 'deliverable_ids.is_overdue',
+                 'deliverable_ids.status', 'deliverable_ids.deliverable_date',
+                 'deliverable_ids.payment_amount', 'amendment_ids',
+                 'amendment_ids.version', 'performance_guaranty_ids')
+    def _compute_portfolio_stats(self):
+        """Read the counters from contract.portfolio.stats in one query"""
+        stats = self.env['contract.portfolio.stats']._get_stats(self.filtered('id').ids)
         for contract in self:
-            if contract.amendment_ids:
-                # Get the highest version number
-                versions = []
-                for amendment in contract.amendment_ids:
-                    if amendment.version and amendment.version.startswith('v'):
-                        try:
-                            version_num = int(amendment.version[1:])
-                            versions.append(version_num)
-                        except ValueError:
-                            continue
-                if versions:
-                    contract.current_version = f"v{max(versions)}"
-                else:
-                    contract.current_version = "v1"
+            if contract.id:
+                values = stats.get(contract.id, {})
             else:
-                contract.current_version = "v1"
+                # Unsaved record (onchange): fall back to the cached lines
+                values = contract._get_portfolio_stats_from_lines()
+            contract.deliverable_count = values.get('deliverable_count', 0)
+            contract.overdue_deliverable_count = values.get('overdue_deliverable_count', 0)
+            contract.overdue_deliverable_amount = values.get('overdue_deliverable_amount', 0.0)
+            contract.next_deliverable_date = values.get('next_deliverable_date', False)
+            contract.amendment_count = values.get('amendment_count', 0)
+            contract.current_version = f"v{values.get('max_version_number') or 1}"
+            contract.performance_guaranty_count = values.get('performance_guaranty_count', 0)
 
-    @api.depends('deliverable_ids', 'deliverable_ids.is_overdue')
-    def _compute_overdue_deliverable_count(self):
+    def _get_portfolio_stats_from_lines(self):
+        self.ensure_one()
+        overdue = self.deliverable_ids.filtered('is_overdue')
+        upcoming = self.deliverable_ids.filtered(
+            lambda d: d.status == 'pending' and not d.is_overdue and d.deliverable_date)
+        versions = [
+            int(amendment.version[1:]) for amendment in self.amendment_ids
+            if amendment.version and amendment.version.startswith('v')
+            and amendment.version[1:].isdigit()
+        ]
+        return {
+            'deliverable_count': len(self.deliverable_ids),
+            'overdue_deliverable_count': len(overdue),
+            'overdue_deliverable_amount': sum(overdue.mapped('payment_amount')),
+            'next_deliverable_date': min(upcoming.mapped('deliverable_date'), default=False),
+            'amendment_count': len(self.amendment_ids),
+            'max_version_number': max(versions, default=0),
+            'performance_guaranty_count': len(self.performance_guaranty_ids),
+        }
+
+    @api.depends('contract_value', 'deliverable_ids.payment_amount',
+                 'deliverable_ids.status')
+    def _compute_deliverable_amounts(self):
+        """Aggregate deliverable amounts with one GROUP BY per batch"""
+        totals = {}
+        committed = {}
+        stored = self.filtered('id')
+        if stored.ids:
+            groups = self.env['contract.deliverable']._read_group(
+                [('contract_id', 'in', stored.ids)],
+                ['contract_id', 'status'],
+                ['payment_amount:sum'],
+            )
+            for contract, status, amount in groups:
+                totals[contract.id] = totals.get(contract.id, 0.0) + (amount or 0.0)
+                if status == 'completed':
+                    committed[contract.id] = committed.get(contract.id, 0.0) + (amount or 0.0)
         for contract in self:
-            contract.overdue_deliverable_count = len(
-                contract.deliverable_ids.filtered('is_overdue'))
+            if contract.id:
+                total = totals.get(contract.id, 0.0)
+                done = committed.get(contract.id, 0.0)
+            else:
+                # Unsaved record (onchange): fall back to the cached lines
+                total = sum(contract.deliverable_ids.mapped('payment_amount'))
+                done = sum(contract.deliverable_ids.filtered(
+                    lambda d: d.status == 'completed').mapped('payment_amount'))
+            contract.deliverable_total_amount = total
+            contract.deliverable_committed_amount = done
+            contract.deliverable_remaining_amount = (contract.contract_value or 0) - total
 
     def _compute_days_to_expiry(self):
         today = fields.Date.today()
@@ -609,28 +629,7 @@ class Contract(models.Model):
 
     def _search_days_to_expiry(self, operator, value):
         """Search method for days_to_expiry computed field"""
-        today = fields.Date.today()
-        if operator == '<':
-            # Find contracts expiring in less than value days
-            # i.e., days_to_expiry < value means expiry_date - today < value
-            # so expiry_date < today + timedelta(days=value)
-            target_date = today + timedelta(days=value)
-            return [('expiry_date', '<', target_date)]
-        elif operator == '>':
-            # Find contracts expiring in more than value days
-            target_date = today + timedelta(days=value)
-            return [('expiry_date', '>', target_date)]
-        elif operator in ['<=', '>=']:
-            # Handle <= and >= operators
-            target_date = today + timedelta(days=value)
-            op = '<=' if operator == '<=' else '>='
-            return [('expiry_date', op, target_date)]
-        elif operator == '=':
-            # Find contracts expiring on exactly value days from now
-            target_date = today + timedelta(days=value)
-            return [('expiry_date', '=', target_date)]
-        else:
-            return [('id', 'in', [])]
+        return self._search_days_from_today('expiry_date', operator, value)
 
     def _compute_is_expiring_soon(self):
         """Compute if contract is expiring soon (within 30 days)"""
@@ -642,11 +641,56 @@ class Contract(models.Model):
             else:
                 contract.is_expiring_soon = False
 
-    @api.depends('performance_guaranty_ids')
-    def _compute_performance_guaranty_count(self):
-        """Compute performance guaranty count"""
-        for contract in self:
-            contract.performance_guaranty_count = len(contract.performance_guaranty_ids)
+    def _search_is_expiring_soon(self, operator, value):
+        """Search method for is_expiring_soon computed field"""
+        today = fields.Date.today()
+        limit_date = today + timedelta(days=30)
+        return self._search_temporal_flag(operator, value, [
+            ('state', '=', 'active'),
+            ('expiry_date', '>=', today),
+            ('expiry_date', '<=', limit_date),
+        ], [
+            '|', '|', '|',
+            ('state', '!=', 'active'),
+            ('expiry_date', '=', False),
+            ('expiry_date', '<', today),
+            ('expiry_date', '>', limit_date),
+        ])
+
+    def _compute_fulltext_search(self):
+        self.fulltext_search = False
+
+    def _search_fulltext(self, operator, value):
+        """Search method for fulltext_search, backed by contract.search.index"""
+        if operator not in ('ilike', '=', 'like') or not value:
+            raise NotImplementedError('Operator %s is not supported' % operator)
+        return [('id', 'in', self.env['contract.search.index']._search_contract_ids(value))]
+
+    @api.model
+    def search_fulltext(self, query, limit=80):
+        """Ranked full-text search over contracts
+
+        :return: list of dicts (id, contract_number, name, partner) ordered
+            from the best to the worst match
+        """
+        ranked_ids = self.env['contract.search.index']._search_contract_ids(query, limit=limit)
+        contracts = self.search([('id', 'in', ranked_ids)])
+        by_id = {contract.id: contract for contract in contracts}
+        return [{
+            'id': contract.id,
+            'contract_number': contract.contract_number,
+            'name': contract.name,
+            'partner': contract.partner_id.display_name,
+        } for contract in (by_id.get(contract_id) for contract_id in ranked_ids) if contract]
+
+    def _refresh_temporal_states(self):
+        """Expire active contracts whose expiry date has passed"""
+        expired = self.search([
+            ('state', '=', 'active'),
+            ('expiry_date', '<', fields.Date.today()),
+        ])
+        expired.with_context(skip_amendment=True, skip_expiration_check=True).write(
+            {'state': 'expired'})
 
     @api.depends('classification_ids', 'category_ids', 'department_ids')
     def _compute_configuration_display(self):
@@ -771,6 +815,8 @@ class Contract(models.Model):
 
         # Create the contract
         contract = super(Contract, self).create(vals)
+        self.env['contract.report']._schedule_refresh()
+        self.env['contract.search.index']._schedule_reindex(contract.ids)
         return contract
     
     def read(self, fields=None, load='_classic_read'):
@@ -785,6 +831,11 @@ class Contract(models.Model):
         
         return result
 
+    def unlink(self):
+        result = super().unlink()
+        self.env['contract.report']._schedule_refresh()
+        return result
+
     def action_activate(self):
         if self.contract_number == 'New':
             self.write({'contract_number': self._get_next_contract_number()})
@@ -839,10 +890,7 @@ class Contract(models.Model):
         # Validate deliverables amounts if contract value is being changed
         if 'contract_value' in vals:
             for contract in self:
-                total_deliverable_amount = sum(
-                    d.payment_amount or 0
-                    for d in contract.deliverable_ids
-                )
+                total_deliverable_amount = contract.deliverable_total_amount
                 new_contract_value = (
                     vals.get('contract_value', contract.contract_value) or 0)
                 
@@ -872,14 +920,18 @@ class Contract(models.Model):
                         # For multiple contracts, update this contract's version individually
                         contract.with_context(skip_amendment=True).write({'version': next_version})
         
-        return super().write(vals)
+        result = super().write(vals)
+        report = self.env['contract.report']
+        if any(field_name in vals for field_name in report._REPORT_CONTRACT_FIELDS):
+            report._schedule_refresh()
+        search_index = self.env['contract.search.index']
+        if search_index._CONTRACT_SEARCH_FIELDS.intersection(vals):
+            search_index._schedule_reindex(self.ids)
+        return result
 
     def _create_amendment_record(self, amendment_type='amendment', change_summary=''):
         """Create an amendment record before updating contract data"""
         for contract in self:
-            # Get current contract data (skip automatic expiration check to avoid recursion)
-            current_data = contract.with_context(skip_expiration_check=True).read()[0]
-            
             # Get current contract version (this will be stored in the amendment)
             current_contract_version = contract.version or 'v1'
             
@@ -902,7 +954,9 @@ class Contract(models.Model):
                 # Default case - should not happen but just in case
                 next_version = "v2"
             
-            # Prepare amendment data with all contract fields
+            # Prepare amendment data: header fields plus the contract data
+            # stored as a delta against the previous version
+            amendment_model = self.env['contract.management.amendment']
             amendment_data = {
                 'contract_id': contract.id,
                 'version': current_contract_version,  # Store the CURRENT contract version
@@ -912,27 +966,39 @@ class Contract(models.Model):
                 'amendment_date': fields.Datetime.now(),
                 'is_current': False,  # Will be updated after the contract is updated
             }
-            
-            # Copy only fields that exist in the amendment model
-            amendment_model = self.env['contract.management.amendment']
-            amendment_fields = set(amendment_model._fields.keys())
-            
-            for field_name, value in current_data.items():
-                if field_name in amendment_fields and field_name not in ['id', 'create_date', 'write_date', '__last_update']:
-                    # Handle Many2one fields - extract ID from tuple
-                    if isinstance(value, tuple) and len(value) == 2:
-                        amendment_data[field_name] = value[0]  # Extract ID from (id, name) tuple
-                    else:
-                        amendment_data[field_name] = value
+            if self.env.context.get('amendment_version_number'):
+                amendment_data['version_number'] = self.env.context['amendment_version_number']
+            amendment_data.update(amendment_model._prepare_snapshot_values(contract))
             
             # Create the amendment record
-            amendment = self.env['contract.management.amendment'].create(amendment_data)
+            amendment = amendment_model.create(amendment_data)
             
             # Mark previous amendments as not current
             contract.amendment_ids.write({'is_current': False})
             
             return amendment, next_version  # Return next version to update contract
 
+    def get_version_values(self, version=False):
+        """Return the tracked field values of a version of the contract.
+
+        :param version: version string (e.g. 'v3'); the current data is
+            returned when empty or equal to the contract version
+        :return: JSON-serializable dict of field values
+        """
+        self.ensure_one()
+        amendment_model = self.env['contract.management.amendment']
+        if not version or version == self.version:
+            return amendment_model._read_contract_values(self)
+        amendment = amendment_model.search([
+            ('contract_id', '=', self.id),
+            ('version', '=', version),
+        ], order='id desc', limit=1)
+        if not amendment:
+            raise UserError(
+                _('Version %s not found for contract %s.')
+                % (version, self.contract_number))
+        return amendment._get_full_values()[amendment.id]
+
     def action_create_amendment(self):
         """Open amendment creation wizard"""
         self.ensure_one()
@@ -984,6 +1050,72 @@ class Contract(models.Model):
     def action_archive(self):
         self.write({'state': 'archived'})
 
+    def _archive_batch(self, notes_by_contract):
+        """Archive contracts with one write per distinct notes value.
+
+        :param notes_by_contract: {contract_id: notes}
+        Documents are moved to cold storage instead of being deleted.
+        """
+        self._move_documents_to_cold_storage()
+        contracts_by_notes = {}
+        for contract in self:
+            notes = notes_by_contract.get(contract.id)
+            contracts_by_notes[notes] = contracts_by_notes.get(notes, self.browse()) | contract
+        for notes, contracts in contracts_by_notes.items():
+            contracts.with_context(skip_expiration_check=True).write({
+                'state': 'archived',
+                'notes': notes,
+                'contract_document_name': False,
+                'additional_document_name': False,
+            })
+
+    def _move_documents_to_cold_storage(self):
+        """Detach the contract and additional documents from their fields.
+
+        The attachments are kept on the contract (res_field cleared) under
+        their original file name, so archiving never deletes a document.
+        The document fields read as empty afterwards.
+        """
+        if not self:
+            return
+        self.flush_recordset(['contract_document_name', 'additional_document_name'])
+        self.env['ir.attachment'].flush_model()
+        self.env.cr.execute("""
+            UPDATE ir_attachment a
+            SET res_field = NULL,
+                name = COALESCE(
+                    CASE a.res_field
+                        WHEN 'contract_documents' THEN c.contract_document_name
+                        ELSE c.additional_document_name
+                    END, a.name),
+                description = %s
+            FROM contract_management c
+            WHERE a.res_model = 'contract.management'
+              AND a.res_id = c.id
+              AND a.res_field IN ('contract_documents', 'additional_documents')
+              AND c.id IN %s
+        """, (COLD_STORAGE_DESCRIPTION, tuple(self.ids)))
+        self.env['ir.attachment'].invalidate_model()
+        document_fields = ['contract_documents', 'additional_documents']
+        self.invalidate_recordset(document_fields)
+        self.modified(document_fields)
+
+    def action_view_cold_storage_documents(self):
+        """View documents moved to cold storage when archiving"""
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Archived Documents'),
+            'res_model': 'ir.attachment',
+            'view_mode': 'list,form',
+            'domain': [
+                ('res_model', '=', self._name),
+                ('res_id', '=', self.id),
+                ('description', '=', COLD_STORAGE_DESCRIPTION),
+            ],
+            'context': {'create': False},
+        }
+
     def action_fix_contract_numbers(self):
         """Fix contracts that have 'New' as contract number"""
         contracts_with_new = self.search([('contract_number', '=', 'New')])
@@ -3,7 +3,10 @@
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
 import json
-from datetime import datetime
+
+# A full snapshot is stored every FULL_SNAPSHOT_INTERVAL versions, the
+# versions in between only store the fields that changed.
+FULL_SNAPSHOT_INTERVAL = 10
 
 
 class ContractAmendment(models.Model):
@@ -12,145 +15,203 @@ class ContractAmendment(models.Model):
     _order = 'amendment_date desc, version desc'
     _rec_name = 'display_name'
 
+    # Fields kept as real columns on every amendment (list, search, group by)
+    _SNAPSHOT_HEADER_FIELDS = (
+        'name', 'contract_number', 'partner_id', 'contract_value',
+        'currency_id', 'state',
+    )
+
+    # Fields stored as field-level deltas in snapshot_data
+    _SNAPSHOT_DELTA_FIELDS = (
+        'contract_type_id', 'classification_ids', 'category_ids',
+        'department_ids', 'facility_project', 'contract_manager_id',
+        'effective_date', 'expiry_date', 'notice_period_days',
+        'contract_document_name', 'contract_document_size',
+        'additional_document_name', 'additional_document_size',
+        'document_count', 'compliance_notes', 'description', 'notes',
+    )
+
+    # Documents are tracked by attachment checksum and only copied onto the
+    # amendment (snapshot_<field>) when they changed
+    _SNAPSHOT_BINARY_FIELDS = ('contract_documents', 'additional_documents')
+
     # Amendment Information
     contract_id = fields.Many2one(
         'contract.management',
         string='Contract',
         required=True,
-        ondelete='cascade'
+        ondelete='cascade',
+        index=True
     )
-    
+
     version = fields.Char(
         string='Version',
         required=True,
         help='Version number (v1, v2, v3, etc.)'
     )
-    
+
     amendment_date = fields.Datetime(
         string='Amendment Date',
         default=fields.Datetime.now,
         required=True
     )
-    
+
     amended_by = fields.Many2one(
         'res.users',
         string='Amended By',
         default=lambda self: self.env.user,
         required=True
     )
-    
+
     amendment_reason = fields.Text(
         string='Amendment Reason',
         help='Reason for this amendment'
     )
-    
+
     amendment_type = fields.Selection([
         ('original', 'Original Contract'),
         ('amendment', 'Amendment'),
         ('correction', 'Correction')
     ], string='Amendment Type', default='amendment', required=True)
-    
+
     # Display Name
     display_name = fields.Char(
         string='Display Name',
         compute='_compute_display_name',
         store=True
     )
-    
+
     # Amendment Status
     is_current = fields.Boolean(
         string='Current Version',
         default=False,
         help='True if this is the current active version'
     )
-    
-    # COMPLETE CONTRACT STRUCTURE - Same as contract.management
+
+    # Snapshot Storage
+    is_full_snapshot = fields.Boolean(
+        string='Full Snapshot',
+        default=False,
+        help='True if snapshot_data holds every tracked field, False if it '
+             'only holds the fields changed since the previous version'
+    )
+
+    snapshot_sequence = fields.Integer(
+        string='Versions Since Full Snapshot',
+        default=0
+    )
+
+    snapshot_data = fields.Text(
+        string='Snapshot Data',
+        help='JSON field values of this version (full or delta)'
+    )
+
+    version_data = fields.Text(
+        string='Version Data',
+        compute='_compute_version_data',
+        store=True,
+        help='Serialized values (JSON) of every tracked field of this '
+             'version, rebuilt once from the snapshot chain'
+    )
+
+    change_data = fields.Text(
+        string='Changes',
+        compute='_compute_version_data',
+        store=True,
+        help='Structured change list (JSON) of this version against the '
+             'previous one'
+    )
+
+    snapshot_contract_documents = fields.Binary(
+        string='Stored Contract Document'
+    )
+
+    snapshot_additional_documents = fields.Binary(
+        string='Stored Additional Document'
+    )
+
+    # CONTRACT STRUCTURE - Same as contract.management
     # Basic Information
     name = fields.Char(
         string='Contract Title',
         required=True
     )
-    
+
     contract_number = fields.Char(
         string='Contract ID',
         required=True
     )
-    
+
     partner_id = fields.Many2one(
         'res.partner',
         string='Contractor/Vendor',
         required=True
     )
-    
+
     # Contract Classification
     contract_type_id = fields.Many2one(
         'contract.management.type',
         string='Type of Contract',
-        required=True,
-        default=lambda self: self.env.ref('contract_management.contract_type_contract', raise_if_not_found=False)
+        compute='_compute_version_values'
     )
-    
+
     classification_ids = fields.Many2many(
         'contract.management.classification',
-        'contract_amendment_classification_rel',
-        'amendment_id',
-        'classification_id',
-        string='Classifications'
+        string='Classifications',
+        compute='_compute_version_values'
     )
-    
+
     category_ids = fields.Many2many(
         'contract.management.category',
-        'contract_amendment_category_rel',
-        'amendment_id',
-        'category_id',
-        string='Categories'
+        string='Categories',
+        compute='_compute_version_values'
     )
-    
+
     department_ids = fields.Many2many(
         'contract.management.department',
-        'contract_amendment_department_rel',
-        'amendment_id',
-        'department_id',
-        string='Departments'
+        string='Departments',
+        compute='_compute_version_values'
     )
-    
+
     facility_project = fields.Char(
-        string='Facility/Project'
+        string='Facility/Project',
+        compute='_compute_version_values'
     )
 
     contract_manager_id = fields.Many2one(
         'res.users',
-        string='Contract Manager'
+        string='Contract Manager',
+        compute='_compute_version_values'
     )
-    
+
     # Dates and Value
     effective_date = fields.Date(
         string='Effective Date',
-        required=True
+        compute='_compute_version_values'
     )
-    
+
     expiry_date = fields.Date(
         string='Expiry Date',
-        required=True
+        compute='_compute_version_values'
     )
-    
+
     notice_period_days = fields.Integer(
         string='Expiration notice (Days)',
-        default=30
+        compute='_compute_version_values'
     )
-    
+
     contract_value = fields.Monetary(
         string='Contract Value',
         currency_field='currency_id'
     )
-    
+
     currency_id = fields.Many2one(
         'res.currency',
         string='Currency',
         domain=[('name', 'in', ['RWF', 'USD', 'EUR'])],
         help='Select the currency for the contract value (RWF, USD, or EUR)'
     )
-    
+
     # Status and Lifecycle
     state = fields.Selection([
         ('draft', 'Draft'),
@@ -160,67 +221,79 @@ class ContractAmendment(models.Model):
         ('terminated', 'Terminated'),
         ('archived', 'Archived')
     ], string='Status', default='draft')
-    
+
     # Version Control
     version_number = fields.Char(
         string='Version Number',
         default='1.0'
     )
-    
+
     # Document Management
     contract_documents = fields.Binary(
         string='Contract Document',
+        compute='_compute_version_values',
         help='Upload the main contract document'
     )
-    
+
     contract_document_name = fields.Char(
-        string='Contract Document Name'
+        string='Contract Document Name',
+        compute='_compute_version_values'
     )
-    
+
     contract_document_size = fields.Integer(
-        string='Contract Document Size (bytes)'
+        string='Contract Document Size (bytes)',
+        compute='_compute_version_values'
     )
-    
+
     # Additional Documents
     additional_documents = fields.Binary(
         string='Additional Documents',
+        compute='_compute_version_values',
         help='Upload additional supporting documents'
     )
-    
+
     additional_document_name = fields.Char(
-        string='Additional Document Name'
+        string='Additional Document Name',
+        compute='_compute_version_values'
     )
-    
+
     additional_document_size = fields.Integer(
-        string='Additional Document Size (bytes)'
+        string='Additional Document Size (bytes)',
+        compute='_compute_version_values'
     )
-    
+
     # Document Count for UI
     document_count = fields.Integer(
-        string='Document Count'
+        string='Document Count',
+        compute='_compute_version_values'
     )
-    
+
     # Compliance and Evidence
     compliance_notes = fields.Text(
-        string='Compliance Notes'
+        string='Compliance Notes',
+        compute='_compute_version_values'
     )
-    
+
     # Additional Information
     description = fields.Text(
-        string='Description'
+        string='Description',
+        compute='_compute_version_values'
     )
-    
+
     notes = fields.Text(
-        string='Notes'
+        string='Notes',
+        compute='_compute_version_values'
     )
-    
-    # Computed Fields
+
+    # Computed Fields (as of the amendment date)
     days_to_expiry = fields.Integer(
-        string='Days to Expiry'
+        string='Days to Expiry',
+        compute='_compute_version_values'
     )
-    
+
     is_expiring_soon = fields.Boolean(
-        string='Expiring Soon'
+        string='Expiring Soon',
+        compute='_compute_version_values'
     )
 
     @api.depends('contract_id', 'version', 'amendment_date')
@@ -228,10 +301,332 @@ class ContractAmendment(models.Model):
         for amendment in self:
             amendment.display_name = f"{amendment.contract_number} - {amendment.version} ({amendment.amendment_date.strftime('%Y-%m-%d %H:%M')})"
 
+    @api.depends('snapshot_data', 'is_full_snapshot', 'amendment_date', 'state')
+    def _compute_version_values(self):
+        """Rebuild the contract data of each version from its snapshot chain"""
+        versions = self._get_version_values()
+        for amendment in self:
+            values = versions.get(amendment.id, {})
+            for field_name in self._SNAPSHOT_DELTA_FIELDS:
+                amendment[field_name] = self._deserialize_snapshot_value(
+                    field_name, values.get(field_name))
+            for field_name in self._SNAPSHOT_BINARY_FIELDS:
+                source_id = (values.get(field_name) or {}).get('source_id')
+                amendment[field_name] = (
+                    self.browse(source_id)['snapshot_%s' % field_name]
+                    if source_id else False)
+            expiry_date = amendment.expiry_date
+            if expiry_date and amendment.amendment_date:
+                days = (expiry_date - amendment.amendment_date.date()).days
+            else:
+                days = 0
+            amendment.days_to_expiry = days
+            amendment.is_expiring_soon = (
+                amendment.state == 'active' and bool(expiry_date) and 0 <= days <= 30)
+
+    @api.depends('contract_id', 'snapshot_data', 'is_full_snapshot',
+                 *_SNAPSHOT_HEADER_FIELDS)
+    def _compute_version_data(self):
+        """Store the full values and the change list of each version.
+
+        Later versions of the chain are recomputed by write() and unlink()
+        when an earlier link changes.
+        """
+        amendments = self.filtered('id')
+        previous = {
+            amendment.id: self.search([
+                ('contract_id', '=', amendment.contract_id.id),
+                ('id', '<', amendment.id),
+            ], order='id desc', limit=1)
+            for amendment in amendments
+        }
+        values = (amendments | self.browse().union(*previous.values()))._build_full_values()
+        for amendment in self:
+            if not amendment.id:
+                amendment.version_data = amendment.change_data = False
+                continue
+            own = values[amendment.id]
+            old = values.get(previous[amendment.id].id, {})
+            amendment.version_data = json.dumps(own)
+            amendment.change_data = json.dumps(
+                self._diff_values(old, own, changed_only=False, with_display=False))
+
+    # ------------------------------------------------------------------
+    # Snapshot API
+    # ------------------------------------------------------------------
+
+    @api.model
+    def _get_snapshot_fields(self):
+        """All contract fields tracked by amendments"""
+        return (list(self._SNAPSHOT_HEADER_FIELDS)
+                + list(self._SNAPSHOT_DELTA_FIELDS)
+                + list(self._SNAPSHOT_BINARY_FIELDS))
+
+    @api.model
+    def _serialize_field_value(self, record, field_name):
+        """Return a JSON-serializable value of ``record[field_name]``"""
+        field = record._fields[field_name]
+        value = record[field_name]
+        if field.type == 'many2one':
+            return value.id or False
+        if field.type in ('many2many', 'one2many'):
+            return sorted(value.ids)
+        if field.type == 'date':
+            return fields.Date.to_string(value) if value else False
+        if field.type == 'datetime':
+            return fields.Datetime.to_string(value) if value else False
+        return value
+
+    @api.model
+    def _deserialize_snapshot_value(self, field_name, value):
+        """Convert a serialized snapshot value back to a field value"""
+        field = self._fields[field_name]
+        if field.type in ('many2one', 'many2many', 'one2many'):
+            return self.env[field.comodel_name].browse(value or [])
+        if field.type == 'date':
+            return fields.Date.to_date(value) if value else False
+        return value if value is not None else False
+
+    @api.model
+    def _get_document_checksums(self, model_name, res_ids, field_names):
+        """Return {(res_id, field_name): checksum} from ir_attachment"""
+        if not res_ids:
+            return {}
+        self.env['ir.attachment'].flush_model(['res_model', 'res_field', 'res_id', 'checksum'])
+        self.env.cr.execute("""
+            SELECT res_id, res_field, checksum
+            FROM ir_attachment
+            WHERE res_model = %s AND res_id IN %s AND res_field IN %s
+        """, (model_name, tuple(res_ids), tuple(field_names)))
+        return {(res_id, res_field): checksum
+                for res_id, res_field, checksum in self.env.cr.fetchall()}
+
+    @api.model
+    def _read_contract_values(self, contract):
+        """Serialized values of the tracked fields of a contract.
+
+        Documents are represented by their checksum, their content is not
+        loaded.
+        """
+        values = {
+            field_name: self._serialize_field_value(contract, field_name)
+            for field_name in self._SNAPSHOT_HEADER_FIELDS + self._SNAPSHOT_DELTA_FIELDS
+        }
+        checksums = self._get_document_checksums(
+            contract._name, contract.ids, self._SNAPSHOT_BINARY_FIELDS)
+        for field_name in self._SNAPSHOT_BINARY_FIELDS:
+            values[field_name] = {
+                'checksum': checksums.get((contract.id, field_name), False),
+                'source_id': False,
+            }
+        return values
+
+    def _get_version_values(self):
+        """Reconstruct the serialized field values of each amendment.
+
+        Returns {amendment_id: values} where values hold the delta fields
+        and the document references ({'checksum', 'source_id'}). Each chain
+        is read once per contract, starting from the closest full snapshot.
+        """
+        result = {}
+        amendments = self.filtered('id')
+        for contract, contract_amendments in amendments.grouped('contract_id').items():
+            wanted = set(contract_amendments.ids)
+            start = self.search([
+                ('contract_id', '=', contract.id),
+                ('id', '<=', min(wanted)),
+                ('is_full_snapshot', '=', True),
+            ], order='id desc', limit=1)
+            chain = self.search([
+                ('contract_id', '=', contract.id),
+                ('id', '>=', start.id or 0),
+                ('id', '<=', max(wanted)),
+            ], order='id asc')
+            values = {}
+            for link in chain:
+                if link.is_full_snapshot:
+                    values = {}
+                data = json.loads(link.snapshot_data or '{}')
+                for field_name, value in data.items():
+                    if field_name in self._SNAPSHOT_BINARY_FIELDS:
+                        values[field_name] = {
+                            'checksum': value,
+                            'source_id': link.id if value else False,
+                        }
+                    elif field_name in self._SNAPSHOT_DELTA_FIELDS:
+                        values[field_name] = value
+                if link.id in wanted:
+                    result[link.id] = dict(values)
+        return result
+
+    def _get_full_values(self):
+        """Serialized values of every tracked field of each amendment, read
+        from the stored version data"""
+        result = {
+            amendment.id: json.loads(amendment.version_data)
+            for amendment in self if amendment.version_data
+        }
+        missing = self.filtered(lambda amendment: amendment.id not in result)
+        if missing:
+            result.update(missing._build_full_values())
+        return result
+
+    def _build_full_values(self):
+        """Rebuild the serialized values of every tracked field of each
+        amendment from its snapshot chain"""
+        versions = self._get_version_values()
+        result = {}
+        for amendment in self:
+            values = dict(versions.get(amendment.id, {}))
+            for field_name in self._SNAPSHOT_HEADER_FIELDS:
+                values[field_name] = self._serialize_field_value(amendment, field_name)
+            result[amendment.id] = values
+        return result
+
+    @api.model
+    def _prepare_snapshot_values(self, contract):
+        """Values of a new amendment snapshotting ``contract``.
+
+        Only the fields changed since the previous amendment are stored,
+        except every FULL_SNAPSHOT_INTERVAL versions where a full snapshot
+        is written.
+        """
+        current = self._read_contract_values(contract)
+        previous = self.search(
+            [('contract_id', '=', contract.id)], order='id desc', limit=1)
+        is_full = (not previous
+                   or previous.snapshot_sequence + 1 >= FULL_SNAPSHOT_INTERVAL)
+        previous_values = {} if is_full else previous._get_version_values().get(previous.id, {})
+
+        snapshot = {}
+        vals = {
+            'is_full_snapshot': is_full,
+            'snapshot_sequence': 0 if is_full else previous.snapshot_sequence + 1,
+        }
+        for field_name in self._SNAPSHOT_DELTA_FIELDS:
+            if is_full or previous_values.get(field_name) != current[field_name]:
+                snapshot[field_name] = current[field_name]
+        for field_name in self._SNAPSHOT_BINARY_FIELDS:
+            checksum = current[field_name]['checksum']
+            previous_checksum = (previous_values.get(field_name) or {}).get('checksum', False)
+            if is_full or checksum != previous_checksum:
+                snapshot[field_name] = checksum
+                if checksum:
+                    # Same checksum means the filestore content is shared
+                    vals['snapshot_%s' % field_name] = contract[field_name]
+        for field_name in self._SNAPSHOT_HEADER_FIELDS:
+            vals[field_name] = current[field_name]
+        vals['snapshot_data'] = json.dumps(snapshot)
+        return vals
+
+    @api.model
+    def _format_snapshot_value(self, field_name, value):
+        """Human readable value of a serialized snapshot value"""
+        field = self._fields[field_name]
+        if field.type == 'binary':
+            return _('Document') if (value or {}).get('checksum') else ''
+        if value in (False, None, []):
+            return ''
+        if field.type in ('many2one', 'many2many'):
+            records = self.env[field.comodel_name].browse(value).exists()
+            return ', '.join(records.mapped('display_name'))
+        if field.type == 'selection':
+            return dict(field._description_selection(self.env)).get(value, value)
+        return str(value)
+
+    @api.model
+    def _get_diff_fields(self):
+        """Tracked business fields compared by the diff engine.
+
+        Taken from the field metadata of the contract: every snapshot field
+        that is edited by users, derived (computed) values are left out.
+        """
+        contract_fields = self.env['contract.management']._fields
+        return [
+            field_name for field_name in self._get_snapshot_fields()
+            if field_name in contract_fields and not contract_fields[field_name].compute
+        ]
+
+    @api.model
+    def _diff_values(self, old, new, changed_only=True, with_display=True):
+        """Structured diff of two sets of serialized values.
+
+        Documents are compared on their checksum, their content is never
+        loaded.
+
+        :param with_display: add the display values, left out of the stored
+            change lists since they follow the names of related records
+        :return: list of dicts with the keys field, label, type, changed,
+            old, new, old_display and new_display
+        """
+        diff = []
+        for field_name in self._get_diff_fields():
+            field = self._fields[field_name]
+            old_value = old.get(field_name, False)
+            new_value = new.get(field_name, False)
+            if field.type == 'binary':
+                changed = ((old_value or {}).get('checksum', False)
+                           != (new_value or {}).get('checksum', False))
+            else:
+                changed = old_value != new_value
+            if changed_only and not changed:
+                continue
+            diff.append({
+                'field': field_name,
+                'label': field._description_string(self.env),
+                'type': field.type,
+                'changed': changed,
+                'old': old_value,
+                'new': new_value,
+            })
+        return self._add_diff_display(diff) if with_display else diff
+
+    @api.model
+    def _add_diff_display(self, diff):
+        """Add the current display values to a change list"""
+        for change in diff:
+            change['old_display'] = self._format_snapshot_value(change['field'], change['old'])
+            change['new_display'] = self._format_snapshot_value(change['field'], change['new'])
+        return diff
+
+    def get_version_diff(self, compare_to=False, changed_only=True):
+        """Structured diff between this version and another one.
+
+        :param compare_to: amendment id to compare with, ``'previous'`` for
+            the stored changes against the previous version, or False to
+            compare with the current contract data
+        :param changed_only: only return the fields that differ
+        :return: see ``_diff_values``
+        """
+        self.ensure_one()
+        if compare_to == 'previous':
+            diff = self._add_diff_display(json.loads(self.change_data or '[]'))
+            return [change for change in diff if change['changed']] if changed_only else diff
+        if not compare_to:
+            diff = self._get_current_comparison()
+            return [change for change in diff if change['changed']] if changed_only else diff
+        other = self.browse(compare_to)
+        return self._diff_values(
+            self._get_full_values()[self.id], other._get_full_values()[other.id],
+            changed_only=changed_only)
+
+    def _get_current_comparison(self):
+        """Full change list against the current contract data.
+
+        The version side is read from the stored version data; the live
+        contract side is read on each call, its display values follow
+        related records that the contract write date does not track.
+        """
+        self.ensure_one()
+        return self._diff_values(
+            self._get_full_values()[self.id],
+            self._read_contract_values(self.contract_id),
+            changed_only=False)
+
     def action_view_contract_data(self):
         """View the contract data for this amendment"""
         self.ensure_one()
-        
+
         return {
             'type': 'ir.actions.act_window',
             'name': f'Contract Data - {self.version}',
@@ -246,18 +641,14 @@ class ContractAmendment(models.Model):
     def action_compare_with_current(self):
         """Compare this amendment with current contract"""
         self.ensure_one()
-        
-        # Get current contract data
-        current_data = self.contract_id.read()[0]
-        
-        # Create comparison wizard
+
+        # Create comparison wizard from the structured diff
         comparison_wizard = self.env['contract.amendment.comparison'].create({
             'contract_id': self.contract_id.id,
             'amendment_id': self.id,
-            'current_data': json.dumps(current_data),
-            'amendment_data': json.dumps(self.read()[0])
+            'diff_data': json.dumps(self._get_current_comparison()),
         })
-        
+
         return {
             'type': 'ir.actions.act_window',
             'name': f'Compare {self.version} with Current',
@@ -270,24 +661,33 @@ class ContractAmendment(models.Model):
     def action_restore_version(self):
         """Restore this version as current contract"""
         self.ensure_one()
-        
+
         # Create new amendment for current data before restoring
         self.contract_id._create_amendment_record('correction', 'Restoring to previous version')
-        
-        # Prepare data for restoration (exclude amendment-specific fields)
-        amendment_data = self.read()[0]
-        exclude_fields = ['id', 'contract_id', 'version', 'amendment_date', 'amended_by', 
-                         'amendment_reason', 'amendment_type', 'display_name', 'is_current',
-                         'create_date', 'write_date', '__last_update']
-        
+
+        # Prepare data for restoration from the reconstructed version
+        contract = self.contract_id
+        current = self._read_contract_values(contract)
+        derived_fields = ('contract_document_size', 'additional_document_size',
+                          'document_count')
         update_data = {}
-        for field_name, value in amendment_data.items():
-            if field_name not in exclude_fields and field_name in self.contract_id._fields:
+        for field_name, value in self._get_full_values()[self.id].items():
+            field = self._fields[field_name]
+            if field_name in derived_fields or field_name not in contract._fields:
+                continue
+            if field.type == 'binary':
+                if value.get('checksum') != current[field_name]['checksum']:
+                    source = self.browse(value.get('source_id'))
+                    update_data[field_name] = (
+                        source['snapshot_%s' % field_name] if source else False)
+            elif field.type == 'many2many':
+                update_data[field_name] = [(6, 0, value or [])]
+            else:
                 update_data[field_name] = value
-        
+
         # Update contract with restored data
-        self.contract_id.write(update_data)
-        
+        contract.write(update_data)
+
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
@@ -298,12 +698,38 @@ class ContractAmendment(models.Model):
             }
         }
 
+    def _get_later_versions(self):
+        """Amendments built on top of these ones in their snapshot chain"""
+        if not self.ids:
+            return self.browse()
+        return self.search([
+            ('contract_id', 'in', self.contract_id.ids),
+            ('id', '>', min(self.ids)),
+        ]) - self
+
+    def _recompute_later_versions(self, later):
+        for field_name in ('version_data', 'change_data'):
+            self.env.add_to_compute(self._fields[field_name], later)
+
+    def write(self, vals):
+        result = super().write(vals)
+        if {'contract_id', 'snapshot_data', 'is_full_snapshot',
+                *self._SNAPSHOT_HEADER_FIELDS}.intersection(vals):
+            self._recompute_later_versions(self._get_later_versions())
+        return result
+
+    def unlink(self):
+        later = self._get_later_versions()
+        result = super().unlink()
+        self._recompute_later_versions(later.exists())
+        return result
+
     @api.model
     def create(self, vals_list):
         """Override create to validate contract state"""
         if isinstance(vals_list, dict):
             vals_list = [vals_list]
-        
+
         for vals in vals_list:
             if 'contract_id' in vals:
                 contract = self.env['contract.management'].browse(
@@ -312,16 +738,16 @@ class ContractAmendment(models.Model):
                     raise UserError(
                         _('Cannot add amendments to a contract in draft '
                           'state. Please activate the contract first.'))
-        
+
         amendments = super().create(vals_list)
-        
+
         # Double check contract state after creation
         for amendment in amendments:
             if amendment.contract_id.state == 'draft':
                 raise UserError(
                     _('Cannot add amendments to a contract in draft state. '
                       'Please activate the contract first.'))
-        
+
         return amendments
 
 
@@ -334,58 +760,31 @@ class ContractAmendmentComparison(models.TransientModel):
         string='Contract',
         required=True
     )
-    
+
     amendment_id = fields.Many2one(
         'contract.management.amendment',
         string='Amendment',
         required=True
     )
-    
-    current_data = fields.Text(
-        string='Current Data',
-        readonly=True
-    )
-    
-    amendment_data = fields.Text(
-        string='Amendment Data',
-        readonly=True
+
+    diff_data = fields.Text(
+        string='Diff Data',
+        readonly=True,
+        help='Structured diff (JSON) returned by get_version_diff'
     )
-    
+
     comparison_result = fields.Html(
         string='Comparison Result',
         compute='_compute_comparison_result'
     )
 
-    @api.depends('current_data', 'amendment_data')
+    @api.depends('diff_data')
     def _compute_comparison_result(self):
         for record in self:
-            if not record.current_data or not record.amendment_data:
+            if not record.diff_data:
                 record.comparison_result = '<p>No data available for comparison.</p>'
-                return
-            
-            try:
-                current = json.loads(record.current_data)
-                amendment = json.loads(record.amendment_data)
-                
-                html = '<table class="table table-bordered"><thead><tr><th>Field</th><th>Current Value</th><th>Amendment Value</th><th>Status</th></tr></thead><tbody>'
-                
-                all_fields = set(current.keys()) | set(amendment.keys())
-                
-                for field in sorted(all_fields):
-                    current_val = current.get(field, 'N/A')
-                    amendment_val = amendment.get(field, 'N/A')
-                    
-                    if current_val != amendment_val:
-                        status = '<span class="badge badge-warning">Changed</span>'
-                        current_val = f'<span style="color: red;">{current_val}</span>'
-                        amendment_val = f'<span style="color: green;">{amendment_val}</span>'
-                    else:
-                        status = '<span class="badge badge-success">Same</span>'
-                    
-                    html += f'<tr><td>{field}</td><td>{current_val}</td><td>{amendment_val}</td><td>{status}</td></tr>'
-                
-                html += '</tbody></table>'
-                record.comparison_result = html
-                
-            except Exception as e:
-                record.comparison_result = f'<p>Error comparing data: {str(e)}</p>'
+                continue
+            record.comparison_result = self.env['ir.qweb']._render(
+                'contract_management.amendment_comparison_table',
+                {'changes': json.loads(record.diff_data)},
+            )
@@ -2,6 +2,7 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
+import base64
 
 
 class ContractAmendmentWizard(models.TransientModel):
@@ -142,6 +143,12 @@ class ContractAmendmentWizard(models.TransientModel):
         string='Notes'
     )
 
+    change_preview = fields.Html(
+        string='Changes',
+        compute='_compute_change_preview',
+        help='Fields that will change on the contract'
+    )
+
     @api.model
     def default_get(self, fields_list):
         """Load current contract data into wizard"""
@@ -150,21 +157,64 @@ class ContractAmendmentWizard(models.TransientModel):
         if self.env.context.get('active_model') == 'contract.management' and self.env.context.get('active_id'):
             contract = self.env['contract.management'].browse(self.env.context['active_id'])
             
-            # Load all contract fields into wizard
-            contract_data = contract.read()[0]
-            
-            for field_name, value in contract_data.items():
-                if field_name in fields_list and field_name not in ['id', 'create_date', 'write_date', '__last_update']:
-                    field = self._fields.get(field_name)
-                    if field and field.type == 'many2many' and isinstance(value, list):
-                        res[field_name] = [(6, 0, value)]
-                    else:
-                        res[field_name] = value
+            # Load only the wizard fields, without the expiration check of read()
+            for field_name in fields_list:
+                field = self._fields.get(field_name)
+                if (field_name in ('contract_id', 'amendment_reason') or not field
+                        or field.compute or field_name not in contract._fields):
+                    continue
+                res[field_name] = contract._fields[field_name].convert_to_write(
+                    contract[field_name], contract)
             
             res['contract_id'] = contract.id
         
         return res
 
+    def _get_wizard_values(self):
+        """Serialized values of the wizard, in the format of the amendment
+        snapshots; documents are represented by their checksum"""
+        self.ensure_one()
+        amendment_model = self.env['contract.management.amendment']
+        attachment_model = self.env['ir.attachment']
+        values = {}
+        for field_name in amendment_model._get_diff_fields():
+            if field_name not in self._fields:
+                continue
+            if self._fields[field_name].type == 'binary':
+                content = self[field_name]
+                values[field_name] = {
+                    'checksum': attachment_model._compute_checksum(
+                        base64.b64decode(content)) if content else False,
+                    'source_id': False,
+                }
+            else:
+                values[field_name] = amendment_model._serialize_field_value(self, field_name)
+        return values
+
+    def _get_changes(self):
+        """Changed fields between the contract and the wizard"""
+        self.ensure_one()
+        if not self.contract_id:
+            return []
+        amendment_model = self.env['contract.management.amendment']
+        new = self._get_wizard_values()
+        old = amendment_model._read_contract_values(self.contract_id)
+        # Fields the wizard does not edit keep their contract value
+        return amendment_model._diff_values(old, dict(old, **new))
+
+    @api.depends('contract_id', 'name', 'partner_id', 'contract_type_id',
+                 'classification_ids', 'category_ids', 'department_ids',
+                 'facility_project', 'contract_manager_id', 'effective_date',
+                 'expiry_date', 'notice_period_days', 'contract_value',
+                 'currency_id', 'contract_documents', 'contract_document_name',
+                 'additional_documents', 'additional_document_name',
+                 'compliance_notes', 'description', 'notes')
+    def _compute_change_preview(self):
+        for wizard in self:
+            changes = wizard._get_changes()
+            wizard.change_preview = self.env['ir.qweb']._render(
+                'contract_management.amendment_change_preview', {'changes': changes},
+            ) if changes else '<p>No changes yet.</p>'
 
     def _create_amendment(self):
         """Internal method to create amendment and update contract"""
@@ -173,27 +223,20 @@ class ContractAmendmentWizard(models.TransientModel):
         if not self.amendment_reason:
             raise UserError(_('Please provide a reason for this amendment.'))
         
-        # Prepare update data - only copy fields that exist in contract model
-        contract_fields = set(self.contract_id._fields.keys())
-        
+        # Only write the fields that changed; unchanged documents are not
+        # uploaded again
         update_data = {}
-        for field_name, value in self.read()[0].items():
-            if (field_name in contract_fields and 
-                field_name not in ['id', 'contract_id', 'amendment_reason', 'create_date', 'write_date', '__last_update']):
-                # Handle Many2one fields - extract ID from tuple
-                field = self._fields.get(field_name)
-                if isinstance(value, tuple) and len(value) == 2 and field.type == 'many2one':
-                    update_data[field_name] = value[0]  # Extract ID from (id, name)
-                elif isinstance(value, list) and field and field.type == 'many2many':
-                    update_data[field_name] = [(6, 0, value)]
-                else:
-                    update_data[field_name] = value
+        for change in self._get_changes():
+            field_name = change['field']
+            update_data[field_name] = self._fields[field_name].convert_to_write(
+                self[field_name], self)
         
         # Update contract with new data, pass context to trigger amendment creation
         self.contract_id.with_context(
             create_amendment=True,
             amendment_type='amendment',
-            amendment_reason=self.amendment_reason
+            amendment_reason=self.amendment_reason,
+            amendment_version_number=self.version_number
         ).write(update_data)
 
     def action_create_amendment(self):
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Number of contracts archived per cron iteration
+ARCHIVE_CHUNK_SIZE = 200
+
+
+class ContractArchiveJob(models.Model):
+    """
+    Background archiving of large contract selections.
+
+    The job is processed by the archive cron in chunks; every chunk is
+    committed and the processed count acts as checkpoint, so an interrupted
+    run resumes where it stopped.
+    """
+    _name = 'contract.archive.job'
+    _description = 'Contract Archive Job'
+    _order = 'create_date desc, id desc'
+
+    name = fields.Char(
+        string='Name',
+        required=True
+    )
+
+    contract_ids = fields.Many2many(
+        'contract.management',
+        'contract_archive_job_rel',
+        'job_id',
+        'contract_id',
+        string='Contracts to Archive'
+    )
+
+    notes = fields.Text(
+        string='Archive Notes'
+    )
+
+    user_id = fields.Many2one(
+        'res.users',
+        string='Requested By',
+        required=True,
+        readonly=True,
+        default=lambda self: self.env.user
+    )
+
+    state = fields.Selection([
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed')
+    ], string='Status', default='queued', required=True)
+
+    total_count = fields.Integer(
+        string='Contracts',
+        compute='_compute_progress'
+    )
+
+    processed_count = fields.Integer(
+        string='Processed',
+        default=0
+    )
+
+    progress = fields.Float(
+        string='Progress',
+        compute='_compute_progress'
+    )
+
+    error_message = fields.Text(
+        string='Error'
+    )
+
+    @api.depends('contract_ids', 'processed_count')
+    def _compute_progress(self):
+        for job in self:
+            job.total_count = len(job.contract_ids)
+            job.progress = (
+                100.0 * job.processed_count / job.total_count
+                if job.total_count else 100.0)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        # The cron archives with the rights of the requester: it is always
+        # the creating user, and the contracts must be archivable by them
+        for vals in vals_list:
+            vals['user_id'] = self.env.uid
+        jobs = super().create(vals_list)
+        jobs.contract_ids.check_access('write')
+        return jobs
+
+    def write(self, vals):
+        vals.pop('user_id', None)
+        result = super().write(vals)
+        if 'contract_ids' in vals:
+            self.contract_ids.check_access('write')
+            for job in self:
+                job.contract_ids.with_user(job.user_id).check_access('write')
+        return result
+
+    def _schedule(self):
+        """Ask the archive cron to run as soon as possible"""
+        cron = self.env.ref(
+            'contract_management.ir_cron_process_archive_jobs',
+            raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+
+    def _next_chunk(self):
+        self.ensure_one()
+        contracts = self.contract_ids.sorted('id')
+        return contracts[self.processed_count:self.processed_count + ARCHIVE_CHUNK_SIZE]
+
+    @api.model
+    def cron_process_archive_jobs(self):
+        """Cron job method archiving the next chunk of the oldest open job"""
+        job = self.search([('state', 'in', ('queued', 'running'))], order='id', limit=1)
+        if not job:
+            return
+        job.state = 'running'
+        chunk = job._next_chunk()
+        try:
+            with self.env.cr.savepoint():
+                chunk.with_user(job.user_id)._archive_batch(
+                    {contract.id: job.notes for contract in chunk})
+        except Exception as e:
+            _logger.error('Archive job %s failed: %s', job.name, str(e), exc_info=True)
+            job.write({'state': 'failed', 'error_message': str(e)})
+            job._notify_user(_('Archiving failed: %s') % str(e), 'danger')
+            return
+
+        job.processed_count += len(chunk)
+        if job.processed_count >= job.total_count:
+            job.state = 'done'
+            job._notify_user(
+                _('%s contracts have been archived.') % job.total_count, 'success')
+
+        open_jobs = self.search([('state', 'in', ('queued', 'running'))])
+        remaining = sum(j.total_count - j.processed_count for j in open_jobs)
+        self.env['ir.cron']._notify_progress(done=len(chunk), remaining=remaining)
+
+    def _notify_user(self, message, notification_type):
+        self.ensure_one()
+        self.env['bus.bus']._sendone(self.user_id.partner_id, 'simple_notification', {
+            'title': self.name,
+            'message': message,
+            'type': notification_type,
+        })
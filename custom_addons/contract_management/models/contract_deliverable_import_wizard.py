@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+import base64
+import csv
+import io
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+REQUIRED_COLUMNS = {'name', 'deliverable_date'}
+
+
+class ContractDeliverableImportWizard(models.TransientModel):
+    _name = 'contract.deliverable.import.wizard'
+    _description = 'Contract Deliverable Import Wizard'
+
+    contract_id = fields.Many2one(
+        'contract.management',
+        string='Contract',
+        help='Contract used for rows without a contract number'
+    )
+
+    import_file = fields.Binary(
+        string='File',
+        required=True,
+        help='CSV or XLSX file with the columns contract_number, name, '
+             'deliverable_date, issue_date, payment_amount, currency, '
+             'description and alert_days_before. Only name and '
+             'deliverable_date are required.'
+    )
+
+    import_filename = fields.Char(
+        string='File Name'
+    )
+
+    error_message = fields.Text(
+        string='Errors',
+        readonly=True
+    )
+
+    @api.model
+    def default_get(self, fields_list):
+        """Use the active contract as default contract"""
+        res = super().default_get(fields_list)
+        if (self.env.context.get('active_model') == 'contract.management' and
+                self.env.context.get('active_id')):
+            res['contract_id'] = self.env.context['active_id']
+        return res
+
+    def _read_import_file(self):
+        """Return the file rows as dicts keyed by column name"""
+        self.ensure_one()
+        content = base64.b64decode(self.import_file)
+        filename = (self.import_filename or '').lower()
+        if filename.endswith('.xlsx'):
+            if not openpyxl:
+                raise UserError(_('Reading XLSX files requires the openpyxl library.'))
+            workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+            lines = workbook.active.iter_rows(values_only=True)
+        elif filename.endswith('.csv'):
+            lines = csv.reader(io.StringIO(content.decode('utf-8-sig')))
+        else:
+            raise UserError(_('Please upload a CSV or XLSX file.'))
+
+        header = next(lines, None)
+        if not header:
+            raise UserError(_('The file is empty.'))
+        columns = [str(column or '').strip().lower().replace(' ', '_') for column in header]
+        missing = REQUIRED_COLUMNS - set(columns)
+        if missing:
+            raise UserError(_('Missing columns: %s') % ', '.join(sorted(missing)))
+
+        rows = []
+        for line_number, line in enumerate(lines, start=2):
+            if not any(value not in (None, '') for value in line):
+                continue
+            row = dict(zip(columns, line))
+            row['_line'] = line_number
+            rows.append(row)
+        return rows
+
+    def _reopen(self):
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+
+    def action_validate(self):
+        """Check the whole file and list every error"""
+        self.ensure_one()
+        rows = self._read_import_file()
+        vals_list, errors = self.env['contract.deliverable']._prepare_import_rows(
+            rows, default_contract=self.contract_id)
+        self.error_message = '\n'.join(errors) if errors else \
+            _('%s rows are valid and ready to import.') % len(vals_list)
+        return self._reopen()
+
+    def action_import(self):
+        """Import the deliverables of the file"""
+        self.ensure_one()
+        rows = self._read_import_file()
+        deliverables = self.env['contract.deliverable'].import_deliverables(
+            rows, default_contract=self.contract_id)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Deliverables Imported'),
+                'message': _('%s deliverables have been imported for %s contracts.')
+                           % (len(deliverables), len(deliverables.contract_id)),
+                'type': 'success',
+                'next': {'type': 'ir.actions.act_window_close'},
+            }
+        }
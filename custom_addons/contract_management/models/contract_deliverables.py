@@ -4,11 +4,14 @@ from odoo import models, fields, api, _
 from odoo.exceptions import UserError
 from datetime import date, datetime as dt
 
+# Number of deliverables inserted per create() call by the bulk import
+IMPORT_CHUNK_SIZE = 500
+
 
 class ContractDeliverable(models.Model):
     _name = 'contract.deliverable'
     _description = 'Contract Deliverable'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'contract.temporal.mixin']
     _order = 'issue_date desc, deliverable_date asc'
 
     # Basic Information
@@ -28,6 +31,7 @@ class ContractDeliverable(models.Model):
         string='Linked Contract',
         required=True,
         ondelete='cascade',
+        index=True,
         help='Reference to the parent contract'
     )
 
@@ -42,6 +46,7 @@ class ContractDeliverable(models.Model):
     deliverable_date = fields.Date(
         string='Due Date',
         required=True,
+        index=True,
         help='Deadline for deliverable completion'
     )
 
@@ -131,7 +136,8 @@ class ContractDeliverable(models.Model):
 
     days_until_due = fields.Integer(
         string='Days Until Due',
-        compute='_compute_days_until_due'
+        compute='_compute_days_until_due',
+        search='_search_days_until_due'
     )
 
     # Contract Information (for easy access)
@@ -214,6 +220,21 @@ class ContractDeliverable(models.Model):
             else:
                 deliverable.days_until_due = 0
 
+    def _search_days_until_due(self, operator, value):
+        """Search method for days_until_due computed field"""
+        return self._search_days_from_today('deliverable_date', operator, value)
+
+    def _refresh_temporal_states(self):
+        """Flag pending deliverables that became overdue since the last run"""
+        deliverables = self.search([
+            ('status', '=', 'pending'),
+            ('deliverable_date', '<', fields.Date.today()),
+            ('is_overdue', '=', False),
+        ])
+        if deliverables:
+            self.env.add_to_compute(self._fields['is_overdue'], deliverables)
+            deliverables.flush_recordset(['is_overdue'])
+
     # Action Methods
     def action_mark_completed(self):
         """Mark deliverable as completed"""
@@ -272,52 +293,44 @@ class ContractDeliverable(models.Model):
         }
 
     def _validate_deliverable_amounts(self, vals):
-        """Validate deliverable amounts stay within the contract value"""
-        for deliverable in self:
-            contract = deliverable.contract_id
-            if not contract:
-                continue
-            
-            # Get the payment amount from vals or existing deliverable
-            payment_amount = (
-                vals.get('payment_amount', deliverable.payment_amount) or 0)
-            
-            # Skip validation if payment_amount is zero or not set
-            if not payment_amount or payment_amount <= 0:
+        """Validate deliverable amounts stay within the contract value
+
+        Checks against the stored ``deliverable_total_amount`` of the
+        contract, so the cost does not depend on the number of sibling
+        deliverables.
+        """
+        for contract, deliverables in self.grouped('contract_id').items():
+            if not contract or not contract.contract_value:
                 continue
-            
-            # Validate individual deliverable amount doesn't exceed contract
-            # value
-            if contract.contract_value and payment_amount > contract.contract_value:
-                raise UserError(
-                    _('Deliverable amount (%.2f) cannot exceed the contract '
-                      'value (%.2f). Please adjust the amount.')
-                    % (payment_amount, contract.contract_value))
-            
-            # Validate total of all deliverable amounts doesn't exceed contract
-            # value
-            if contract.contract_value:
-                # Calculate sum of all deliverable amounts for this contract
-                all_deliverables = contract.deliverable_ids
-                
-                # Sum all deliverable amounts (excluding current deliverable if
-                # updating)
-                total_deliverable_amount = sum(
-                    d.payment_amount or 0
-                    for d in all_deliverables
-                    if d.id != deliverable.id
-                )
-                
-                # Add the new/updated deliverable amount
-                total_deliverable_amount += payment_amount
-                
-                # Check if total exceeds contract value
-                if total_deliverable_amount > contract.contract_value:
+
+            total_deliverable_amount = contract.deliverable_total_amount
+            has_amount = False
+            for deliverable in deliverables:
+                # Get the payment amount from vals or existing deliverable
+                payment_amount = (
+                    vals.get('payment_amount', deliverable.payment_amount) or 0)
+
+                # Validate individual deliverable amount doesn't exceed
+                # contract value
+                if payment_amount > contract.contract_value:
                     raise UserError(
-                        _('The total of all deliverable amounts (%.2f) cannot '
-                          'exceed the contract value (%.2f). Please adjust '
-                          'the amounts.')
-                        % (total_deliverable_amount, contract.contract_value))
+                        _('Deliverable amount (%.2f) cannot exceed the contract '
+                          'value (%.2f). Please adjust the amount.')
+                        % (payment_amount, contract.contract_value))
+
+                # Replace the current amount of the deliverable in the total
+                total_deliverable_amount += (
+                    payment_amount - (deliverable.payment_amount or 0))
+                has_amount = has_amount or payment_amount > 0
+
+            # Check if total exceeds contract value (skipped when no
+            # deliverable carries an amount)
+            if has_amount and total_deliverable_amount > contract.contract_value:
+                raise UserError(
+                    _('The total of all deliverable amounts (%.2f) cannot '
+                      'exceed the contract value (%.2f). Please adjust '
+                      'the amounts.')
+                    % (total_deliverable_amount, contract.contract_value))
 
     @api.model_create_multi
     def create(self, vals_list):
@@ -390,15 +403,9 @@ class ContractDeliverable(models.Model):
                     
                     # Track totals per contract for batch validation
                     if contract_id not in contracts_totals:
-                        # Get all existing deliverables for this contract
-                        existing_deliverables = contract.deliverable_ids
-                        total_existing = sum(
-                            d.payment_amount or 0
-                            for d in existing_deliverables
-                        )
                         contracts_totals[contract_id] = {
                             'contract': contract,
-                            'total_existing': total_existing,
+                            'total_existing': contract.deliverable_total_amount,
                             'total_new': 0
                         }
                     
@@ -421,17 +428,183 @@ class ContractDeliverable(models.Model):
                        total_existing))
         
         deliverables = super().create(vals_list)
-        
-        for deliverable in deliverables:
-            # Double check contract state after creation
-            if deliverable.contract_id.state == 'draft':
+        # Double check contract state and amounts after creation (in case
+        # payment_amount wasn't in vals)
+        deliverables._check_created_deliverables()
+        self.env['contract.search.index']._schedule_reindex(deliverables.contract_id.ids)
+        return deliverables
+
+    def _check_created_deliverables(self):
+        """Check the state and deliverable total of the contracts of newly
+        created deliverables, once per contract"""
+        for contract in self.contract_id:
+            if contract.state == 'draft':
                 raise UserError(
                     _('Cannot add deliverables to a contract in draft state. '
                       'Please activate the contract first.'))
-            # Validate amounts after creation (in case payment_amount wasn't
-            # in vals)
-            deliverable._validate_deliverable_amounts({})
-        
+            if contract.contract_value and \
+                    contract.deliverable_total_amount > contract.contract_value:
+                raise UserError(
+                    _('The total of all deliverable amounts (%.2f) cannot '
+                      'exceed the contract value (%.2f). Please adjust '
+                      'the amounts.')
+                    % (contract.deliverable_total_amount,
+                       contract.contract_value))
+
+    @api.model
+    def _create_validated(self, vals_list):
+        """Insert deliverables from rows validated by _prepare_import_rows
+
+        Calls the ORM create of the parent classes directly: the per-row
+        validation of create() is skipped, and so are the create()
+        overrides of modules extending contract.deliverable. The caller
+        runs _check_created_deliverables and schedules the search reindex
+        on the created deliverables.
+        """
+        return super(ContractDeliverable, self).create(vals_list)
+
+    @api.model
+    def _prepare_import_rows(self, rows, default_contract=False):
+        """Validate deliverable import rows in memory
+
+        :param rows: list of dicts with the keys ``contract_number``,
+            ``name``, ``deliverable_date``, ``issue_date``,
+            ``payment_amount``, ``currency``, ``description`` and
+            ``alert_days_before``. ``_line`` is used in error messages.
+        :param default_contract: contract used for rows without a
+            contract number
+        :return: tuple (vals_list, errors)
+        """
+        errors = []
+        numbers = {str(row.get('contract_number') or '').strip() for row in rows} - {''}
+        contracts = {
+            contract.contract_number: contract
+            for contract in self.env['contract.management'].search(
+                [('contract_number', 'in', list(numbers))])
+        }
+        codes = {str(row.get('currency') or '').strip().upper() for row in rows} - {''}
+        currencies = {
+            currency.name: currency
+            for currency in self.env['res.currency'].with_context(active_test=False).search(
+                [('name', 'in', list(codes))])
+        }
+
+        def to_date(value):
+            if isinstance(value, dt):
+                return value.date()
+            if isinstance(value, date):
+                return value
+            return fields.Date.to_date(str(value).strip()) if value else False
+
+        vals_list = []
+        new_totals = {}
+        for index, row in enumerate(rows):
+            line = row.get('_line') or index + 1
+            row_errors = []
+            number = str(row.get('contract_number') or '').strip()
+            contract = contracts.get(number) if number else default_contract
+            if not contract:
+                row_errors.append(_('unknown contract "%s"') % number if number
+                                  else _('missing contract number'))
+            elif contract.state == 'draft':
+                row_errors.append(_('contract %s is in draft state') % contract.contract_number)
+
+            name = str(row.get('name') or '').strip()
+            if not name:
+                row_errors.append(_('missing deliverable name'))
+
+            try:
+                deliverable_date = to_date(row.get('deliverable_date'))
+                issue_date = to_date(row.get('issue_date')) or fields.Date.today()
+            except (ValueError, TypeError):
+                deliverable_date = issue_date = False
+                row_errors.append(_('dates must use the YYYY-MM-DD format'))
+            else:
+                if not deliverable_date:
+                    row_errors.append(_('missing due date'))
+                elif deliverable_date < issue_date:
+                    row_errors.append(_('due date %s is before the issue date %s')
+                                      % (deliverable_date, issue_date))
+                elif contract and contract.effective_date and contract.expiry_date and (
+                        deliverable_date < contract.effective_date or
+                        deliverable_date > contract.expiry_date):
+                    row_errors.append(_('due date %s is outside the contract date range '
+                                        '(%s to %s)') % (deliverable_date,
+                                                         contract.effective_date,
+                                                         contract.expiry_date))
+
+            try:
+                payment_amount = float(row.get('payment_amount') or 0)
+            except (ValueError, TypeError):
+                payment_amount = 0
+                row_errors.append(_('invalid payment amount "%s"') % row.get('payment_amount'))
+            if payment_amount < 0:
+                row_errors.append(_('payment amount cannot be negative'))
+            elif contract and contract.contract_value and payment_amount > contract.contract_value:
+                row_errors.append(_('amount %.2f exceeds the contract value %.2f')
+                                  % (payment_amount, contract.contract_value))
+
+            code = str(row.get('currency') or '').strip().upper()
+            currency = currencies.get(code) if code else (contract and contract.currency_id)
+            if code and not currency:
+                row_errors.append(_('unknown currency "%s"') % code)
+
+            try:
+                alert_days_before = int(row.get('alert_days_before') or 30)
+            except (ValueError, TypeError):
+                alert_days_before = 30
+                row_errors.append(_('invalid alert days "%s"') % row.get('alert_days_before'))
+
+            if row_errors:
+                errors.append(_('Row %s: %s') % (line, '; '.join(row_errors)))
+                continue
+
+            new_totals[contract] = new_totals.get(contract, 0) + payment_amount
+            vals_list.append({
+                'contract_id': contract.id,
+                'name': name,
+                'description': row.get('description') or False,
+                'issue_date': issue_date,
+                'deliverable_date': deliverable_date,
+                'payment_amount': payment_amount,
+                'currency_id': currency.id if currency else False,
+                'alert_days_before': alert_days_before,
+            })
+
+        # One totals check per contract for the whole batch
+        for contract, new_total in new_totals.items():
+            total = contract.deliverable_total_amount + new_total
+            if new_total and contract.contract_value and total > contract.contract_value:
+                errors.append(
+                    _('Contract %s: the total of all deliverable amounts (%.2f) '
+                      'would exceed the contract value (%.2f). Current total: %.2f.')
+                    % (contract.contract_number, total, contract.contract_value,
+                       contract.deliverable_total_amount))
+        return vals_list, errors
+
+    @api.model
+    def import_deliverables(self, rows, default_contract=False, chunk_size=IMPORT_CHUNK_SIZE):
+        """Validate and create deliverables in bulk
+
+        All rows are validated first (contract state included) and every
+        error is reported at once. Valid batches are inserted in chunks; the
+        stored counters of the contracts are recomputed and checked once,
+        after the last chunk.
+        """
+        vals_list, errors = self._prepare_import_rows(rows, default_contract)
+        if errors:
+            raise UserError(_('The deliverables could not be imported:\n%s') % '\n'.join(errors))
+
+        Deliverable = self.with_context(
+            tracking_disable=True,
+            mail_create_nolog=True,
+        )
+        deliverables = self.browse()
+        for start in range(0, len(vals_list), chunk_size):
+            deliverables |= Deliverable._create_validated(vals_list[start:start + chunk_size])
+        deliverables._check_created_deliverables()
+        self.env['contract.search.index']._schedule_reindex(deliverables.contract_id.ids)
+        deliverables.contract_id.flush_recordset()
         return deliverables
 
     def write(self, vals):
@@ -478,8 +651,18 @@ class ContractDeliverable(models.Model):
         # Validate payment amount if it's being changed
         if 'payment_amount' in vals:
             self._validate_deliverable_amounts(vals)
-        
-        return super().write(vals)
+
+        search_index = self.env['contract.search.index']
+        if search_index._DELIVERABLE_SEARCH_FIELDS.intersection(vals):
+            search_index._schedule_reindex(self.contract_id.ids)
+        result = super().write(vals)
+        if 'contract_id' in vals:
+            search_index._schedule_reindex(self.contract_id.ids)
+        return result
+
+    def unlink(self):
+        self.env['contract.search.index']._schedule_reindex(self.contract_id.ids)
+        return super().unlink()
 
     def send_deliverable_expiration_notification(self, force_send=True):
         """Send email notification when deliverable is about to expire"""
@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.tools import html_escape
+from datetime import timedelta
+from collections import defaultdict
+import logging
+
+from psycopg2 import errors
+
+_logger = logging.getLogger(__name__)
+
+# Number of recipients whose digests are sent per chunk (one commit each)
+ALERT_CHUNK_SIZE = 50
+
+# Namespace of the transaction advisory locks spreading recipients over workers
+ALERT_LOCK_NAMESPACE = 51870
+
+# Day of the last due alert selection of a source
+ALERT_SELECTION_PARAM = 'contract_management.expiry_alert_selection_date.%s'
+
+# Worker crons that process chunks next to the scheduler
+ALERT_WORKER_CRONS = [
+    'contract_management.ir_cron_expiry_alert_worker_1',
+    'contract_management.ir_cron_expiry_alert_worker_2',
+]
+
+
+class ContractExpiryAlert(models.Model):
+    """
+    Persistent alert ledger.
+
+    One row per (record, alert window). The unique key makes alert
+    selection idempotent: running the scheduler twice in the same window
+    never queues a second email for the same record.
+    """
+    _name = 'contract.expiry.alert'
+    _description = 'Contract Expiry Alert'
+    _order = 'alert_date desc, id desc'
+    _rec_name = 'res_name'
+
+    source = fields.Selection(
+        selection='_selection_source',
+        string='Source',
+        required=True,
+        index=True
+    )
+
+    res_model = fields.Char(
+        string='Model',
+        required=True
+    )
+
+    res_id = fields.Integer(
+        string='Record ID',
+        required=True
+    )
+
+    res_name = fields.Char(
+        string='Record',
+        compute='_compute_res_name'
+    )
+
+    alert_date = fields.Date(
+        string='Alert Window',
+        required=True,
+        help='Day the alert belongs to. Reminders are daily, so a record '
+             'gets at most one alert per day.'
+    )
+
+    due_date = fields.Date(
+        string='Due/Expiry Date'
+    )
+
+    user_id = fields.Many2one(
+        'res.users',
+        string='Recipient',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed')
+    ], string='Status', default='pending', required=True, index=True)
+
+    mail_id = fields.Many2one(
+        'mail.mail',
+        string='Digest Email',
+        ondelete='set null'
+    )
+
+    _sql_constraints = [
+        ('alert_record_window_unique',
+         'unique(res_model, res_id, alert_date)',
+         'An alert already exists for this record in this window.'),
+    ]
+
+    @api.model
+    def _selection_source(self):
+        sources = self.env['contract.expiry.alert.scheduler']._get_alert_sources()
+        return [(code, source['label']) for code, source in sources.items()]
+
+    @api.depends('res_model', 'res_id')
+    def _compute_res_name(self):
+        for alert in self:
+            record = self.env[alert.res_model].browse(alert.res_id) \
+                if alert.res_model in self.env else False
+            alert.res_name = record.display_name if record and record.exists() else False
+
+    @api.autovacuum
+    def _gc_alert_ledger(self):
+        """Drop delivered alerts older than 90 days"""
+        limit_date = fields.Date.today() - timedelta(days=90)
+        self.search([
+            ('alert_date', '<', limit_date),
+            ('state', '=', 'sent'),
+        ]).unlink()
+
+
+class ContractExpiryAlertScheduler(models.Model):
+    """
+    Generic expiry alert scheduler for contracts, deliverables and
+    performance guaranties.
+
+    Each alert source is described in ``_get_alert_sources``. Other modules
+    can register new sources by extending that method.
+    """
+    _name = 'contract.expiry.alert.scheduler'
+    _description = 'Contract Expiry Alert Scheduler'
+    _auto = False  # This is a virtual model, no database table needed
+
+    @api.model
+    def _get_alert_sources(self):
+        """Return the registry of alert sources.
+
+        Every source describes how to select due records in SQL:
+
+        - ``model``/``table``: the source model and its table
+        - ``date_column``: the due/expiry date column
+        - ``lead_column``: column holding the number of days before the
+          date when daily alerts start (falls back to 30)
+        - ``recipient_column``: res.users column receiving the alert
+        - ``where``: extra SQL condition on the source table (alias ``r``)
+        - ``sent_values``: values written on the source records once their
+          alert has been queued
+        """
+        now = fields.Datetime.now()
+        return {
+            'contract': {
+                'label': _('Contract'),
+                'model': 'contract.management',
+                'table': 'contract_management',
+                'date_column': 'expiry_date',
+                'lead_column': 'notice_period_days',
+                'recipient_column': 'contract_manager_id',
+                'where': "r.state = 'active' AND r.send_recurring_reminders",
+                'sent_values': {
+                    'expiration_notification_sent': True,
+                    'last_notification_date': now,
+                },
+            },
+            'deliverable': {
+                'label': _('Deliverable'),
+                'model': 'contract.deliverable',
+                'table': 'contract_deliverable',
+                'date_column': 'deliverable_date',
+                'lead_column': 'alert_days_before',
+                'recipient_column': 'contract_manager_id',
+                'where': "r.status = 'pending'",
+                'sent_values': {
+                    'alert_sent': True,
+                    'last_alert_date': now,
+                },
+            },
+            'guaranty': {
+                'label': _('Performance Guaranty'),
+                'model': 'contract.performance.guaranty',
+                'table': 'contract_performance_guaranty',
+                'date_column': 'expiry_date',
+                'lead_column': 'alert_days_before',
+                'recipient_column': 'contract_manager_id',
+                'where': "r.status = 'active'",
+                'sent_values': {
+                    'alert_sent': True,
+                    'last_alert_date': now,
+                },
+            },
+        }
+
+    @api.model
+    def cron_dispatch_expiry_alerts(self, sources=None):
+        """
+        Cron job entry point: select due alerts for every registered source
+        and send one digest email per recipient.
+
+        Digests are sent one chunk of recipients per call. The cron commits
+        and calls again while recipients remain, and the worker crons are
+        triggered to take chunks in parallel. Pending alerts of the ledger
+        are the checkpoint: a killed run resumes with the recipients that
+        were not committed yet. Due alerts are selected on the first run of
+        the day only; the following runs just send the pending digests.
+        """
+        created = self._select_due_alerts_once(sources=sources)
+        if created:
+            _logger.info('Expiry alert scheduler: %s alerts selected', created)
+        remaining = self._count_pending_recipients(sources)
+        if remaining > ALERT_CHUNK_SIZE:
+            self._trigger_alert_workers()
+        result = self._process_alert_chunk(sources=sources)
+        result['selected'] = created
+        return result
+
+    @api.model
+    def cron_process_alert_chunks(self):
+        """Worker cron job method sending the next chunk of pending digests"""
+        return self._process_alert_chunk()
+
+    @api.model
+    def _trigger_alert_workers(self):
+        for xmlid in ALERT_WORKER_CRONS:
+            cron = self.env.ref(xmlid, raise_if_not_found=False)
+            if cron and cron.active:
+                cron._trigger()
+
+    @api.model
+    def _count_pending_recipients(self, sources=None):
+        query = "SELECT count(DISTINCT user_id) FROM contract_expiry_alert WHERE state = 'pending'"
+        params = []
+        if sources:
+            query += " AND source IN %s"
+            params.append(tuple(sources))
+        self.env['contract.expiry.alert'].flush_model(['state', 'source', 'user_id'])
+        self.env.cr.execute(query, params)
+        return self.env.cr.fetchone()[0]
+
+    @api.model
+    def _claim_alert_recipients(self, sources=None, limit=ALERT_CHUNK_SIZE):
+        """Lock the pending alerts of up to ``limit`` recipients that no
+        other worker is processing.
+
+        Advisory locks spread the recipients over the workers; the alert
+        rows themselves are claimed with ``FOR UPDATE SKIP LOCKED`` and only
+        kept while still pending, so a digest is never sent twice. Alerts
+        sent by a worker that committed after this transaction started
+        cannot be locked under repeatable read: nothing is claimed then and
+        the workers are triggered again with a fresh snapshot.
+
+        :return: ids of the claimed alerts, or None on such a conflict
+        """
+        where = "a.state = 'pending'"
+        params = {'namespace': ALERT_LOCK_NAMESPACE, 'limit': limit}
+        if sources:
+            where += " AND a.source IN %(sources)s"
+            params['sources'] = tuple(sources)
+        self.env['contract.expiry.alert'].flush_model(['state', 'source', 'user_id'])
+        try:
+            with self.env.cr.savepoint(flush=False):
+                self.env.cr.execute("""
+                    WITH recipients AS (
+                        SELECT DISTINCT a.user_id FROM contract_expiry_alert a
+                        WHERE %(where)s
+                        ORDER BY a.user_id
+                    ), claimed AS (
+                        SELECT user_id FROM recipients
+                        WHERE pg_try_advisory_xact_lock(%%(namespace)s, user_id)
+                        LIMIT %%(limit)s
+                    )
+                    SELECT a.id FROM contract_expiry_alert a
+                    JOIN claimed c ON c.user_id = a.user_id
+                    WHERE %(where)s
+                    FOR UPDATE OF a SKIP LOCKED
+                """ % {'where': where}, params)
+                return [row[0] for row in self.env.cr.fetchall()]
+        except errors.SerializationFailure:
+            _logger.info('Expiry alerts were sent concurrently, claiming again later')
+            self._trigger_alert_workers()
+            return None
+
+    @api.model
+    def _process_alert_chunk(self, sources=None):
+        """Send the digests of one chunk of recipients and report progress"""
+        alert_ids = self._claim_alert_recipients(sources=sources)
+        if not alert_ids:
+            self.env['ir.cron']._notify_progress(done=0, remaining=0)
+            return {'sent': 0, 'failed': 0}
+        result = self._dispatch_pending_alerts(sources=sources, alert_ids=alert_ids)
+        remaining = self._count_pending_recipients(sources)
+        _logger.info(
+            'Expiry alert chunk: %s digests sent, %s failed, %s recipients remaining',
+            result['sent'], result['failed'], remaining
+        )
+        self.env['ir.cron']._notify_progress(
+            done=result['sent'] + result['failed'], remaining=remaining)
+        return result
+
+    @api.model
+    def _select_due_alerts_once(self, sources=None):
+        """Select the due alerts of the sources not selected yet today"""
+        params = self.env['ir.config_parameter'].sudo()
+        today = fields.Date.to_string(fields.Date.today())
+        codes = [
+            code for code in (sources or list(self._get_alert_sources()))
+            if params.get_param(ALERT_SELECTION_PARAM % code) != today
+        ]
+        if not codes:
+            return 0
+        created = self._select_due_alerts(sources=codes)
+        for code in codes:
+            params.set_param(ALERT_SELECTION_PARAM % code, today)
+        return created
+
+    @api.model
+    def _select_due_alerts(self, sources=None, today=None):
+        """Insert ledger rows for every record inside its alert period.
+
+        One INSERT ... SELECT per source. Records that already have an
+        alert for this window are skipped by the unique key.
+        """
+        today = today or fields.Date.today()
+        registry = self._get_alert_sources()
+        codes = sources or list(registry)
+        uid = self.env.uid
+        created = 0
+        for code in codes:
+            source = registry[code]
+            self.env.cr.execute("""
+                INSERT INTO contract_expiry_alert (
+                    source, res_model, res_id, alert_date, due_date, user_id,
+                    state, create_uid, create_date, write_uid, write_date
+                )
+                SELECT %%(source)s, %%(model)s, r.id, %%(today)s,
+                       r.%(date)s, r.%(recipient)s, 'pending',
+                       %%(uid)s, now() at time zone 'UTC',
+                       %%(uid)s, now() at time zone 'UTC'
+                FROM %(table)s r
+                JOIN res_users u ON u.id = r.%(recipient)s
+                JOIN res_partner p ON p.id = u.partner_id
+                WHERE %(where)s
+                  AND r.%(date)s >= %%(today)s
+                  AND r.%(date)s - %%(today)s
+                      <= COALESCE(NULLIF(r.%(lead)s, 0), 30)
+                  AND COALESCE(p.email, '') != ''
+                ON CONFLICT (res_model, res_id, alert_date) DO NOTHING
+            """ % {
+                'table': source['table'],
+                'date': source['date_column'],
+                'lead': source['lead_column'],
+                'recipient': source['recipient_column'],
+                'where': source['where'],
+            }, {
+                'source': code,
+                'model': source['model'],
+                'today': today,
+                'uid': uid,
+            })
+            created += self.env.cr.rowcount
+        self.env['contract.expiry.alert'].invalidate_model()
+        return created
+
+    @api.model
+    def _dispatch_pending_alerts(self, sources=None, force_send=False, user_ids=None,
+                                 alert_ids=None):
+        """Send one digest per recipient for all pending alerts.
+
+        Mails are queued and left to the mail queue unless ``force_send``
+        is set, so the cron never waits on SMTP. ``user_ids`` restricts the
+        digests to a chunk of recipients, ``alert_ids`` to claimed alerts.
+        """
+        Alert = self.env['contract.expiry.alert']
+        domain = [('state', '=', 'pending')]
+        if sources:
+            domain.append(('source', 'in', sources))
+        if user_ids is not None:
+            domain.append(('user_id', 'in', user_ids))
+        if alert_ids is not None:
+            domain.append(('id', 'in', alert_ids))
+        alerts = Alert.search(domain, order='user_id, source, due_date')
+        if not alerts:
+            return {'sent': 0, 'failed': 0}
+
+        registry = self._get_alert_sources()
+        by_user = defaultdict(lambda: Alert)
+        for alert in alerts:
+            by_user[alert.user_id] |= alert
+
+        sent = failed = 0
+        mails = self.env['mail.mail']
+        for user, user_alerts in by_user.items():
+            try:
+                with self.env.cr.savepoint():
+                    mail = self.env['mail.mail'].create(
+                        self._prepare_digest_mail_values(user, user_alerts, registry))
+                    user_alerts.write({'state': 'sent', 'mail_id': mail.id})
+                mails |= mail
+                sent += 1
+            except Exception as e:
+                _logger.error(
+                    'Expiry alert digest for %s failed: %s',
+                    user.name, str(e), exc_info=True
+                )
+                user_alerts.write({'state': 'failed'})
+                failed += 1
+
+        # Flag the source records in one write per source
+        delivered = alerts.filtered(lambda a: a.state == 'sent')
+        for code in set(delivered.mapped('source')):
+            source = registry[code]
+            res_ids = delivered.filtered(lambda a: a.source == code).mapped('res_id')
+            self.env[source['model']].browse(res_ids).with_context(
+                skip_amendment=True, skip_expiration_check=True
+            ).write(source['sent_values'])
+
+        if force_send and mails:
+            mails.send()
+        return {'sent': sent, 'failed': failed}
+
+    @api.model
+    def _prepare_digest_mail_values(self, user, alerts, registry):
+        """Build a single digest email listing every alert of a recipient"""
+        today = fields.Date.today()
+        rows = []
+        for alert in alerts:
+            record = self.env[alert.res_model].browse(alert.res_id)
+            days_left = (alert.due_date - today).days if alert.due_date else 0
+            rows.append(f"""
+                <tr>
+                    <td style="padding: 8px; border: 1px solid #ddd;">{html_escape(registry[alert.source]['label'])}</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">{html_escape(record.contract_number or 'N/A')}</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">{html_escape(record.display_name or 'N/A')}</td>
+                    <td style="padding: 8px; border: 1px solid #ddd;">{alert.due_date or 'N/A'}</td>
+                    <td style="padding: 8px; border: 1px solid #ddd; color: #d9534f; font-weight: bold;">{days_left} days</td>
+                </tr>""")
+
+        body_html = f"""
+        <div style="font-family: Arial, sans-serif;">
+            <h2 style="color: #875A7B;">Expiry Notice</h2>
+            <p>Dear {html_escape(user.name)},</p>
+            <p>The following items are expiring soon:</p>
+            <table style="border-collapse: collapse; width: 100%;
+            margin: 20px 0;">
+                <tr>
+                    <th style="padding: 8px; border: 1px solid #ddd;">Type</th>
+                    <th style="padding: 8px; border: 1px solid #ddd;">Contract Number</th>
+                    <th style="padding: 8px; border: 1px solid #ddd;">Reference</th>
+                    <th style="padding: 8px; border: 1px solid #ddd;">Due/Expiry Date</th>
+                    <th style="padding: 8px; border: 1px solid #ddd;">Days Left</th>
+                </tr>
+                {''.join(rows)}
+            </table>
+            <p style="color: #d9534f; font-weight: bold;">Please take
+            necessary action before these items expire.</p>
+            <p>Best regards,<br/>Contract Management System</p>
+        </div>
+        """
+        return {
+            'subject': _('Expiry Notice: %s item(s) expiring soon') % len(alerts),
+            'body_html': body_html,
+            'email_to': user.email,
+            'email_from': self.env.user.email or self.env.company.email,
+            'recipient_ids': [(6, 0, [user.partner_id.id])],
+        }
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields
+
+
+class ContractGuarantyExposure(models.Model):
+    """
+    Active performance guaranty exposure ledger.
+
+    One row per (contract, currency, expiry month) with the amount and
+    number of active guaranties. Statement triggers on
+    contract_performance_guaranty apply the delta of every insert, update
+    (including status transitions) and delete, so pivots by vendor, month
+    or currency read a table whose size does not grow with history.
+    """
+    _name = 'contract.guaranty.exposure'
+    _description = 'Performance Guaranty Exposure'
+    _order = 'expiry_month, partner_id'
+    _rec_name = 'contract_id'
+
+    contract_id = fields.Many2one(
+        'contract.management',
+        string='Contract',
+        required=True,
+        readonly=True,
+        ondelete='cascade'
+    )
+
+    partner_id = fields.Many2one(
+        'res.partner',
+        string='Contractor/Vendor',
+        readonly=True,
+        index=True
+    )
+
+    currency_id = fields.Many2one(
+        'res.currency',
+        string='Currency',
+        readonly=True
+    )
+
+    expiry_month = fields.Date(
+        string='Expiry Month',
+        readonly=True,
+        index=True,
+        help='First day of the month the guaranties expire in'
+    )
+
+    amount = fields.Monetary(
+        string='Active Exposure',
+        currency_field='currency_id',
+        readonly=True
+    )
+
+    guaranty_count = fields.Integer(
+        string='Active Guaranties',
+        readonly=True
+    )
+
+    def _get_delta_query(self, source, sign):
+        """SQL adding (sign=1) or removing (sign=-1) the active guaranties
+        of a trigger transition table to the ledger"""
+        return """
+            INSERT INTO contract_guaranty_exposure AS e (
+                contract_id, partner_id, currency_id, expiry_month, amount, guaranty_count
+            )
+            SELECT r.contract_id, c.partner_id, r.currency_id,
+                   date_trunc('month', r.expiry_date)::date,
+                   %(sign)s * sum(COALESCE(r.performance_guaranty_amount, 0)),
+                   %(sign)s * count(*)
+            FROM %(source)s r
+            JOIN contract_management c ON c.id = r.contract_id
+            WHERE r.status = 'active'
+            GROUP BY r.contract_id, c.partner_id, r.currency_id,
+                     date_trunc('month', r.expiry_date)
+            ON CONFLICT (contract_id, COALESCE(currency_id, 0),
+                         COALESCE(expiry_month, 'infinity'::date))
+            DO UPDATE SET amount = e.amount + EXCLUDED.amount,
+                          guaranty_count = e.guaranty_count + EXCLUDED.guaranty_count;
+            DELETE FROM contract_guaranty_exposure
+            WHERE guaranty_count <= 0
+              AND contract_id IN (SELECT contract_id FROM %(source)s);
+        """ % {'source': source, 'sign': sign}
+
+    def init(self):
+        cr = self.env.cr
+        cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS contract_guaranty_exposure_key_index
+                ON contract_guaranty_exposure (
+                    contract_id, COALESCE(currency_id, 0),
+                    COALESCE(expiry_month, 'infinity'::date));
+
+            CREATE OR REPLACE FUNCTION contract_guaranty_exposure_insert()
+            RETURNS trigger AS $$
+            BEGIN
+                %(insert)s
+                RETURN NULL;
+            END $$ LANGUAGE plpgsql;
+
+            CREATE OR REPLACE FUNCTION contract_guaranty_exposure_update()
+            RETURNS trigger AS $$
+            BEGIN
+                %(remove)s
+                %(insert)s
+                RETURN NULL;
+            END $$ LANGUAGE plpgsql;
+
+            CREATE OR REPLACE FUNCTION contract_guaranty_exposure_delete()
+            RETURNS trigger AS $$
+            BEGIN
+                %(remove)s
+                RETURN NULL;
+            END $$ LANGUAGE plpgsql;
+
+            CREATE OR REPLACE FUNCTION contract_guaranty_exposure_partner()
+            RETURNS trigger AS $$
+            BEGIN
+                UPDATE contract_guaranty_exposure
+                SET partner_id = NEW.partner_id
+                WHERE contract_id = NEW.id;
+                RETURN NULL;
+            END $$ LANGUAGE plpgsql;
+
+            DROP TRIGGER IF EXISTS contract_guaranty_exposure_insert
+                ON contract_performance_guaranty;
+            CREATE TRIGGER contract_guaranty_exposure_insert
+                AFTER INSERT ON contract_performance_guaranty
+                REFERENCING NEW TABLE AS new_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION contract_guaranty_exposure_insert();
+            DROP TRIGGER IF EXISTS contract_guaranty_exposure_update
+                ON contract_performance_guaranty;
+            CREATE TRIGGER contract_guaranty_exposure_update
+                AFTER UPDATE ON contract_performance_guaranty
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION contract_guaranty_exposure_update();
+            DROP TRIGGER IF EXISTS contract_guaranty_exposure_delete
+                ON contract_performance_guaranty;
+            CREATE TRIGGER contract_guaranty_exposure_delete
+                AFTER DELETE ON contract_performance_guaranty
+                REFERENCING OLD TABLE AS old_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION contract_guaranty_exposure_delete();
+            DROP TRIGGER IF EXISTS contract_guaranty_exposure_partner
+                ON contract_management;
+            CREATE TRIGGER contract_guaranty_exposure_partner
+                AFTER UPDATE OF partner_id ON contract_management
+                FOR EACH ROW WHEN (OLD.partner_id IS DISTINCT FROM NEW.partner_id)
+                EXECUTE FUNCTION contract_guaranty_exposure_partner();
+        """ % {
+            'insert': self._get_delta_query('new_rows', 1),
+            'remove': self._get_delta_query('old_rows', -1),
+        })
+        self._rebuild_ledger()
+
+    def _rebuild_ledger(self):
+        """Rebuild the whole ledger from the guaranties"""
+        self.env['contract.performance.guaranty'].flush_model()
+        self.env.cr.execute("""
+            DELETE FROM contract_guaranty_exposure;
+            INSERT INTO contract_guaranty_exposure (
+                contract_id, partner_id, currency_id, expiry_month, amount, guaranty_count
+            )
+            SELECT g.contract_id, c.partner_id, g.currency_id,
+                   date_trunc('month', g.expiry_date)::date,
+                   sum(COALESCE(g.performance_guaranty_amount, 0)), count(*)
+            FROM contract_performance_guaranty g
+            JOIN contract_management c ON c.id = g.contract_id
+            WHERE g.status = 'active'
+            GROUP BY g.contract_id, c.partner_id, g.currency_id,
+                     date_trunc('month', g.expiry_date)
+        """)
+        self.invalidate_model()
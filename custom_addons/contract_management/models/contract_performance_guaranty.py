@@ -2,13 +2,13 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
-from datetime import date, timedelta
+from datetime import date
 
 
 class ContractPerformanceGuaranty(models.Model):
     _name = 'contract.performance.guaranty'
     _description = 'Contract Performance Guaranty'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'contract.temporal.mixin']
     _order = 'issue_date desc, expiry_date desc'
 
     # Basic Information
@@ -24,6 +24,7 @@ class ContractPerformanceGuaranty(models.Model):
         string='Linked Contract',
         required=True,
         ondelete='cascade',
+        index=True,
         tracking=True,
         help='Reference to the parent contract'
     )
@@ -82,6 +83,7 @@ class ContractPerformanceGuaranty(models.Model):
     expiry_date = fields.Date(
         string='Expiry Date',
         tracking=True,
+        index=True,
         help='Date when the performance guaranty expires'
     )
     
@@ -166,27 +168,47 @@ class ContractPerformanceGuaranty(models.Model):
 
     is_expired = fields.Boolean(
         string='Is Expired',
-        compute='_compute_status',
-        store=True
+        compute='_compute_is_expired',
+        search='_search_is_expired'
     )
 
     @api.depends('expiry_date', 'status')
     def _compute_status(self):
-        """Compute performance guaranty status based on expiry date"""
+        """Compute performance guaranty status based on expiry date
+
+        The stored status is kept up to date by the nightly temporal refresh.
+        """
         today = fields.Date.today()
         for guaranty in self:
             if guaranty.status in ('released', 'claimed'):
                 # Don't change status if already released or claimed
                 continue
-            elif not guaranty.expiry_date:
-                guaranty.status = 'active'
-                guaranty.is_expired = False
-            elif guaranty.expiry_date < today:
+            elif guaranty.expiry_date and guaranty.expiry_date < today:
                 guaranty.status = 'expired'
-                guaranty.is_expired = True
             else:
                 guaranty.status = 'active'
-                guaranty.is_expired = False
+
+    def _compute_is_expired(self):
+        """Compute if performance guaranty has expired"""
+        today = fields.Date.today()
+        for guaranty in self:
+            guaranty.is_expired = bool(
+                guaranty.status not in ('released', 'claimed') and
+                guaranty.expiry_date and guaranty.expiry_date < today
+            )
+
+    def _search_is_expired(self, operator, value):
+        """Search method for is_expired computed field"""
+        today = fields.Date.today()
+        return self._search_temporal_flag(operator, value, [
+            ('status', 'not in', ('released', 'claimed')),
+            ('expiry_date', '<', today),
+        ], [
+            '|', '|',
+            ('status', 'in', ('released', 'claimed')),
+            ('expiry_date', '=', False),
+            ('expiry_date', '>=', today),
+        ])
 
     @api.depends('expiry_date')
     def _compute_days_to_expiry(self):
@@ -201,26 +223,20 @@ class ContractPerformanceGuaranty(models.Model):
 
     def _search_days_to_expiry(self, operator, value):
         """Search method for days_to_expiry computed field"""
+        return self._search_days_from_today('expiry_date', operator, value)
+
+    def _refresh_temporal_states(self):
+        """Recompute the status of guaranties whose expiry date was crossed"""
         today = fields.Date.today()
-        if operator == '<':
-            # Find guaranties expiring in less than value days
-            target_date = today + timedelta(days=value)
-            return [('expiry_date', '<', target_date)]
-        elif operator == '>':
-            # Find guaranties expiring in more than value days
-            target_date = today + timedelta(days=value)
-            return [('expiry_date', '>', target_date)]
-        elif operator in ['<=', '>=']:
-            # Handle <= and >= operators
-            target_date = today + timedelta(days=value)
-            op = '<=' if operator == '<=' else '>='
-            return [('expiry_date', op, target_date)]
-        elif operator == '=':
-            # Find guaranties expiring on exactly value days from now
-            target_date = today + timedelta(days=value)
-            return [('expiry_date', '=', target_date)]
-        else:
-            return [('id', 'in', [])]
+        guaranties = self.search([
+            '|',
+            '&', ('status', '=', 'active'), ('expiry_date', '<', today),
+            '&', ('status', '=', 'expired'), '|',
+            ('expiry_date', '=', False), ('expiry_date', '>=', today),
+        ])
+        if guaranties:
+            self.env.add_to_compute(self._fields['status'], guaranties)
+            guaranties.flush_recordset(['status'])
 
     @api.constrains('expiry_date', 'issue_date')
     def _check_dates(self):
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api
+
+# Child tables whose changes refresh the aggregates of their contract
+STATS_SOURCE_TABLES = [
+    'contract_deliverable',
+    'contract_management_amendment',
+    'contract_performance_guaranty',
+]
+
+# Child model fields read by the aggregates
+STATS_SOURCE_FIELDS = {
+    'contract.deliverable': [
+        'contract_id', 'is_overdue', 'status', 'deliverable_date', 'payment_amount',
+    ],
+    'contract.management.amendment': ['contract_id', 'version'],
+    'contract.performance.guaranty': ['contract_id'],
+}
+
+
+class ContractPortfolioStats(models.Model):
+    """
+    Per-contract aggregates of deliverables, amendments and guaranties.
+
+    Rows are maintained by PostgreSQL statement triggers on the child
+    tables: every insert, update or delete re-aggregates only the contracts
+    touched by the statement. Contract counters read this table with one
+    query per batch instead of loading the one2many records.
+    """
+    _name = 'contract.portfolio.stats'
+    _description = 'Contract Portfolio Statistics'
+    _rec_name = 'contract_id'
+
+    contract_id = fields.Many2one(
+        'contract.management',
+        string='Contract',
+        required=True,
+        readonly=True,
+        ondelete='cascade'
+    )
+
+    deliverable_count = fields.Integer(
+        string='Deliverables',
+        readonly=True
+    )
+
+    overdue_deliverable_count = fields.Integer(
+        string='Overdue Deliverables',
+        readonly=True
+    )
+
+    overdue_deliverable_amount = fields.Float(
+        string='Overdue Amount',
+        readonly=True
+    )
+
+    next_deliverable_date = fields.Date(
+        string='Next Deliverable',
+        readonly=True
+    )
+
+    amendment_count = fields.Integer(
+        string='Amendments',
+        readonly=True
+    )
+
+    max_version_number = fields.Integer(
+        string='Latest Version',
+        readonly=True
+    )
+
+    performance_guaranty_count = fields.Integer(
+        string='Performance Guaranties',
+        readonly=True
+    )
+
+    _sql_constraints = [
+        ('contract_unique', 'unique(contract_id)',
+         'Statistics already exist for this contract.'),
+    ]
+
+    def init(self):
+        cr = self.env.cr
+        cr.execute("""
+            CREATE OR REPLACE FUNCTION contract_portfolio_stats_refresh(contract_ids integer[])
+            RETURNS void AS $$
+                INSERT INTO contract_portfolio_stats (
+                    contract_id, deliverable_count, overdue_deliverable_count,
+                    overdue_deliverable_amount, next_deliverable_date,
+                    amendment_count, max_version_number, performance_guaranty_count
+                )
+                SELECT c.id,
+                       COALESCE(d.deliverable_count, 0),
+                       COALESCE(d.overdue_count, 0),
+                       COALESCE(d.overdue_amount, 0),
+                       d.next_date,
+                       COALESCE(a.amendment_count, 0),
+                       COALESCE(a.max_version, 0),
+                       COALESCE(g.guaranty_count, 0)
+                FROM contract_management c
+                LEFT JOIN LATERAL (
+                    SELECT count(*) AS deliverable_count,
+                           count(*) FILTER (WHERE is_overdue) AS overdue_count,
+                           sum(payment_amount) FILTER (WHERE is_overdue) AS overdue_amount,
+                           min(deliverable_date) FILTER (
+                               WHERE status = 'pending' AND NOT COALESCE(is_overdue, FALSE)
+                           ) AS next_date
+                    FROM contract_deliverable WHERE contract_id = c.id
+                ) d ON TRUE
+                LEFT JOIN LATERAL (
+                    SELECT count(*) AS amendment_count,
+                           max(CASE WHEN version ~ '^v[0-9]+$'
+                                    THEN substring(version FROM 2)::integer END) AS max_version
+                    FROM contract_management_amendment WHERE contract_id = c.id
+                ) a ON TRUE
+                LEFT JOIN LATERAL (
+                    SELECT count(*) AS guaranty_count
+                    FROM contract_performance_guaranty WHERE contract_id = c.id
+                ) g ON TRUE
+                WHERE c.id = ANY(contract_ids)
+                ON CONFLICT (contract_id) DO UPDATE SET
+                    deliverable_count = EXCLUDED.deliverable_count,
+                    overdue_deliverable_count = EXCLUDED.overdue_deliverable_count,
+                    overdue_deliverable_amount = EXCLUDED.overdue_deliverable_amount,
+                    next_deliverable_date = EXCLUDED.next_deliverable_date,
+                    amendment_count = EXCLUDED.amendment_count,
+                    max_version_number = EXCLUDED.max_version_number,
+                    performance_guaranty_count = EXCLUDED.performance_guaranty_count
+            $$ LANGUAGE sql;
+
+            CREATE OR REPLACE FUNCTION contract_portfolio_stats_new_rows()
+            RETURNS trigger AS $$
+            BEGIN
+                PERFORM contract_portfolio_stats_refresh(
+                    ARRAY(SELECT DISTINCT contract_id FROM new_rows));
+                RETURN NULL;
+            END $$ LANGUAGE plpgsql;
+
+            CREATE OR REPLACE FUNCTION contract_portfolio_stats_old_rows()
+            RETURNS trigger AS $$
+            BEGIN
+                PERFORM contract_portfolio_stats_refresh(
+                    ARRAY(SELECT DISTINCT contract_id FROM old_rows));
+                RETURN NULL;
+            END $$ LANGUAGE plpgsql;
+
+            CREATE OR REPLACE FUNCTION contract_portfolio_stats_all_rows()
+            RETURNS trigger AS $$
+            BEGIN
+                PERFORM contract_portfolio_stats_refresh(ARRAY(
+                    SELECT contract_id FROM new_rows
+                    UNION SELECT contract_id FROM old_rows));
+                RETURN NULL;
+            END $$ LANGUAGE plpgsql;
+        """)
+        for table in STATS_SOURCE_TABLES:
+            cr.execute("""
+                DROP TRIGGER IF EXISTS %(table)s_stats_insert ON %(table)s;
+                CREATE TRIGGER %(table)s_stats_insert
+                    AFTER INSERT ON %(table)s REFERENCING NEW TABLE AS new_rows
+                    FOR EACH STATEMENT EXECUTE FUNCTION contract_portfolio_stats_new_rows();
+                DROP TRIGGER IF EXISTS %(table)s_stats_update ON %(table)s;
+                CREATE TRIGGER %(table)s_stats_update
+                    AFTER UPDATE ON %(table)s
+                    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                    FOR EACH STATEMENT EXECUTE FUNCTION contract_portfolio_stats_all_rows();
+                DROP TRIGGER IF EXISTS %(table)s_stats_delete ON %(table)s;
+                CREATE TRIGGER %(table)s_stats_delete
+                    AFTER DELETE ON %(table)s REFERENCING OLD TABLE AS old_rows
+                    FOR EACH STATEMENT EXECUTE FUNCTION contract_portfolio_stats_old_rows();
+            """ % {'table': table})
+        # Backfill contracts that have no statistics yet
+        cr.execute("""
+            SELECT contract_portfolio_stats_refresh(ARRAY(
+                SELECT c.id FROM contract_management c
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM contract_portfolio_stats s WHERE s.contract_id = c.id
+                )
+            ))
+        """)
+
+    @api.model
+    def _get_stats(self, contract_ids):
+        """Return {contract_id: values} for the given contracts in one query"""
+        if not contract_ids:
+            return {}
+        # Pending child writes of the aggregated fields must reach the
+        # database so the triggers run
+        for model_name, field_names in STATS_SOURCE_FIELDS.items():
+            self.env[model_name].flush_model(field_names)
+        self.invalidate_model()
+        self.env.cr.execute("""
+            SELECT contract_id, deliverable_count, overdue_deliverable_count,
+                   overdue_deliverable_amount, next_deliverable_date,
+                   amendment_count, max_version_number, performance_guaranty_count
+            FROM contract_portfolio_stats
+            WHERE contract_id IN %s
+        """, (tuple(contract_ids),))
+        return {row['contract_id']: row for row in self.env.cr.dictfetchall()}
@@ -1,6 +1,14 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, tools
+from odoo import models, fields, api, tools, _
+from odoo.tools import str2bool
+from odoo.tools.sql import table_kind, TableKind
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Above this number of contracts, archiving runs as a background job
+ARCHIVE_BACKGROUND_THRESHOLD = 500
 
 
 class ContractReport(models.Model):
@@ -8,6 +16,18 @@ class ContractReport(models.Model):
     _description = 'Contract Report'
     _auto = False
 
+    # Backing materialized view of the report (see _is_materialized)
+    _materialized_table = 'contract_report_data'
+
+    # Contract fields exposed by the report, a change on one of them
+    # schedules a refresh of the materialized view
+    _REPORT_CONTRACT_FIELDS = (
+        'contract_number', 'name', 'partner_id', 'contract_type_id',
+        'classification_ids', 'category_ids', 'department_ids',
+        'effective_date', 'expiry_date', 'contract_value', 'currency_id',
+        'state', 'contract_manager_id',
+    )
+
     contract_id = fields.Many2one(
         'contract.management',
         string='Contract'
@@ -83,8 +103,19 @@ class ContractReport(models.Model):
         string='Contract Manager'
     )
 
+    @api.model
+    def _is_materialized(self):
+        """Whether the report is served from a materialized view.
+
+        Controlled by the ``contract_management.report_materialized``
+        system parameter (enabled by default).
+        """
+        return str2bool(self.env['ir.config_parameter'].sudo().get_param(
+            'contract_management.report_materialized', 'True'))
+
     def init(self):
         tools.drop_view_if_exists(self.env.cr, self._table)
+        tools.drop_view_if_exists(self.env.cr, self._materialized_table)
         
         # Check if configuration tables exist by querying PostgreSQL catalog
         def table_exists(table_name):
@@ -127,12 +158,8 @@ class ContractReport(models.Model):
                     dept.names as department_names,
                     c.effective_date,
                     c.expiry_date,
-                    CASE 
-                        WHEN c.expiry_date IS NOT NULL 
-                        THEN (c.expiry_date - CURRENT_DATE)::integer
-                        ELSE 0
-                    END as days_to_expiry,
                     c.contract_value,
+                    c.currency_id,
                     c.state,
                     c.contract_manager_id
                 FROM contract_management c
@@ -172,20 +199,68 @@ class ContractReport(models.Model):
                     NULL::text as department_names,
                     c.effective_date,
                     c.expiry_date,
-                    CASE 
-                        WHEN c.expiry_date IS NOT NULL 
-                        THEN (c.expiry_date - CURRENT_DATE)::integer
-                        ELSE 0
-                    END as days_to_expiry,
                     c.contract_value,
+                    c.currency_id,
                     c.state,
                     c.contract_manager_id
                 FROM contract_management c
             """
         
+        # days_to_expiry is always derived at query time from the stored
+        # expiry date, so the data never goes stale overnight
+        days_to_expiry = """
+            CASE
+                WHEN r.expiry_date IS NOT NULL
+                THEN (r.expiry_date - CURRENT_DATE)::integer
+                ELSE 0
+            END as days_to_expiry
+        """
+        if self._is_materialized():
+            self.env.cr.execute("""
+                CREATE MATERIALIZED VIEW %(mat)s AS (%(query)s);
+                CREATE UNIQUE INDEX %(mat)s_id_idx ON %(mat)s (id);
+                CREATE INDEX %(mat)s_state_expiry_idx ON %(mat)s (state, expiry_date);
+                CREATE INDEX %(mat)s_contract_type_idx ON %(mat)s (contract_type_id);
+                CREATE INDEX %(mat)s_manager_idx ON %(mat)s (contract_manager_id);
+            """ % {'mat': self._materialized_table, 'query': query})
+            source = self._materialized_table
+        else:
+            source = '(%s)' % query
         self.env.cr.execute("""
-            CREATE OR REPLACE VIEW %s AS (%s)
-        """ % (self._table, query))
+            CREATE OR REPLACE VIEW %s AS (
+                SELECT r.*, %s FROM %s r
+            )
+        """ % (self._table, days_to_expiry, source))
+
+    @api.model
+    def _refresh_materialized_view(self):
+        """Refresh the materialized view without blocking readers"""
+        if table_kind(self.env.cr, self._materialized_table) != TableKind.Materialized:
+            return False
+        self.env['contract.management'].flush_model()
+        self.env.cr.execute(
+            "REFRESH MATERIALIZED VIEW CONCURRENTLY %s" % self._materialized_table)
+        _logger.info('Contract report materialized view refreshed')
+        return True
+
+    @api.model
+    def cron_refresh_contract_report(self):
+        """Cron job method refreshing the materialized contract report"""
+        return self._refresh_materialized_view()
+
+    @api.model
+    def _schedule_refresh(self):
+        """Ask the refresh cron to run as soon as possible.
+
+        Several writes in a row only lead to one refresh.
+        """
+        if not self._is_materialized():
+            return
+        cron = self.env.ref(
+            'contract_management.ir_cron_refresh_contract_report',
+            raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
 
 
 class ContractDeliverableReport(models.Model):
@@ -278,28 +353,35 @@ class ContractArchiveWizard(models.TransientModel):
         help='If checked, only authorized users can access archived contracts'
     )
 
+    def _get_archive_notes(self):
+        self.ensure_one()
+        return f"Archived: {self.archive_reason}. {self.archive_notes or ''}"
+
     def action_archive_contracts(self):
-        """Archive the selected contracts"""
-        for contract in self.contract_ids:
-            contract.write({
-                'state': 'archived',
-                'notes': f"Archived: {self.archive_reason}. {self.archive_notes or ''}"
+        """Archive the selected contracts
+
+        Large selections are archived in the background by an archive job.
+        """
+        self.ensure_one()
+        notes = self._get_archive_notes()
+        if len(self.contract_ids) > ARCHIVE_BACKGROUND_THRESHOLD:
+            job = self.env['contract.archive.job'].create({
+                'name': _('Archive %s contracts') % len(self.contract_ids),
+                'contract_ids': [(6, 0, self.contract_ids.ids)],
+                'notes': notes,
             })
-            
-            # Archive related documents
-            if contract.contract_documents:
-                contract.write({
-                    'contract_documents': False,
-                    'contract_document_name': False,
-                    'contract_document_size': 0
-                })
-            
-            if contract.additional_documents:
-                contract.write({
-                    'additional_documents': False,
-                    'additional_document_name': False,
-                    'additional_document_size': 0
-                })
+            job._schedule()
+            return {
+                'type': 'ir.actions.act_window',
+                'name': _('Archive Job'),
+                'res_model': 'contract.archive.job',
+                'res_id': job.id,
+                'view_mode': 'form',
+                'target': 'current',
+            }
+
+        self.contract_ids._archive_batch(
+            {contract.id: notes for contract in self.contract_ids})
         
         return {
             'type': 'ir.actions.client',
@@ -309,4 +391,4 @@ class ContractArchiveWizard(models.TransientModel):
                 'message': f'{len(self.contract_ids)} contracts have been archived.',
                 'type': 'success',
             }
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api
+from .contract import COLD_STORAGE_DESCRIPTION
+
+# PostgreSQL text search configuration used to build and query the index
+SEARCH_CONFIG = 'english'
+
+# Upper bound of document text indexed per contract (tsvector size limit)
+MAX_DOCUMENT_TEXT = 500000
+
+
+class ContractSearchIndex(models.Model):
+    """
+    Full-text search index of contracts.
+
+    One row per contract holding a weighted tsvector (GIN indexed) built in
+    SQL from:
+
+    - A: contract title and number
+    - B: contractor/vendor name
+    - C: deliverables, description, notes and compliance notes
+    - D: text extracted from the uploaded documents (``index_content`` of
+      the attachments, filled by ``attachment_indexation`` for PDFs)
+
+    Writes only queue the contract ids; they are reindexed in one statement
+    before the transaction commits.
+    """
+    _name = 'contract.search.index'
+    _description = 'Contract Search Index'
+    _rec_name = 'contract_id'
+
+    # Contract fields whose changes trigger a reindex
+    _CONTRACT_SEARCH_FIELDS = {
+        'name', 'contract_number', 'partner_id', 'description', 'notes',
+        'compliance_notes', 'contract_documents', 'additional_documents',
+    }
+
+    # Deliverable fields whose changes trigger a reindex of their contract
+    _DELIVERABLE_SEARCH_FIELDS = {'name', 'description', 'deliverable', 'contract_id'}
+
+    contract_id = fields.Many2one(
+        'contract.management',
+        string='Contract',
+        required=True,
+        readonly=True,
+        ondelete='cascade'
+    )
+
+    _sql_constraints = [
+        ('contract_unique', 'unique(contract_id)',
+         'The contract is already indexed.'),
+    ]
+
+    def init(self):
+        cr = self.env.cr
+        cr.execute("""
+            ALTER TABLE %(table)s ADD COLUMN IF NOT EXISTS search_vector tsvector;
+            CREATE INDEX IF NOT EXISTS %(table)s_search_vector_index
+                ON %(table)s USING gin (search_vector);
+        """ % {'table': self._table})
+        cr.execute("""
+            SELECT c.id FROM contract_management c
+            WHERE NOT EXISTS (
+                SELECT 1 FROM %s i WHERE i.contract_id = c.id
+            )
+        """ % self._table)
+        self._reindex_contracts([row[0] for row in cr.fetchall()])
+
+    @api.model
+    def _schedule_reindex(self, contract_ids):
+        """Queue contracts to reindex before the transaction commits"""
+        if not contract_ids:
+            return
+        pending = self.env.cr.precommit.data.setdefault('contract_search_index.pending', set())
+        if not pending:
+            self.env.cr.precommit.add(self._reindex_pending)
+        pending.update(contract_ids)
+
+    def _reindex_pending(self):
+        pending = self.env.cr.precommit.data.pop('contract_search_index.pending', set())
+        if pending:
+            self.env.flush_all()
+            self._reindex_contracts(list(pending))
+
+    @api.model
+    def _reindex_contracts(self, contract_ids):
+        """Rebuild the search vector of the given contracts in one statement"""
+        if not contract_ids:
+            return
+        self.env.cr.execute("""
+            INSERT INTO contract_search_index (contract_id, search_vector)
+            SELECT c.id,
+                   setweight(to_tsvector(%(config)s,
+                       COALESCE(c.name, '') || ' ' || COALESCE(c.contract_number, '')), 'A') ||
+                   setweight(to_tsvector(%(config)s, COALESCE(p.name, '')), 'B') ||
+                   setweight(to_tsvector(%(config)s,
+                       COALESCE(d.text, '') || ' ' || COALESCE(c.description, '') || ' ' ||
+                       COALESCE(c.notes, '') || ' ' || COALESCE(c.compliance_notes, '')), 'C') ||
+                   setweight(to_tsvector(%(config)s,
+                       left(COALESCE(a.text, ''), %(max_text)s)), 'D')
+            FROM contract_management c
+            LEFT JOIN res_partner p ON p.id = c.partner_id
+            LEFT JOIN LATERAL (
+                SELECT string_agg(
+                    COALESCE(name, '') || ' ' || COALESCE(description, '') || ' ' ||
+                    COALESCE(deliverable, ''), ' ') AS text
+                FROM contract_deliverable WHERE contract_id = c.id
+            ) d ON TRUE
+            LEFT JOIN LATERAL (
+                SELECT string_agg(index_content, ' ') AS text
+                FROM ir_attachment
+                WHERE res_model = 'contract.management' AND res_id = c.id
+                  AND (res_field IN ('contract_documents', 'additional_documents')
+                       OR (res_field IS NULL AND description = %(cold_storage)s))
+            ) a ON TRUE
+            WHERE c.id IN %(ids)s
+            ON CONFLICT (contract_id) DO UPDATE SET search_vector = EXCLUDED.search_vector
+        """, {
+            'config': SEARCH_CONFIG,
+            'max_text': MAX_DOCUMENT_TEXT,
+            'cold_storage': COLD_STORAGE_DESCRIPTION,
+            'ids': tuple(contract_ids),
+        })
+
+    @api.model
+    def _search_contract_ids(self, query, limit=None):
+        """Return the ids of the contracts matching ``query``, best rank first
+
+        ``query`` uses the web search syntax: words, "quoted phrases",
+        ``or`` and ``-excluded`` words.
+        """
+        self._reindex_pending()
+        sql = """
+            SELECT contract_id
+            FROM contract_search_index,
+                 websearch_to_tsquery(%(config)s, %(query)s) AS q
+            WHERE search_vector @@ q
+            ORDER BY ts_rank_cd(search_vector, q) DESC, contract_id DESC
+        """
+        params = {'config': SEARCH_CONFIG, 'query': query}
+        if limit:
+            sql += " LIMIT %(limit)s"
+            params['limit'] = limit
+        self.env.cr.execute(sql, params)
+        return [row[0] for row in self.env.cr.fetchall()]
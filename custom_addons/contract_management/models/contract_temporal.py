@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api
+from odoo.osv import expression
+from datetime import timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class ContractTemporalMixin(models.AbstractModel):
+    """
+    Helpers for fields that depend on the current date.
+
+    Stored columns only hold dates. Values relative to today (days left,
+    expiring soon, expired...) are non-stored and searched by translating
+    the domain into a range on the stored date, so they use the date index.
+    State columns that must be stored are refreshed by a nightly cron
+    through ``_refresh_temporal_states``.
+    """
+    _name = 'contract.temporal.mixin'
+    _description = 'Contract Temporal Mixin'
+
+    @api.model
+    def _search_days_from_today(self, date_field, operator, value):
+        """Translate a search on a number of days from today into a domain
+        on ``date_field``. Records without a date only match ``= False``.
+        """
+        today = fields.Date.today()
+
+        def to_date(days):
+            return today + timedelta(days=int(days))
+
+        if operator in ('in', 'not in'):
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            dates = [to_date(days) for days in values if days is not False]
+            domain = [(date_field, operator, dates)]
+            if False in values:
+                if operator == 'in':
+                    return expression.OR([domain, [(date_field, '=', False)]])
+                return expression.AND([domain, [(date_field, '!=', False)]])
+            return domain
+        if operator not in ('=', '!=', '<', '<=', '>', '>='):
+            raise NotImplementedError('Operator %s is not supported' % operator)
+        if value is False or value is None:
+            return [(date_field, operator, False)] if operator in ('=', '!=') \
+                else expression.FALSE_DOMAIN
+        return [(date_field, operator, to_date(value))]
+
+    @api.model
+    def _search_temporal_flag(self, operator, value, positive_domain, negative_domain):
+        """Search a boolean derived from dates.
+
+        ``positive_domain``/``negative_domain`` select the records where the
+        flag is True/False. Both are given explicitly so NULL dates end up
+        on the right side.
+        """
+        if operator in ('=', '!='):
+            wanted = {bool(value) == (operator == '=')}
+        elif operator in ('in', 'not in'):
+            values = {bool(v) for v in (value if isinstance(value, (list, tuple, set)) else [value])}
+            wanted = values if operator == 'in' else {True, False} - values
+        else:
+            raise NotImplementedError('Operator %s is not supported' % operator)
+        if wanted == {True, False}:
+            return expression.TRUE_DOMAIN
+        if wanted == {True}:
+            return positive_domain
+        if wanted == {False}:
+            return negative_domain
+        return expression.FALSE_DOMAIN
+
+    def _refresh_temporal_states(self):
+        """Hook: update stored states that changed because the date moved"""
+        return
+
+    @api.model
+    def cron_refresh_temporal_states(self):
+        """Nightly cron job refreshing date-dependent stored states"""
+        for model_name in self.env.registry.descendants([self._name], '_inherit'):
+            model = self.env[model_name]
+            if model._abstract or model_name == self._name:
+                continue
+            model._refresh_temporal_states()
+            _logger.info('Refreshed temporal states of %s', model_name)
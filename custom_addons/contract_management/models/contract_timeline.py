@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, tools, _
+
+# Default number of events returned per timeline page
+TIMELINE_PAGE_SIZE = 200
+
+
+class ContractTimeline(models.Model):
+    """
+    Deliverable due dates and guaranty expiries of all contracts.
+
+    SQL view over one UNION ALL of the two tables. Date filters are pushed
+    into both branches, so a date window reads the indexed
+    ``deliverable_date``/``expiry_date`` columns.
+    """
+    _name = 'contract.timeline'
+    _description = 'Contract Timeline'
+    _auto = False
+    _order = 'date, id'
+
+    event_type = fields.Selection([
+        ('deliverable', 'Deliverable'),
+        ('guaranty', 'Performance Guaranty')
+    ], string='Type', readonly=True)
+
+    res_id = fields.Integer(
+        string='Record ID',
+        readonly=True
+    )
+
+    name = fields.Char(
+        string='Name',
+        readonly=True
+    )
+
+    contract_id = fields.Many2one(
+        'contract.management',
+        string='Contract',
+        readonly=True
+    )
+
+    partner_id = fields.Many2one(
+        'res.partner',
+        string='Contractor/Vendor',
+        readonly=True
+    )
+
+    contract_manager_id = fields.Many2one(
+        'res.users',
+        string='Contract Manager',
+        readonly=True
+    )
+
+    date = fields.Date(
+        string='Date',
+        readonly=True,
+        help='Deliverable due date or guaranty expiry date'
+    )
+
+    status = fields.Char(
+        string='Status',
+        readonly=True
+    )
+
+    amount = fields.Monetary(
+        string='Amount',
+        currency_field='currency_id',
+        readonly=True
+    )
+
+    currency_id = fields.Many2one(
+        'res.currency',
+        string='Currency',
+        readonly=True
+    )
+
+    def init(self):
+        # Manager + date window lookups on both branches of the view
+        tools.create_index(self.env.cr, 'contract_deliverable_manager_date_index',
+                           'contract_deliverable', ['contract_manager_id', 'deliverable_date'])
+        tools.create_index(self.env.cr, 'contract_performance_guaranty_manager_date_index',
+                           'contract_performance_guaranty', ['contract_manager_id', 'expiry_date'])
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        # Even ids are deliverables, odd ids are guaranties
+        self.env.cr.execute("""
+            CREATE OR REPLACE VIEW %s AS (
+                SELECT
+                    d.id * 2 as id,
+                    'deliverable' as event_type,
+                    d.id as res_id,
+                    d.name,
+                    d.contract_id,
+                    c.partner_id,
+                    d.contract_manager_id,
+                    d.deliverable_date as date,
+                    d.status,
+                    d.payment_amount as amount,
+                    d.currency_id
+                FROM contract_deliverable d
+                JOIN contract_management c ON d.contract_id = c.id
+                UNION ALL
+                SELECT
+                    g.id * 2 + 1 as id,
+                    'guaranty' as event_type,
+                    g.id as res_id,
+                    g.name,
+                    g.contract_id,
+                    c.partner_id,
+                    g.contract_manager_id,
+                    g.expiry_date as date,
+                    g.status,
+                    g.performance_guaranty_amount as amount,
+                    g.currency_id
+                FROM contract_performance_guaranty g
+                JOIN contract_management c ON g.contract_id = c.id
+                WHERE g.expiry_date IS NOT NULL
+            )
+        """ % (self._table,))
+
+    @api.model
+    def get_timeline(self, date_from, date_to, manager_ids=None, cursor=None,
+                     limit=TIMELINE_PAGE_SIZE):
+        """Return one page of timeline events between two dates
+
+        :param manager_ids: contract managers to filter on, all when empty
+        :param cursor: ``{'date': ..., 'id': ...}`` of the last event of the
+            previous page; pages are keyed on (date, id) so deep pages cost
+            the same as the first one
+        :return: dict with ``events`` and ``next_cursor`` (False on the last
+            page)
+        """
+        domain = [('date', '>=', date_from), ('date', '<=', date_to)]
+        if manager_ids:
+            domain.append(('contract_manager_id', 'in', manager_ids))
+        if cursor:
+            domain += [
+                ('date', '>=', cursor['date']),
+                '|', ('date', '>', cursor['date']), ('id', '>', cursor['id']),
+            ]
+        events = self.search_read(domain, [
+            'event_type', 'res_id', 'name', 'contract_id', 'partner_id',
+            'contract_manager_id', 'date', 'status', 'amount', 'currency_id',
+        ], order='date, id', limit=limit + 1)
+
+        next_cursor = False
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = {'date': fields.Date.to_string(events[-1]['date']),
+                           'id': events[-1]['id']}
+        for event in events:
+            event['date'] = fields.Date.to_string(event['date'])
+        return {'events': events, 'next_cursor': next_cursor}
+
+    def action_open_record(self):
+        """Open the deliverable or performance guaranty of the event"""
+        self.ensure_one()
+        res_model = 'contract.deliverable' if self.event_type == 'deliverable' \
+            else 'contract.performance.guaranty'
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Deliverable') if self.event_type == 'deliverable'
+            else _('Performance Guaranty'),
+            'res_model': res_model,
+            'res_id': self.res_id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
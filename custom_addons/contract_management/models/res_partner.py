@@ -12,3 +12,11 @@ class ResPartner(models.Model):
         help='Check this box if this partner is a contractor/vendor '
              'that can be used in contracts'
     )
+
+    def write(self, vals):
+        result = super().write(vals)
+        if 'name' in vals:
+            contracts = self.env['contract.management'].sudo().with_context(
+                skip_expiration_check=True).search([('partner_id', 'in', self.ids)])
+            self.env['contract.search.index']._schedule_reindex(contracts.ids)
+        return result
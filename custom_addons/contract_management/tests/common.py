@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import random
+from datetime import timedelta
+
+from odoo import fields
+
+# Size of the generated documents, close to the scanned PDFs users upload
+DOCUMENT_SIZE = 256 * 1024
+ADDITIONAL_DOCUMENT_SIZE = 64 * 1024
+GUARANTY_DOCUMENT_SIZE = 32 * 1024
+
+
+class ContractDataGenerator:
+    """
+    Synthetic contract portfolio for benchmarks.
+
+    Creates ``size`` active contracts spread over a few vendors and
+    managers, each with deliverables, performance guaranties, amendments
+    and binary documents. Dates are spread around today so every expiry
+    alert window and state (expiring, expired, overdue) is populated.
+    """
+
+    def __init__(self, env, seed=42, deliverables_per_contract=8,
+                 guaranties_per_contract=2, amendments_per_contract=2,
+                 partner_count=50, manager_count=10):
+        self.env = env
+        self.random = random.Random(seed)
+        self.deliverables_per_contract = deliverables_per_contract
+        self.guaranties_per_contract = guaranties_per_contract
+        self.amendments_per_contract = amendments_per_contract
+        self.partner_count = partner_count
+        self.manager_count = manager_count
+
+    def _document(self, size):
+        """Incompressible payload with a PDF header"""
+        payload = b'%PDF-1.4\n' + self.random.randbytes(size)
+        return base64.b64encode(payload)
+
+    def _create_partners(self):
+        return self.env['res.partner'].create([{
+            'name': 'Benchmark Vendor %s' % index,
+            'is_company': True,
+            'is_contract': True,
+            'email': 'vendor%s@example.com' % index,
+        } for index in range(self.partner_count)])
+
+    def _create_managers(self):
+        group = self.env.ref('contract_management.group_contract_manager')
+        return self.env['res.users'].with_context(no_reset_password=True).create([{
+            'name': 'Benchmark Manager %s' % index,
+            'login': 'benchmark_manager_%s' % index,
+            'email': 'manager%s@example.com' % index,
+            'groups_id': [(6, 0, [self.env.ref('base.group_user').id, group.id])],
+        } for index in range(self.manager_count)])
+
+    def _contract_vals(self, index, partners, managers, today):
+        contract_type = self.env.ref('contract_management.contract_type_contract')
+        effective_date = today - timedelta(days=self.random.randint(30, 900))
+        expiry_date = today + timedelta(days=self.random.randint(-60, 720))
+        return {
+            'name': 'Benchmark Contract %s' % index,
+            'partner_id': self.random.choice(partners).id,
+            'contract_manager_id': self.random.choice(managers).id,
+            'contract_type_id': contract_type.id,
+            'classification_ids': [(6, 0, self.random.sample(
+                self.classifications.ids, k=1))],
+            'category_ids': [(6, 0, self.random.sample(self.categories.ids, k=1))],
+            'department_ids': [(6, 0, self.random.sample(self.departments.ids, k=1))],
+            'effective_date': effective_date,
+            'expiry_date': max(expiry_date, effective_date + timedelta(days=30)),
+            'contract_value': self.random.randint(50, 5000) * 10000,
+            'description': 'Synthetic contract generated for benchmarks. ' * 5,
+            'contract_documents': self._document(DOCUMENT_SIZE),
+            'contract_document_name': 'contract_%s.pdf' % index,
+            'additional_documents': self._document(ADDITIONAL_DOCUMENT_SIZE)
+            if index % 3 == 0 else False,
+            'additional_document_name': 'annex_%s.pdf' % index if index % 3 == 0 else False,
+        }
+
+    def _deliverable_vals(self, contract, today):
+        span = (contract.expiry_date - contract.effective_date).days
+        amount = contract.contract_value / (self.deliverables_per_contract * 2)
+        vals_list = []
+        for index in range(self.deliverables_per_contract):
+            due = contract.effective_date + timedelta(days=self.random.randint(0, span))
+            vals_list.append({
+                'name': '%s - Deliverable %s' % (contract.name, index),
+                'contract_id': contract.id,
+                'issue_date': contract.effective_date,
+                'deliverable_date': due,
+                'payment_amount': amount,
+                'deliverable': 'Milestone report and supporting evidence.',
+                'status': 'completed' if due < today and index % 2 else 'pending',
+            })
+        return vals_list
+
+    def _guaranty_vals(self, contract, today):
+        return [{
+            'name': '%s - Guaranty %s' % (contract.name, index),
+            'contract_id': contract.id,
+            'performance_guaranty_type': 'bank_guarantee',
+            'performance_guaranty_provider': 'Benchmark Bank',
+            'performance_guaranty_amount': contract.contract_value / 10,
+            'issue_date': contract.effective_date,
+            'expiry_date': today + timedelta(days=self.random.randint(-30, 365)),
+            'performance_guaranty_document': self._document(GUARANTY_DOCUMENT_SIZE),
+            'performance_guaranty_document_name': 'guaranty_%s.pdf' % index,
+        } for index in range(self.guaranties_per_contract)]
+
+    def generate(self, size):
+        """Create ``size`` contracts with their children and return them"""
+        today = fields.Date.today()
+        contract_type = self.env.ref('contract_management.contract_type_contract')
+        type_domain = [('contract_type_ids', 'in', contract_type.ids)]
+        self.classifications = self.env['contract.management.classification'].search(type_domain)
+        self.categories = self.env['contract.management.category'].search(type_domain)
+        self.departments = self.env['contract.management.department'].search(type_domain)
+        partners = self._create_partners()
+        managers = self._create_managers()
+
+        Contract = self.env['contract.management']
+        contracts = Contract.browse()
+        for index in range(size):
+            contracts |= Contract.create(self._contract_vals(index, partners, managers, today))
+
+        self.env['contract.deliverable'].create([
+            vals for contract in contracts
+            for vals in self._deliverable_vals(contract, today)
+        ])
+        self.env['contract.performance.guaranty'].create([
+            vals for contract in contracts
+            for vals in self._guaranty_vals(contract, today)
+        ])
+        for contract in contracts:
+            for index in range(self.amendments_per_contract):
+                contract.with_context(
+                    create_amendment=True,
+                    amendment_type='amendment',
+                    amendment_reason='Benchmark amendment %s' % index,
+                ).write({'notice_period_days': 30 + index})
+        self.env.flush_all()
+        return contracts
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+import tempfile
+import time
+
+from lxml import etree
+
+from odoo import release
+from odoo.modules.module import get_manifest
+from odoo.tests import tagged
+from odoo.tests.common import TransactionCase
+
+from .common import ContractDataGenerator
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', '-standard', 'contract_benchmark')
+class TestContractBenchmark(TransactionCase):
+    """
+    Timings and query counts of the hot contract paths.
+
+    Not part of the standard run. Start it with
+    ``--test-tags contract_benchmark``; the number of contracts comes from
+    ``CONTRACT_BENCHMARK_SIZE`` and the results are written as JSON to
+    ``CONTRACT_BENCHMARK_OUTPUT`` so runs can be compared across releases.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.size = int(os.environ.get('CONTRACT_BENCHMARK_SIZE', 200))
+        started = time.perf_counter()
+        cls.contracts = ContractDataGenerator(cls.env).generate(cls.size)
+        cls.generation_seconds = time.perf_counter() - started
+        cls.results = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._write_results()
+        super().tearDownClass()
+
+    @classmethod
+    def _write_results(cls):
+        version = get_manifest('contract_management')['version']
+        path = os.environ.get('CONTRACT_BENCHMARK_OUTPUT') or os.path.join(
+            tempfile.gettempdir(), 'contract_benchmark_%s.json' % version)
+        with open(path, 'w') as output:
+            json.dump({
+                'module_version': version,
+                'odoo_version': release.version,
+                'size': cls.size,
+                'generation_seconds': round(cls.generation_seconds, 3),
+                'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'results': cls.results,
+            }, output, indent=2, sort_keys=True)
+        _logger.info('Contract benchmark results written to %s', path)
+
+    def _measure(self, name, function):
+        """Run ``function`` on a cold cache and record its time and queries"""
+        self.env.flush_all()
+        self.env.invalidate_all()
+        queries = self.env.cr.sql_log_count
+        started = time.perf_counter()
+        function()
+        self.env.flush_all()
+        self.results[name] = {
+            'seconds': round(time.perf_counter() - started, 4),
+            'queries': self.env.cr.sql_log_count - queries,
+        }
+        _logger.info('Contract benchmark %s: %s', name, self.results[name])
+
+    def _view_specification(self, view_type):
+        """Fields the web client requests for the default view"""
+        view = self.env['contract.management'].get_view(view_type=view_type)
+        arch = etree.fromstring(view['arch'])
+        names = arch.xpath('//field[not(ancestor::field)]/@name')
+        return {name: {} for name in names}
+
+    def test_contract_list_read(self):
+        specification = self._view_specification('list')
+        Contract = self.env['contract.management']
+        self._measure('contract_list_read', lambda: Contract.web_search_read(
+            [], specification, limit=80))
+
+    def test_contract_form_read(self):
+        specification = self._view_specification('form')
+        contract = self.contracts[0]
+        self._measure('contract_form_read', lambda: contract.web_read(specification))
+
+    def test_read_expiry_check(self):
+        contracts = self.contracts
+        self._measure('read_expiry_check', lambda: contracts.read(['name', 'state']))
+        self._measure('read_skip_expiry_check', lambda: contracts.with_context(
+            skip_expiration_check=True).read(['name', 'state']))
+
+    def test_write_with_amendment(self):
+        contracts = self.contracts[:50]
+
+        def write_amendments():
+            for contract in contracts:
+                contract.with_context(
+                    create_amendment=True,
+                    amendment_type='amendment',
+                    amendment_reason='Benchmark amendment',
+                ).write({'notice_period_days': 60})
+        self._measure('write_with_amendment', write_amendments)
+
+    def test_expiry_crons(self):
+        self._measure('cron_contract_expiry', lambda: self.env[
+            'contract.expiration.cron'].cron_check_expiring_contracts())
+        self._measure('cron_deliverable_expiry', lambda: self.env[
+            'deliverable.expiration.cron'].cron_check_expiring_deliverables())
+        self._measure('cron_guaranty_expiry', lambda: self.env[
+            'performance.guaranty.expiration.cron'].cron_check_expiring_performance_guaranties())
+
+    def test_contract_report_pivot(self):
+        Report = self.env['contract.report']
+        self._measure('contract_report_refresh', Report.cron_refresh_contract_report)
+        self._measure('contract_report_pivot', lambda: Report.read_group(
+            [], ['contract_value:sum'], ['partner_id', 'state'], lazy=False))
@@ -5,8 +5,12 @@ from . import hr_appraisal_goal
 from . import hr_appraisal_goal_kpi
 from . import hr_department_objective
 from . import hr_institutional_objective
+from . import hr_department_objective_rollup
 from . import notification_manager
+from . import hr_appraisal_alert_log
 from . import performance_dashboard
+from . import hr_appraisal_dashboard_snapshot
+from . import hr_appraisal_department_rank
 from . import hr_appraisal
 from . import hr_common_objective
 from . import hr_appraisal_config
@@ -499,10 +499,10 @@ class HrAppraisal(models.Model):
     @api.depends("final_overall_score")
     def _compute_rating_scale(self):
         """Compute the rating scale based on final score"""
+        RatingScale = self.env['hr.appraisal.rating.scale']
         for record in self:
             if record.final_overall_score > 0:
-                rating = self.env['hr.appraisal.rating.scale'].get_rating_for_score(record.final_overall_score)
-                record.rating_scale_id = rating.id if rating else False
+                record.rating_scale_id = RatingScale._get_rating_id_for_score(record.final_overall_score)
             else:
                 record.rating_scale_id = False
 
@@ -613,48 +613,15 @@ class HrAppraisal(models.Model):
 
     @api.depends("employee_goal_ids.final_score")
     def _compute_performance_rank(self):
+        ranks = self.env["hr.appraisal.department.rank"].sudo()._get_ranks(
+            self.employee_id
+        )
         for record in self:
-            if record.employee_id:
-                # Get all employees in the same department
-                dept_employees = (
-                    self.env["hr.appraisal.goal"]
-                    .search(
-                        [
-                            ("department_id", "=", record.employee_id.department_id.id),
-                            ("state", "=", "final"),
-                            ("final_score", ">", 0),
-                        ]
-                    )
-                    .mapped("employee_id")
-                )
-
-                if dept_employees:
-                    # Calculate average scores for ranking
-                    employee_scores = []
-                    for emp in dept_employees:
-                        emp_goals = self.env["hr.appraisal.goal"].search(
-                            [
-                                ("employee_id", "=", emp.id),
-                                ("state", "=", "final"),
-                                ("final_score", ">", 0),
-                            ]
-                        )
-                        if emp_goals:
-                            avg_score = sum(
-                                goal.final_score for goal in emp_goals
-                            ) / len(emp_goals)
-                            employee_scores.append((emp, avg_score))
-
-                    # Sort by score and find rank
-                    employee_scores.sort(key=lambda x: x[1], reverse=True)
-                    for i, (emp, score) in enumerate(employee_scores, 1):
-                        if emp.id == record.employee_id.id:
-                            record.employee_performance_rank = i
-                            break
-                else:
-                    record.employee_performance_rank = 0
-            else:
-                record.employee_performance_rank = 0
+            employee = record.employee_id
+            record.employee_performance_rank = ranks.get(
+                (employee.id, employee.department_id.id, record.fiscal_year_id.id),
+                0,
+            ) if employee else 0
 
     @api.depends("employee_goal_ids.progression", "employee_goal_ids.create_date")
     def _compute_performance_trends(self):
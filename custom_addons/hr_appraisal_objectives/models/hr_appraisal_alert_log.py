@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+
+
+class HrAppraisalAlertLog(models.Model):
+    """Ledger of the reminders and alerts sent per objective and recipient.
+
+    One row per (alert type, objective, recipient) holding the date of the
+    last digest that included it, so a reminder is not repeated inside the
+    configured window.
+    """
+    _name = "hr.appraisal.alert.log"
+    _description = "HR Appraisal Alert Log"
+    _order = "last_sent desc"
+    _rec_name = "alert_type"
+
+    alert_type = fields.Selection([
+        ("deadline", "Deadline Reminder"),
+        ("performance", "Performance Alert"),
+    ], string="Alert Type", required=True, readonly=True)
+    res_model = fields.Char("Model", required=True, readonly=True)
+    res_id = fields.Many2oneReference("Record", model_field="res_model", required=True, readonly=True)
+    user_id = fields.Many2one(
+        "res.users", string="Recipient", required=True, readonly=True, ondelete="cascade"
+    )
+    last_sent = fields.Date("Last Sent", required=True, readonly=True)
+
+    def init(self):
+        self.env.cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS hr_appraisal_alert_log_key_index
+                ON hr_appraisal_alert_log (alert_type, res_model, res_id, user_id)
+        """)
+
+    @api.model
+    def _get_recent_alerts(self, alert_type, records, since):
+        """``(model, res_id, user_id)`` of the alerts on ``records`` sent on or
+        after ``since``"""
+        if not records:
+            return set()
+        self.flush_model()
+        self.env.cr.execute("""
+            SELECT res_model, res_id, user_id
+            FROM hr_appraisal_alert_log
+            WHERE alert_type = %s AND res_model = %s AND res_id IN %s AND last_sent >= %s
+        """, (alert_type, records._name, tuple(records.ids), since))
+        return set(self.env.cr.fetchall())
+
+    @api.model
+    def _log_alerts(self, alert_type, keys, date):
+        """Record that the alerts ``(model, res_id, user_id)`` were sent on ``date``"""
+        if not keys:
+            return
+        self.env.cr.execute("""
+            INSERT INTO hr_appraisal_alert_log AS l (
+                alert_type, res_model, res_id, user_id, last_sent,
+                create_uid, write_uid, create_date, write_date
+            )
+            SELECT %(alert_type)s, k.res_model, k.res_id, k.user_id, %(date)s,
+                   %(uid)s, %(uid)s, now() at time zone 'UTC', now() at time zone 'UTC'
+            FROM unnest(%(models)s::varchar[], %(res_ids)s::int[], %(user_ids)s::int[])
+                AS k (res_model, res_id, user_id)
+            ON CONFLICT (alert_type, res_model, res_id, user_id)
+            DO UPDATE SET last_sent = EXCLUDED.last_sent, write_date = EXCLUDED.write_date
+        """, {
+            "alert_type": alert_type,
+            "date": date,
+            "uid": self.env.uid,
+            "models": [key[0] for key in keys],
+            "res_ids": [key[1] for key in keys],
+            "user_ids": [key[2] for key in keys],
+        })
+        self.invalidate_model()
+
+    @api.model
+    def _prune_alerts(self, alert_type, since):
+        """Drop the alerts sent before ``since``, outside the repeat window
+        (including those of deleted or finished objectives)"""
+        self.flush_model()
+        self.env.cr.execute("""
+            DELETE FROM hr_appraisal_alert_log
+            WHERE alert_type = %s AND last_sent < %s
+        """, (alert_type, since))
+        self.invalidate_model()
@@ -39,6 +39,12 @@ class HrAppraisalConfig(models.Model):
         "Send Reminder Notifications", default=True
     )
     reminder_days_before = fields.Integer("Reminder Days Before Deadline", default=7)
+    alert_repeat_days = fields.Integer(
+        "Repeat Reminders Every (Days)",
+        default=7,
+        help="A reminder or alert about the same objective is sent again to "
+        "the same person only after this number of days",
+    )
 
     # Performance alert settings
     low_progress_threshold = fields.Float("Low Progress Threshold (%)", default=30.0)
@@ -47,7 +53,8 @@ class HrAppraisalConfig(models.Model):
     )
 
     @api.constrains(
-        "auto_complete_delay_days", "reminder_days_before", "alert_days_before_deadline"
+        "auto_complete_delay_days", "reminder_days_before", "alert_days_before_deadline",
+        "alert_repeat_days",
     )
     def _check_positive_days(self):
         for record in self:
@@ -59,6 +66,8 @@ class HrAppraisalConfig(models.Model):
                 )
             if record.alert_days_before_deadline < 0:
                 raise ValidationError("Alert days before deadline cannot be negative.")
+            if record.alert_repeat_days < 0:
+                raise ValidationError("Reminder repeat days cannot be negative.")
 
     @api.constrains("min_progress_for_auto_complete", "low_progress_threshold")
     def _check_progress_percentages(self):
@@ -90,9 +99,17 @@ class HrAppraisalConfig(models.Model):
                     "send_completion_notifications": True,
                     "send_reminder_notifications": True,
                     "reminder_days_before": 7,
+                    "alert_repeat_days": 7,
                     "low_progress_threshold": 30.0,
                     "alert_days_before_deadline": 14,
                 }
             )
 
         return config
+
+    def action_preview_auto_completion(self):
+        """Show what the auto-completion crons would complete, without changes"""
+        self.ensure_one()
+        return self.env["performance.notification"].with_company(
+            self.company_id
+        ).preview_auto_completion()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Goal fields whose changes make the dashboard snapshots of the goal stale
+SNAPSHOT_GOAL_FIELDS = {
+    "state", "self_score", "manager_score", "supervisor_score", "progression",
+    "deadline", "employee_id", "department_objective_id",
+    "institutional_objective_id", "common_origin_id",
+}
+
+
+class HrAppraisalDashboardSnapshot(models.Model):
+    """Persistent executive dashboard data.
+
+    One row per (fiscal year, department, employee) filter of the
+    performance dashboard. Goal changes only flag the matching snapshots as
+    stale; the refresh cron rebuilds the stale ones, so opening the
+    dashboard reads a single row.
+    """
+    _name = "hr.appraisal.dashboard.snapshot"
+    _description = "HR Appraisal Dashboard Snapshot"
+    _order = "fiscal_year_id desc, department_id, employee_id"
+    _rec_name = "fiscal_year_id"
+
+    fiscal_year_id = fields.Many2one(
+        "hr.fiscal.year", string="Fiscal Year", required=True, ondelete="cascade"
+    )
+    department_id = fields.Many2one(
+        "hr.department", string="Department", ondelete="cascade"
+    )
+    employee_id = fields.Many2one(
+        "hr.employee", string="Employee", ondelete="cascade"
+    )
+    data = fields.Text("Dashboard Data", readonly=True)
+    computed_at = fields.Datetime("Computed At", readonly=True)
+    is_dirty = fields.Boolean("Needs Refresh", default=True, index=True)
+
+    def init(self):
+        self.env.cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS hr_appraisal_dashboard_snapshot_key_index
+                ON hr_appraisal_dashboard_snapshot (
+                    fiscal_year_id, COALESCE(department_id, 0), COALESCE(employee_id, 0))
+        """)
+
+    def _get_goal_domain(self):
+        self.ensure_one()
+        domain = [("fiscal_year_id", "=", self.fiscal_year_id.id)]
+        if self.department_id:
+            domain.append(("department_id", "=", self.department_id.id))
+        if self.employee_id:
+            domain.append(("employee_id", "=", self.employee_id.id))
+        return domain
+
+    @api.model
+    def _get_snapshot(self, fiscal_year, department=False, employee=False):
+        """Return the snapshot of a dashboard filter, built on first use"""
+        snapshot = self.search([
+            ("fiscal_year_id", "=", fiscal_year.id),
+            ("department_id", "=", department.id if department else False),
+            ("employee_id", "=", employee.id if employee else False),
+        ], limit=1)
+        if not snapshot:
+            snapshot = self.create({
+                "fiscal_year_id": fiscal_year.id,
+                "department_id": department.id if department else False,
+                "employee_id": employee.id if employee else False,
+            })
+            snapshot._recompute()
+        return snapshot
+
+    def _recompute(self):
+        """Rebuild the dashboard data of the snapshots"""
+        dashboard = self.env["hr.appraisal.dashboard"]
+        for snapshot in self:
+            data = dashboard._build_dashboard_data(snapshot._get_goal_domain())
+            snapshot.write({
+                "data": json.dumps(data),
+                "computed_at": fields.Datetime.now(),
+                "is_dirty": False,
+            })
+
+    @api.model
+    def _mark_goals_dirty(self, goals):
+        """Flag the snapshots covering ``goals`` as stale in one statement"""
+        goals = goals.filtered("fiscal_year_id")
+        if not goals:
+            return
+        goals.flush_recordset(["fiscal_year_id", "department_id", "employee_id"])
+        self.flush_model(["is_dirty"])
+        self.env.cr.execute("""
+            UPDATE hr_appraisal_dashboard_snapshot s
+            SET is_dirty = TRUE
+            FROM (
+                SELECT DISTINCT fiscal_year_id, department_id, employee_id
+                FROM hr_appraisal_goal WHERE id IN %s
+            ) g
+            WHERE NOT s.is_dirty
+              AND s.fiscal_year_id = g.fiscal_year_id
+              AND (s.department_id IS NULL OR s.department_id = g.department_id)
+              AND (s.employee_id IS NULL OR s.employee_id = g.employee_id)
+        """, (tuple(goals.ids),))
+        if self.env.cr.rowcount:
+            self.invalidate_model(["is_dirty"])
+            cron = self.env.ref(
+                "hr_appraisal_objectives.ir_cron_refresh_dashboard_snapshots",
+                raise_if_not_found=False,
+            )
+            if cron:
+                cron._trigger()
+
+    @api.model
+    def cron_refresh_dashboard_snapshots(self):
+        """Rebuild the stale snapshots"""
+        snapshots = self.search([("is_dirty", "=", True)])
+        for snapshot in snapshots:
+            try:
+                with self.env.cr.savepoint():
+                    snapshot._recompute()
+            except Exception as e:
+                _logger.warning(f"Failed to refresh dashboard snapshot {snapshot.id}: {str(e)}")
+        return True
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+from odoo.tools import SQL
+
+# Goal fields whose changes on final goals move the department ranking
+RANK_GOAL_FIELDS = {
+    "state", "self_score", "manager_score", "supervisor_score",
+    "employee_id", "department_objective_id",
+}
+
+
+class HrAppraisalDepartmentRank(models.Model):
+    """Employee performance ranking within departments.
+
+    One row per (department, fiscal year, employee) with the average final
+    score of the employee's final goals and its rank in the department for
+    that fiscal year. Rows without fiscal year rank the employees over all
+    fiscal years. The rows of a department are rebuilt when its goals are
+    finalized or rescored.
+    """
+    _name = "hr.appraisal.department.rank"
+    _description = "HR Appraisal Department Ranking"
+    _order = "department_id, fiscal_year_id desc, rank"
+    _rec_name = "employee_id"
+
+    department_id = fields.Many2one(
+        "hr.department", string="Department", required=True, readonly=True, ondelete="cascade"
+    )
+    fiscal_year_id = fields.Many2one(
+        "hr.fiscal.year", string="Fiscal Year", readonly=True, ondelete="cascade"
+    )
+    employee_id = fields.Many2one(
+        "hr.employee", string="Employee", required=True, readonly=True, index=True, ondelete="cascade"
+    )
+    avg_score = fields.Float("Average Final Score", readonly=True)
+    goal_count = fields.Integer("Final Goals", readonly=True)
+    rank = fields.Integer("Rank", readonly=True)
+
+    def init(self):
+        self.env.cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS hr_appraisal_department_rank_key_index
+                ON hr_appraisal_department_rank (
+                    department_id, COALESCE(fiscal_year_id, 0), employee_id)
+        """)
+        self._refresh_ranks()
+
+    @api.model
+    def _refresh_ranks(self, departments=None):
+        """Rebuild the ranking of ``departments`` (all departments by default)"""
+        if departments is not None:
+            departments = departments.filtered("id")
+            if not departments:
+                return
+        self.env["hr.appraisal.goal"].flush_model(
+            ["state", "final_score", "department_id", "fiscal_year_id", "employee_id"]
+        )
+        department_filter = SQL("TRUE")
+        if departments is not None:
+            department_filter = SQL("department_id IN %s", tuple(departments.ids))
+        self.env.cr.execute(SQL("""
+            DELETE FROM hr_appraisal_department_rank WHERE %(filter)s;
+            INSERT INTO hr_appraisal_department_rank (
+                department_id, fiscal_year_id, employee_id, avg_score, goal_count, rank
+            )
+            SELECT department_id, fiscal_year_id, employee_id, avg_score, goal_count,
+                   RANK() OVER (
+                       PARTITION BY department_id, fiscal_year_id ORDER BY avg_score DESC)
+            FROM (
+                SELECT department_id,
+                       CASE WHEN GROUPING(fiscal_year_id) = 0 THEN fiscal_year_id END AS fiscal_year_id,
+                       employee_id,
+                       AVG(final_score) AS avg_score,
+                       COUNT(*) AS goal_count
+                FROM hr_appraisal_goal
+                WHERE state = 'final' AND final_score > 0
+                  AND department_id IS NOT NULL AND employee_id IS NOT NULL
+                  AND %(filter)s
+                GROUP BY GROUPING SETS (
+                    (department_id, fiscal_year_id, employee_id),
+                    (department_id, employee_id))
+                HAVING GROUPING(fiscal_year_id) = 1 OR fiscal_year_id IS NOT NULL
+            ) scores
+        """, filter=department_filter))
+        self.invalidate_model()
+
+    @api.model
+    def _get_ranks(self, employees):
+        """Ranks of ``employees``: ``{(employee, department, fiscal year): rank}``
+        where the fiscal year is ``False`` for the all-years ranking"""
+        if not employees:
+            return {}
+        self.flush_model()
+        self.env.cr.execute("""
+            SELECT employee_id, department_id, fiscal_year_id, rank
+            FROM hr_appraisal_department_rank
+            WHERE employee_id IN %s
+        """, (tuple(employees.ids),))
+        return {
+            (employee_id, department_id, fiscal_year_id or False): rank
+            for employee_id, department_id, fiscal_year_id, rank in self.env.cr.fetchall()
+        }
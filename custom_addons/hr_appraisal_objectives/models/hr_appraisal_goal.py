@@ -1,10 +1,20 @@
 from odoo import models, fields, api
 from odoo.exceptions import UserError, ValidationError
+from odoo.tools import float_compare
+from collections import defaultdict
 import logging
 from markupsafe import Markup
+from .hr_appraisal_dashboard_snapshot import SNAPSHOT_GOAL_FIELDS
+from .hr_appraisal_department_rank import RANK_GOAL_FIELDS
+from .hr_department_objective_rollup import ROLLUP_GOAL_FIELDS
 
 _logger = logging.getLogger(__name__)
 
+# Date of the last KPI progress sync, the high-water mark of the changes
+KPI_SYNC_PARAM = "hr_appraisal_objectives.kpi_sync_date"
+# Day of the last full KPI progress sync
+KPI_FULL_SYNC_PARAM = "hr_appraisal_objectives.kpi_full_sync_date"
+
 
 class HrAppraisalGoal(models.Model):
     _inherit = "hr.appraisal.goal"
@@ -365,13 +375,17 @@ class HrAppraisalGoal(models.Model):
             else:
                 rec.name_short = rec.name
 
-    @api.model
-    def create(self, vals):
-        if vals.get("reference", "New") == "New":
-            vals["reference"] = (
-                self.env["ir.sequence"].next_by_code("hr.appraisal.goal") or "/"
-            )
-        return super().create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        for vals in vals_list:
+            if vals.get("reference", "New") == "New":
+                vals["reference"] = (
+                    self.env["ir.sequence"].next_by_code("hr.appraisal.goal") or "/"
+                )
+        goals = super().create(vals_list)
+        self.env["hr.appraisal.dashboard.snapshot"].sudo()._mark_goals_dirty(goals)
+        self.env["hr.department.objective.rollup"].sudo()._enqueue_goal_deltas(goals, 1)
+        return goals
 
     @api.depends("self_score", "manager_score", "supervisor_score")
     def _compute_final_score(self):
@@ -408,10 +422,10 @@ class HrAppraisalGoal(models.Model):
     @api.depends("final_score")
     def _compute_rating_scale(self):
         """Compute the rating scale based on final score"""
+        RatingScale = self.env['hr.appraisal.rating.scale']
         for record in self:
             if record.final_score > 0:
-                rating = self.env['hr.appraisal.rating.scale'].get_rating_for_score(record.final_score)
-                record.rating_scale_id = rating.id if rating else False
+                record.rating_scale_id = RatingScale._get_rating_id_for_score(record.final_score)
             else:
                 record.rating_scale_id = False
 
@@ -1119,26 +1133,40 @@ class HrAppraisalGoal(models.Model):
 
     @api.model
     def cron_sync_kpi_progress(self):
-        goals = self.search([('state','in',['progress','self_scored','scored'])])
-        for goal in goals:
-            for kpi in goal.kpi_line_ids:
-                if kpi.progress_method == "manual":
-                    continue
-                total = len(kpi.task_ids)
-                value = 0.0
-                if kpi.progress_method == "timesheet_ratio":
-                    planned = kpi.planned_hours or 0.0
-                    if planned > 0:
-                        aal = self.env['account.analytic.line'].read_group(
-                            domain=[('task_id','in',kpi.task_ids.ids), ('employee_id', '=', kpi.employee_id.id)],
-                            fields=['unit_amount:sum'], groupby=[])
-                        done_hours = (aal[0]['unit_amount_sum'] if aal else 0.0) or 0.0
-                        value = round(min(done_hours / planned, 1.0) * 100.0, 2)
-                else:
-                    if total:
-                        done = len(kpi.task_ids.filtered(lambda t: getattr(t.stage_id, 'fold', False)))
-                        value = round(100.0 * done / total, 2)
-                kpi.write({'progress_percentage': value})
+        """Refresh the automatic KPI progress of the running goals.
+
+        Only the KPIs whose goal, tasks or timesheets changed since the
+        previous run are looked at, and only the progress values that
+        actually changed are written, one write per value. Deleted tasks
+        and timesheets leave no write date behind, so every running KPI
+        is synced on the first run of each day.
+        """
+        params = self.env["ir.config_parameter"].sudo()
+        last_sync = params.get_param(KPI_SYNC_PARAM)
+        sync_date = self.env.cr.now()
+        sync_day = fields.Date.to_string(sync_date.date())
+        full_sync = not last_sync or params.get_param(KPI_FULL_SYNC_PARAM) != sync_day
+        KPI = self.env["hr.appraisal.goal.kpi"]
+        kpis = KPI._get_sync_candidates(
+            None if full_sync else fields.Datetime.to_datetime(last_sync)
+        )
+        progress = kpis._get_auto_progress()
+
+        changed = defaultdict(list)
+        for kpi in kpis:
+            value = progress[kpi.id]
+            if float_compare(value, kpi.progress_percentage, precision_digits=2):
+                changed[value].append(kpi.id)
+        for value, kpi_ids in changed.items():
+            KPI.browse(kpi_ids)._write_sync_progress(value)
+
+        params.set_param(KPI_SYNC_PARAM, fields.Datetime.to_string(sync_date))
+        if full_sync:
+            params.set_param(KPI_FULL_SYNC_PARAM, sync_day)
+        _logger.info(
+            "KPI progress sync: %s KPIs checked, %s updated",
+            len(kpis), sum(len(ids) for ids in changed.values()),
+        )
         return True
 
     @api.model
@@ -1191,7 +1219,45 @@ class HrAppraisalGoal(models.Model):
                     raise UserError(
                         f"You cannot modify the following fields after the objective has been approved: {', '.join(restricted_being_modified)}"
                     )
-        return super().write(vals)
+        # Departments whose ranking moves: the ones of final goals before
+        # and after the write
+        ranked_departments = None
+        if RANK_GOAL_FIELDS.intersection(vals):
+            ranked_departments = self._get_ranked_departments()
+        # Department objective rollups: remove the previous goal values and
+        # add the new ones
+        rollups = None
+        if ROLLUP_GOAL_FIELDS.intersection(vals):
+            rollups = self.env["hr.department.objective.rollup"].sudo()
+            rollups._enqueue_goal_deltas(self, -1)
+        if not SNAPSHOT_GOAL_FIELDS.intersection(vals):
+            result = super().write(vals)
+        else:
+            # Snapshots of the previous and new filters of the goals are stale
+            snapshots = self.env["hr.appraisal.dashboard.snapshot"].sudo()
+            snapshots._mark_goals_dirty(self)
+            result = super().write(vals)
+            snapshots._mark_goals_dirty(self)
+        if rollups is not None:
+            rollups._enqueue_goal_deltas(self, 1)
+        if ranked_departments is not None:
+            ranked_departments |= self._get_ranked_departments()
+            if ranked_departments:
+                self.env["hr.appraisal.department.rank"].sudo()._refresh_ranks(ranked_departments)
+        return result
+
+    def unlink(self):
+        self.env["hr.appraisal.dashboard.snapshot"].sudo()._mark_goals_dirty(self)
+        self.env["hr.department.objective.rollup"].sudo()._enqueue_goal_deltas(self, -1)
+        ranked_departments = self._get_ranked_departments()
+        result = super().unlink()
+        if ranked_departments:
+            self.env["hr.appraisal.department.rank"].sudo()._refresh_ranks(ranked_departments)
+        return result
+
+    def _get_ranked_departments(self):
+        """Departments whose ranking includes the goals"""
+        return self.sudo().filtered(lambda g: g.state == "final").department_id
 
     # def unlink(self):
     #     blocked_states = {"first_approved", "progress", "progress_done", "self_scored", "scored", "final"}
@@ -1,5 +1,6 @@
 from odoo import models, fields, api
 from odoo.exceptions import UserError
+from odoo.tools import SQL
 
 
 class HrAppraisalGoalKPI(models.Model):
@@ -92,6 +93,83 @@ class HrAppraisalGoalKPI(models.Model):
             done = len(rec.task_ids.filtered(lambda t: getattr(t.stage_id, "fold", False)))
             rec.progress_percentage = round(100.0 * done / total, 2)
 
+    def _get_sync_candidates(self, since=None):
+        """Automatic KPIs of running goals whose KPI, goal, tasks or task
+        timesheets changed after ``since`` (all of them without ``since``)"""
+        for model in ("hr.appraisal.goal", "project.task", "account.analytic.line"):
+            self.env[model].flush_model(["write_date"])
+        self.flush_model()
+        changed = SQL("TRUE")
+        if since:
+            changed = SQL("""(
+                k.write_date > %(since)s OR g.write_date > %(since)s
+                OR EXISTS (
+                    SELECT 1 FROM hr_appraisal_kpi_task_rel r
+                    JOIN project_task t ON t.id = r.task_id
+                    WHERE r.kpi_id = k.id AND t.write_date > %(since)s)
+                OR EXISTS (
+                    SELECT 1 FROM hr_appraisal_kpi_task_rel r
+                    JOIN account_analytic_line l ON l.task_id = r.task_id
+                    WHERE r.kpi_id = k.id AND l.write_date > %(since)s)
+            )""", since=since)
+        self.env.cr.execute(SQL("""
+            SELECT k.id
+            FROM hr_appraisal_goal_kpi k
+            JOIN hr_appraisal_goal g ON g.id = k.appraisal_goal_id
+            WHERE g.state IN %(states)s
+              AND k.progress_method != 'manual'
+              AND %(changed)s
+        """, states=("progress", "self_scored", "scored"), changed=changed))
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _get_auto_progress(self):
+        """Automatic progress of the KPIs, ``{kpi_id: percentage}``.
+
+        Timesheet hours of every (tasks, employee) pair and the done task
+        ratios are aggregated for the whole recordset in two queries.
+        """
+        if not self.ids:
+            return {}
+        self.flush_recordset(["task_ids", "employee_id"])
+        self.env["project.task"].flush_model(["stage_id", "active"])
+        self.env["account.analytic.line"].flush_model(["task_id", "employee_id", "unit_amount"])
+        cr = self.env.cr
+        kpi_ids = tuple(self.ids)
+        cr.execute("""
+            SELECT r.kpi_id, SUM(l.unit_amount)
+            FROM hr_appraisal_kpi_task_rel r
+            JOIN hr_appraisal_goal_kpi k ON k.id = r.kpi_id
+            JOIN project_task t ON t.id = r.task_id AND t.active
+            JOIN account_analytic_line l ON l.task_id = t.id AND l.employee_id = k.employee_id
+            WHERE r.kpi_id IN %s
+            GROUP BY r.kpi_id
+        """, (kpi_ids,))
+        hours = dict(cr.fetchall())
+        cr.execute("""
+            SELECT r.kpi_id, COUNT(*), COUNT(*) FILTER (WHERE s.fold)
+            FROM hr_appraisal_kpi_task_rel r
+            JOIN project_task t ON t.id = r.task_id AND t.active
+            LEFT JOIN project_task_type s ON s.id = t.stage_id
+            WHERE r.kpi_id IN %s
+            GROUP BY r.kpi_id
+        """, (kpi_ids,))
+        tasks = {kpi_id: (total, done) for kpi_id, total, done in cr.fetchall()}
+
+        result = {}
+        for rec in self:
+            value = 0.0
+            if rec.progress_method == "timesheet_ratio":
+                planned = rec.planned_hours or 0.0
+                if planned > 0:
+                    done_hours = hours.get(rec.id) or 0.0
+                    value = round(min(done_hours / planned, 1.0) * 100.0, 2)
+            elif rec.progress_method != "manual":
+                total, done = tasks.get(rec.id, (0, 0))
+                if total:
+                    value = round(100.0 * done / total, 2)
+            result[rec.id] = value
+        return result
+
     def write(self, vals):
         # Block edits after approval except safe linkage updates (task_ids)
         blocked_states = {"first_approved", "progress", "self_scored", "scored", "final"}
@@ -106,6 +184,11 @@ class HrAppraisalGoalKPI(models.Model):
                     )
         return super().write(vals)
 
+    def _write_sync_progress(self, value):
+        """Store the automatic progress computed by the sync job; bypasses
+        the approval guard of write(), which is meant for user edits"""
+        return super(HrAppraisalGoalKPI, self).write({"progress_percentage": value})
+
     def unlink(self):
         blocked_states = {"first_approved", "progress", "self_scored", "scored", "final"}
         for rec in self:
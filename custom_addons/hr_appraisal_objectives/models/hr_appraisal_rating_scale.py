@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from odoo import models, fields, api
+from bisect import bisect_right
+
+from odoo import models, fields, api, tools
 from odoo.exceptions import ValidationError
 
 
@@ -23,18 +25,58 @@ class HrAppraisalRatingScale(models.Model):
             if record.min_score < 0 or record.max_score > 100:
                 raise ValidationError("Scores must be between 0 and 100.")
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        if {'min_score', 'max_score'}.intersection(vals):
+            self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
+
+    @api.model
+    @tools.ormcache()
+    def _get_rating_index(self):
+        """Interval index of the rating bands, loaded once per registry.
+
+        Returns the band minimums in ascending order and the matching
+        ``(min_score, max_score, id)`` bands, for bisect lookups.
+        """
+        bands = tuple(sorted(
+            (scale['min_score'], scale['max_score'], scale['id'])
+            for scale in self.sudo().search_read([], ['min_score', 'max_score'])
+        ))
+        return tuple(band[0] for band in bands), bands
+
+    @api.model
+    def _get_rating_id_for_score(self, score):
+        """Id of the band with the highest minimum containing ``score``"""
+        if not score:
+            return False
+        minimums, bands = self._get_rating_index()
+        index = bisect_right(minimums, score)
+        # Bands below may still contain the score when bands overlap
+        while index:
+            index -= 1
+            min_score, max_score, rating_id = bands[index]
+            if score <= max_score:
+                return rating_id
+        return False
+
     @api.model
     def get_rating_for_score(self, score):
         """Get the rating scale for a given score"""
         if not score:
             return False
-        
-        rating = self.search([
-            ('min_score', '<=', score),
-            ('max_score', '>=', score)
-        ], limit=1)
-        
-        return rating
+        return self.browse(self._get_rating_id_for_score(score))
 
     @api.model
     def create_default_scales(self):
@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
+from collections import defaultdict
+import logging
+
+from markupsafe import Markup, escape
+
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
 
+_logger = logging.getLogger(__name__)
+
+# Employees handled per run of the publishing job
+PUBLISH_BATCH_SIZE = 100
+
 
 class HrCommonObjective(models.Model):
     _name = "hr.common.objective"
@@ -38,6 +48,30 @@ class HrCommonObjective(models.Model):
         help="Leave empty to target all employees",
     )
 
+    # Background publishing
+    publish_state = fields.Selection([
+        ("draft", "Not Published"),
+        ("queued", "Queued"),
+        ("running", "Publishing"),
+        ("done", "Published"),
+    ], string="Publishing Status", default="draft", readonly=True, copy=False)
+    publish_date = fields.Datetime("Publishing Started", readonly=True, copy=False)
+    publish_last_employee_id = fields.Integer(readonly=True, copy=False)
+    publish_total = fields.Integer("Employees to Process", readonly=True, copy=False)
+    publish_done = fields.Integer("Employees Processed", readonly=True, copy=False)
+    publish_created = fields.Integer("Objectives Published", readonly=True, copy=False)
+    publish_skipped_no_manager = fields.Integer("Skipped Without Manager", readonly=True, copy=False)
+    publish_skipped_no_user = fields.Integer("Skipped Without User", readonly=True, copy=False)
+    publish_progress = fields.Float("Publishing Progress", compute="_compute_publish_progress")
+
+    @api.depends("publish_total", "publish_done")
+    def _compute_publish_progress(self):
+        for record in self:
+            if record.publish_total:
+                record.publish_progress = 100.0 * record.publish_done / record.publish_total
+            else:
+                record.publish_progress = 100.0 if record.publish_state == "done" else 0.0
+
     @api.constrains("start_date", "end_date")
     def _check_dates(self):
         for record in self:
@@ -59,78 +93,237 @@ class HrCommonObjective(models.Model):
                 if fy_end and record.end_date > fy_end:
                     raise UserError(_("End date cannot be after the fiscal year's end date (%s).") % fy_end)
 
+    def write(self, vals):
+        # The published goals follow the fiscal year of the common objective
+        # through a stored compute: the snapshots and rankings of their
+        # previous and new fiscal year are stale
+        goals = None
+        if "fiscal_year_id" in vals:
+            snapshots = self.env["hr.appraisal.dashboard.snapshot"].sudo()
+            goals = self.env["hr.appraisal.goal"].sudo().search(
+                [("is_common", "=", True), ("common_origin_id", "in", self.ids)]
+            )
+            snapshots._mark_goals_dirty(goals)
+            ranked_departments = goals._get_ranked_departments()
+        result = super().write(vals)
+        if goals:
+            snapshots._mark_goals_dirty(goals)
+            ranked_departments |= goals._get_ranked_departments()
+            if ranked_departments:
+                self.env["hr.appraisal.department.rank"].sudo()._refresh_ranks(ranked_departments)
+        return result
+
     def action_publish_objectives(self):
-        """Create individual objectives for employees based on this template.
-        Copies KPI templates into KPIs of the created goals.
+        """Queue the creation of individual objectives for the target employees.
+
+        The objectives are created by a background job in batches; the
+        progress is shown on the common objective.
         """
         if not self.kpi_template_ids:
             raise UserError(_("Please add at least one KPI to the common objective."))
-
-        HrGoal = self.env["hr.appraisal.goal"]
-        created = 0
-        skipped_no_manager = 0
-        skipped_no_user = 0
-
-        employees = self.target_employee_ids
-        if not employees:
-            employees = self.env["hr.employee"].search([("active", "=", True)])
+        # The job creates the objectives as superuser: the publisher must be
+        # allowed to create objectives
+        self.env["hr.appraisal.goal"].check_access("create")
+        if any(obj.publish_state in ("queued", "running") for obj in self):
+            raise UserError(_("This common objective is already being published."))
 
         for obj in self:
-            for emp in employees:
-                # Determine manager: prefer department manager, fallback to employee's parent
-                manager_emp = emp.department_id.manager_id or emp.parent_id
-                if not manager_emp:
-                    skipped_no_manager += 1
-                    continue
-                # Ensure employee has a linked user to set as creator
-                if not emp.user_id:
-                    skipped_no_user += 1
-                    continue
-                vals = {
-                    "name": obj.name,
-                    "employee_id": emp.id,
-                    "manager_id": manager_emp.id,
-                    # Mark as common; do not attach to a specific department objective
-                    "is_common": True,
-                    "common_origin_id": obj.id,
-                    # Keep institutional reference via related fields on dept objective out; show on appraisal
-                    "deadline": obj.end_date,
-                    "tag_ids": [(6, 0, obj.tag_ids.ids)],
-                    # Create as draft to satisfy creator draft rule for base users
-                    "state": "draft",
-                }
-                # Create goal as the employee's user so create_uid is the employee
-                goal = HrGoal.with_user(emp.user_id.id).create(vals)
-                # Copy KPIs
-                for kpi_t in obj.kpi_template_ids:
-                    self.env["hr.appraisal.goal.kpi"].with_user(emp.user_id.id).create({
-                        "appraisal_goal_id": goal.id,
-                        "kpi": kpi_t.kpi,
-                        "description": kpi_t.description,
-                        "target": kpi_t.target,
-                        "measurement_method": kpi_t.measurement_method,
-                        "weight": kpi_t.weight,
-                    })
-                # Transition to submitted and approved using HR context to avoid permission issues
-                goal.write({"state": "progress"})
-                goal._send_notification("progress")
-                created += 1
-
-        msg = _("Published %s objective(s) to employees") % created
-        if skipped_no_manager:
-            msg += _(". Skipped %s without a manager.") % skipped_no_manager
-        if skipped_no_user:
-            msg += _(" Skipped %s without a linked user.") % skipped_no_user
+            obj.write({
+                "publish_state": "queued",
+                "publish_date": fields.Datetime.now(),
+                "publish_last_employee_id": 0,
+                "publish_total": obj._get_publish_employee_count(),
+                "publish_done": 0,
+                "publish_created": 0,
+                "publish_skipped_no_manager": 0,
+                "publish_skipped_no_user": 0,
+            })
+        self.env.ref("hr_appraisal_objectives.ir_cron_publish_common_objectives")._trigger()
+
+        total = sum(self.mapped("publish_total"))
         return {
             "type": "ir.actions.client",
             "tag": "display_notification",
             "params": {
-                "message": msg,
-                "type": "success" if created else "warning",
+                "message": _("Publishing to %s employee(s) in the background.") % total,
+                "type": "info",
                 "sticky": False,
+                "next": {"type": "ir.actions.client", "tag": "soft_reload"},
             },
         }
 
+    def _get_publish_employee_domain(self):
+        self.ensure_one()
+        domain = [("active", "=", True), ("id", ">", self.publish_last_employee_id)]
+        if self.target_employee_ids:
+            domain.append(("id", "in", self.target_employee_ids.ids))
+        return domain
+
+    def _get_publish_employee_count(self):
+        self.ensure_one()
+        return self.env["hr.employee"].sudo().search_count(
+            [("active", "=", True), ("id", "in", self.target_employee_ids.ids)]
+            if self.target_employee_ids else [("active", "=", True)]
+        )
+
+    @api.model
+    def cron_publish_common_objectives(self):
+        """Publish the next batch of employees of the queued common objectives"""
+        employees = self.env["hr.employee"]
+        for obj in self.search([("publish_state", "in", ("queued", "running"))], order="id"):
+            employees = self.env["hr.employee"].sudo().search(
+                obj._get_publish_employee_domain(), order="id", limit=PUBLISH_BATCH_SIZE
+            )
+            obj._publish_to_employees(employees)
+            if len(employees) < PUBLISH_BATCH_SIZE:
+                obj._finish_publishing()
+            if employees:
+                break
+        remaining = sum(
+            max(queued.publish_total - queued.publish_done, 0)
+            for queued in self.search([("publish_state", "in", ("queued", "running"))])
+        )
+        self.env["ir.cron"]._notify_progress(done=len(employees), remaining=remaining)
+        return True
+
+    def _prepare_goal_vals(self, employee, manager):
+        self.ensure_one()
+        return {
+            "name": self.name,
+            "employee_id": employee.id,
+            "manager_id": manager.id,
+            # Mark as common; do not attach to a specific department objective
+            "is_common": True,
+            "common_origin_id": self.id,
+            "deadline": self.end_date,
+            "tag_ids": [(6, 0, self.tag_ids.ids)],
+            # Created as draft, activated below in a single write
+            "state": "draft",
+        }
+
+    def _prepare_kpi_vals(self, goal):
+        self.ensure_one()
+        return [{
+            "appraisal_goal_id": goal.id,
+            "kpi": kpi_t.kpi,
+            "description": kpi_t.description,
+            "target": kpi_t.target,
+            "measurement_method": kpi_t.measurement_method,
+            "weight": kpi_t.weight,
+        } for kpi_t in self.kpi_template_ids]
+
+    def _publish_to_employees(self, employees):
+        """Create and activate the objectives of ``employees`` in batches"""
+        self.ensure_one()
+        Goal = self.env["hr.appraisal.goal"].sudo()
+        goal_vals_list = []
+        skipped_no_manager = skipped_no_user = 0
+        for emp in employees:
+            # Determine manager: prefer department manager, fallback to employee's parent
+            manager_emp = emp.department_id.manager_id or emp.parent_id
+            if not manager_emp:
+                skipped_no_manager += 1
+                continue
+            # Employee needs a linked internal user to own the objective
+            if not emp.user_id or emp.user_id.share:
+                skipped_no_user += 1
+                continue
+            goal_vals_list.append(self._prepare_goal_vals(emp, manager_emp))
+
+        goals = Goal.create(goal_vals_list)
+        kpis = self.env["hr.appraisal.goal.kpi"].sudo().create([
+            vals for goal in goals for vals in self._prepare_kpi_vals(goal)
+        ])
+        self._set_employee_creator(goals, kpis)
+        goals.write({"state": "progress"})
+        self._notify_published_employees(goals)
+
+        self.write({
+            "publish_state": "running",
+            "publish_last_employee_id": employees[-1:].id or self.publish_last_employee_id,
+            "publish_done": self.publish_done + len(employees),
+            "publish_created": self.publish_created + len(goals),
+            "publish_skipped_no_manager": self.publish_skipped_no_manager + skipped_no_manager,
+            "publish_skipped_no_user": self.publish_skipped_no_user + skipped_no_user,
+        })
+        return goals
+
+    @api.model
+    def _set_employee_creator(self, goals, kpis):
+        """Make the employees' users the creators of their objectives and
+        KPIs, as if they had created them"""
+        if not goals:
+            return
+        self.env.flush_all()
+        cr = self.env.cr
+        cr.execute("""
+            UPDATE hr_appraisal_goal g
+            SET create_uid = e.user_id
+            FROM hr_employee e
+            WHERE e.id = g.employee_id AND g.id IN %s
+        """, (tuple(goals.ids),))
+        if kpis:
+            cr.execute("""
+                UPDATE hr_appraisal_goal_kpi k
+                SET create_uid = e.user_id
+                FROM hr_appraisal_goal g
+                JOIN hr_employee e ON e.id = g.employee_id
+                WHERE g.id = k.appraisal_goal_id AND k.id IN %s
+            """, (tuple(kpis.ids),))
+        goals.invalidate_recordset(["create_uid"])
+        kpis.invalidate_recordset(["create_uid"])
+
+    def _notify_published_employees(self, goals):
+        """Queue the notices of the owners of ``goals`` in one batch"""
+        digests = defaultdict(list)
+        for goal in goals:
+            partner = goal.employee_id.user_id.partner_id
+            if partner:
+                digests[partner].append(
+                    Markup("<strong>%s</strong> (end date: %s)") % (goal.name, goal.deadline)
+                )
+        self.env["performance.notification"]._queue_email_digests(
+            digests,
+            _("Objective approved and active: %s") % self.name,
+            _("Your objective has been approved and active:"),
+            _("You can now start working on this objective."),
+        )
+
+    def _finish_publishing(self):
+        """Close the publishing: one notification per manager and a summary"""
+        self.ensure_one()
+        goals = self.env["hr.appraisal.goal"].sudo().search([
+            ("common_origin_id", "=", self.id),
+            ("create_date", ">=", self.publish_date),
+        ])
+        employees_by_manager = defaultdict(lambda: self.env["hr.employee"])
+        for goal in goals:
+            employees_by_manager[goal.manager_id] |= goal.employee_id
+        for manager, employees in employees_by_manager.items():
+            partner = manager.user_id.partner_id
+            if not partner:
+                continue
+            self.message_notify(
+                partner_ids=partner.ids,
+                subject=_("Objective published: %s") % self.name,
+                body=Markup(
+                    "<p><strong>%s</strong></p><p>%s</p><ul>%s</ul>"
+                ) % (
+                    _("Objective Published: %s") % self.name,
+                    _("The objective is now active for the following members of your team:"),
+                    Markup("").join(Markup("<li>%s</li>") % emp.name for emp in employees),
+                ),
+            )
+
+        msg = _("Published %s objective(s) to employees") % self.publish_created
+        if self.publish_skipped_no_manager:
+            msg += _(". Skipped %s without a manager.") % self.publish_skipped_no_manager
+        if self.publish_skipped_no_user:
+            msg += _(" Skipped %s without a linked user.") % self.publish_skipped_no_user
+        self.message_post(body=escape(msg))
+        self.write({"publish_state": "done", "publish_done": self.publish_total})
+        _logger.info("Common objective %s: %s", self.id, msg)
+
 
 class HrCommonObjectiveKPI(models.Model):
     _name = "hr.common.objective.kpi"
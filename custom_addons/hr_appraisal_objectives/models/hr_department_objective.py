@@ -56,47 +56,42 @@ class HrDepartmentObjective(models.Model):
     appraisal_goal_ids = fields.One2many(
         "hr.appraisal.goal", "department_objective_id", string="Individual Objectives"
     )
-    draft_count = fields.Integer(
-        compute="_compute_goal_counts", store=True, string="Draft Count"
-    )
-    submitted_count = fields.Integer(
-        compute="_compute_goal_counts", store=True, string="Submitted Count"
-    )
-    first_approved_count = fields.Integer(
-        compute="_compute_goal_counts", store=True, string="First Approved Count"
-    )
-    approved_count = fields.Integer(
-        compute="_compute_goal_counts", store=True, string="Approved Count"
-    )
-    progress_count = fields.Integer(
-        compute="_compute_goal_counts", store=True, string="Progress Count"
-    )
-    self_scored_count = fields.Integer(
-        compute="_compute_goal_counts", store=True, string="Self Scored Count"
-    )
-    scored_count = fields.Integer(
-        compute="_compute_goal_counts", store=True, string="Scored Count"
-    )
-    final_count = fields.Integer(
-        compute="_compute_goal_counts", store=True, string="Final Count"
-    )
+    # Goal rollups, maintained from the goal deltas by the rollup job
+    # (see hr.department.objective.rollup)
+    draft_count = fields.Integer(readonly=True, copy=False, string="Draft Count")
+    submitted_count = fields.Integer(readonly=True, copy=False, string="Submitted Count")
+    first_approved_count = fields.Integer(readonly=True, copy=False, string="First Approved Count")
+    approved_count = fields.Integer(readonly=True, copy=False, string="Approved Count")
+    progress_count = fields.Integer(readonly=True, copy=False, string="Progress Count")
+    self_scored_count = fields.Integer(readonly=True, copy=False, string="Self Scored Count")
+    scored_count = fields.Integer(readonly=True, copy=False, string="Scored Count")
+    final_count = fields.Integer(readonly=True, copy=False, string="Final Count")
     progress = fields.Float(
         string="Progress (%)",
-        compute="_compute_progress",
-        store=True,
+        readonly=True,
+        copy=False,
         aggregator="avg",
     )
     individual_objective_count = fields.Integer(
-        compute="_compute_individual_objective_count",
         string="Individual Count",
-        store=True,
+        readonly=True,
+        copy=False,
     )
     avg_score = fields.Float(
         string="Average Score",
-        compute="_compute_avg_score",
-        store=True,
+        readonly=True,
+        copy=False,
         aggregator="avg",
     )
+    active_goal_count = fields.Integer(
+        string="Submitted Individual Count",
+        readonly=True,
+        copy=False,
+        help="Individual objectives past the draft state",
+    )
+    progress_sum = fields.Float(readonly=True, copy=False)
+    score_sum = fields.Float(readonly=True, copy=False)
+    score_count = fields.Integer(readonly=True, copy=False)
 
     # Fiscal year follows institutional objective
     fiscal_year_id = fields.Many2one(
@@ -258,69 +253,21 @@ class HrDepartmentObjective(models.Model):
             )
         return super().create(vals)
 
-    @api.depends("appraisal_goal_ids")
-    def _compute_individual_objective_count(self):
-        for rec in self:
-            rec.individual_objective_count = len(rec.appraisal_goal_ids)
-
-    @api.depends("appraisal_goal_ids.progression")
-    def _compute_progress(self):
-        for record in self:
-            goals = record.appraisal_goal_ids
-            vals = [
-                float(g.progression or 0) for g in goals if g.progression is not None
-            ]
-            if vals:
-                record.progress = sum(vals) / len(vals)
-            else:
-                record.progress = 0
-
-    def _recompute_progress_safe(self):
-        """Safely recompute progress without causing access errors"""
-        try:
-            # Use sudo to bypass access rights for computation
-            self.sudo()._compute_progress()
-        except Exception as e:
-            # Log the error but don't fail the operation
-            _logger.warning(f"Could not recompute department progress: {e}")
-            pass
-
-    def _schedule_progress_recomputation(self):
-        """Schedule progress recomputation for later to avoid blocking user operations"""
-        try:
-            # Use a simple approach: just trigger the computation in a separate transaction
-            self.env.cr.commit()  # Commit current transaction
-            self.sudo()._compute_progress()
-        except Exception as e:
-            _logger.warning(f"Could not schedule progress recomputation: {e}")
-            pass
-
-    @api.depends("appraisal_goal_ids.state")
-    def _compute_goal_counts(self):
-        for rec in self:
-            goals = rec.appraisal_goal_ids
-            rec.draft_count = len(goals.filtered(lambda g: g.state == "draft"))
-            rec.submitted_count = len(goals.filtered(lambda g: g.state == "submitted"))
-            rec.first_approved_count = len(
-                goals.filtered(lambda g: g.state == "first_approved")
-            )
-            rec.approved_count = len(goals.filtered(lambda g: g.state == "progress"))
-            rec.progress_count = len(goals.filtered(lambda g: g.state == "progress"))
-            rec.self_scored_count = len(
-                goals.filtered(lambda g: g.state == "self_scored")
+    def write(self, vals):
+        # The goals take their department from the objective (related
+        # field): the rankings of their previous and new department are stale
+        ranked_departments = None
+        if {"department_id", "institutional_objective_id"}.intersection(vals):
+            goals = self.env["hr.appraisal.goal"].sudo().search(
+                [("department_objective_id", "in", self.ids)]
             )
-            rec.scored_count = len(goals.filtered(lambda g: g.state == "scored"))
-            rec.final_count = len(goals.filtered(lambda g: g.state == "final"))
-
-    @api.depends("appraisal_goal_ids.final_score")
-    def _compute_avg_score(self):
-        for record in self:
-            goals = record.appraisal_goal_ids
-            scores = [g.final_score for g in goals if g.final_score > 0]
-            if scores:
-                record.avg_score = sum(scores) / len(scores)
-            else:
-                record.avg_score = 0
+            ranked_departments = goals._get_ranked_departments()
+        result = super().write(vals)
+        if ranked_departments is not None:
+            ranked_departments |= goals._get_ranked_departments()
+            if ranked_departments:
+                self.env["hr.appraisal.department.rank"].sudo()._refresh_ranks(ranked_departments)
+        return result
 
     def _compute_current_uid(self):
         for rec in self:
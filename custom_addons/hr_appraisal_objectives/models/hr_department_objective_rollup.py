@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+
+# Goal fields feeding the department objective rollups
+ROLLUP_GOAL_FIELDS = {
+    "state", "progression", "self_score", "manager_score", "supervisor_score",
+    "department_objective_id",
+}
+
+# Department objective counter per goal state
+ROLLUP_STATE_COUNTS = {
+    "draft_count": "draft",
+    "submitted_count": "submitted",
+    "first_approved_count": "first_approved",
+    "approved_count": "progress",
+    "progress_count": "progress",
+    "self_scored_count": "self_scored",
+    "scored_count": "scored",
+    "final_count": "final",
+}
+
+
+class HrDepartmentObjectiveRollup(models.Model):
+    """Pending goal deltas of the department objective rollups.
+
+    Goal create/write/unlink queue the removed (sign -1) and added (sign +1)
+    goal values here; the rollup job folds them into the department
+    objective counters with one set-based UPDATE, so writers never wait on
+    the rollups and the cost only depends on the changed goals.
+    """
+    _name = "hr.department.objective.rollup"
+    _description = "Department Objective Rollup Delta"
+    _log_access = False
+
+    department_objective_id = fields.Many2one(
+        "hr.department.objective", required=True, ondelete="cascade"
+    )
+    sign = fields.Integer(required=True)
+    state = fields.Char()
+    progression = fields.Float()
+    final_score = fields.Float()
+
+    def init(self):
+        self._rebuild_rollups()
+
+    @api.model
+    def _enqueue_goal_deltas(self, goals, sign):
+        """Queue the current values of ``goals`` with ``sign``"""
+        goals = goals.filtered("id")
+        if not goals:
+            return
+        goals.flush_recordset(["final_score", *ROLLUP_GOAL_FIELDS])
+        self.env.cr.execute("""
+            INSERT INTO hr_department_objective_rollup (
+                department_objective_id, sign, state, progression, final_score
+            )
+            SELECT department_objective_id, %s, state,
+                   COALESCE(progression::text::numeric, 0), COALESCE(final_score, 0)
+            FROM hr_appraisal_goal
+            WHERE id IN %s AND department_objective_id IS NOT NULL
+        """, (sign, tuple(goals.ids)))
+
+    def _get_apply_query(self, source):
+        """UPDATE adding the deltas of ``source`` to the department
+        objectives; returns the ids of the updated objectives"""
+        def total(expression):
+            return f"COALESCE(d.{expression}, 0) + COALESCE(t.{expression}, 0)"
+
+        counters = ",\n".join(
+            f"SUM(sign) FILTER (WHERE state = '{state}') AS {field}"
+            for field, state in ROLLUP_STATE_COUNTS.items()
+        )
+        assignments = ",\n".join(
+            f"{field} = {total(field)}"
+            for field in [*ROLLUP_STATE_COUNTS, "individual_objective_count",
+                          "active_goal_count", "progress_sum", "score_count", "score_sum"]
+        )
+        return f"""
+            WITH deltas AS (
+                {source}
+            ), t AS (
+                SELECT department_objective_id AS id,
+                       {counters},
+                       SUM(sign) AS individual_objective_count,
+                       SUM(sign) FILTER (WHERE state != 'draft') AS active_goal_count,
+                       SUM(sign * progression) AS progress_sum,
+                       SUM(sign) FILTER (WHERE final_score > 0) AS score_count,
+                       SUM(sign * final_score) FILTER (WHERE final_score > 0) AS score_sum
+                FROM deltas
+                GROUP BY department_objective_id
+            )
+            UPDATE hr_department_objective d
+            SET {assignments},
+                progress = CASE WHEN {total("individual_objective_count")} > 0
+                    THEN ({total("progress_sum")}) / ({total("individual_objective_count")})
+                    ELSE 0 END,
+                avg_score = CASE WHEN {total("score_count")} > 0
+                    THEN ({total("score_sum")}) / ({total("score_count")})
+                    ELSE 0 END
+            FROM t
+            WHERE d.id = t.id
+            RETURNING d.id
+        """
+
+    def _propagate(self, department_objective_ids):
+        """Refresh the caches and institutional rollups of the updated
+        department objectives"""
+        DepartmentObjective = self.env["hr.department.objective"]
+        DepartmentObjective.invalidate_model()
+        objectives = DepartmentObjective.browse(department_objective_ids)
+        objectives.modified(["progress", "avg_score", "active_goal_count"])
+        self.env.flush_all()
+
+    @api.model
+    def cron_apply_rollup_deltas(self):
+        """Fold the pending goal deltas into the department objectives"""
+        self.env["hr.department.objective"].flush_model()
+        self.env.cr.execute(self._get_apply_query(
+            "DELETE FROM hr_department_objective_rollup RETURNING *"
+        ))
+        self._propagate([row[0] for row in self.env.cr.fetchall()])
+        return True
+
+    @api.model
+    def _rebuild_rollups(self):
+        """Recompute the rollups of every department objective from the goals"""
+        fields_to_reset = [
+            *ROLLUP_STATE_COUNTS, "individual_objective_count", "active_goal_count",
+            "progress_sum", "score_count", "score_sum", "progress", "avg_score",
+        ]
+        self.env.flush_all()
+        self.env.cr.execute(
+            "DELETE FROM hr_department_objective_rollup;"
+            "UPDATE hr_department_objective SET "
+            + ", ".join(f"{field} = 0" for field in fields_to_reset)
+        )
+        self.env.cr.execute(self._get_apply_query("""
+            SELECT department_objective_id, 1 AS sign, state,
+                   COALESCE(progression::text::numeric, 0) AS progression,
+                   COALESCE(final_score, 0) AS final_score
+            FROM hr_appraisal_goal
+            WHERE department_objective_id IS NOT NULL
+        """))
+        self._propagate(self.env["hr.department.objective"].search([]).ids)
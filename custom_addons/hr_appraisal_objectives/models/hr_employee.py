@@ -1,6 +1,16 @@
+from collections import defaultdict
+
 from odoo import models, fields, api
 from odoo.exceptions import AccessError
 
+OBJECTIVE_STATUS_COLORS = {
+    'not_started': '#dc3545',  # Danger red (muted)
+    'awaiting_hr': '#6f42c1',  # Purple (muted)
+    'awaiting_manager': '#0d6efd',  # Primary blue (muted)
+    'in_progress': '#fd7e14',  # Orange (muted)
+    'approved': '#198754',  # Success green (muted)
+}
+
 
 class HrEmployee(models.Model):
     _inherit = "hr.employee"
@@ -25,7 +35,7 @@ class HrEmployee(models.Model):
         ('not_started', 'Not Started'),
         ('in_progress', 'In Progress'),
         ('approved', 'Approved'),
-    ], string="Objective Status", compute="_compute_objective_status", store=True, compute_sudo=True, search='_search_objective_status')
+    ], string="Objective Status", compute="_compute_objective_status", store=True, compute_sudo=True, index=True)
     
     objective_status_color = fields.Char(
         string="Status Color",
@@ -36,28 +46,33 @@ class HrEmployee(models.Model):
     
     objective_draft_count = fields.Integer(
         string="Draft Objectives",
-        compute="_compute_objective_counts",
-        store=False
+        compute="_compute_objective_status",
+        store=True,
+        compute_sudo=True,
     )
     objective_submitted_count = fields.Integer(
         string="Submitted Objectives",
-        compute="_compute_objective_counts",
-        store=False
+        compute="_compute_objective_status",
+        store=True,
+        compute_sudo=True,
     )
     objective_first_approved_count = fields.Integer(
         string="First Approved Objectives",
-        compute="_compute_objective_counts",
-        store=False
+        compute="_compute_objective_status",
+        store=True,
+        compute_sudo=True,
     )
     objective_progress_count = fields.Integer(
         string="Active Objectives",
-        compute="_compute_objective_counts",
-        store=False
+        compute="_compute_objective_status",
+        store=True,
+        compute_sudo=True,
     )
     objective_total_count = fields.Integer(
         string="Total Objectives",
-        compute="_compute_objective_counts",
-        store=False
+        compute="_compute_objective_status",
+        store=True,
+        compute_sudo=True,
     )
 
     def _compute_kpi_task_ids(self):
@@ -67,89 +82,54 @@ class HrEmployee(models.Model):
             ])
             emp.kpi_task_ids = kpis.mapped("task_ids")
     
-    def _compute_objective_counts(self):
-        """Compute objective counts by state"""
-        Goal = self.env['hr.appraisal.goal']
-        for emp in self:
-            goals = Goal.search([('employee_id', '=', emp.id)])
-            emp.objective_total_count = len(goals)
-            emp.objective_draft_count = len(goals.filtered(lambda g: g.state == 'draft'))
-            emp.objective_submitted_count = len(goals.filtered(lambda g: g.state == 'submitted'))
-            emp.objective_first_approved_count = len(goals.filtered(lambda g: g.state == 'first_approved'))
-            emp.objective_progress_count = len(goals.filtered(lambda g: g.state in ['progress', 'progress_done']))
-    
     @api.depends('appraisal_goal_ids.state')
     def _compute_objective_status(self):
         """
-        Compute overall objective status for employee:
+        Compute objective counts by state and overall objective status for employee:
         - not_started: No objectives (red - #dc3545 muted)
         - in_progress: Has draft objectives (orange - #fd7e14 muted)
         - awaiting_manager: Has submitted objectives (blue - #0d6efd muted)
         - awaiting_hr: Has first_approved objectives (purple - #6f42c1 muted)
         - approved: All objectives are in progress/done (green - #198754 muted)
+
+        The goal create/write/unlink triggering the recomputation are handled
+        in batches: the counts of the whole recordset come from one grouped
+        query.
         """
+        counts = defaultdict(lambda: defaultdict(int))
+        if self.ids:
+            groups = self.env['hr.appraisal.goal']._read_group(
+                [('employee_id', 'in', self.ids)],
+                ['employee_id', 'state'],
+                ['__count'],
+            )
+            for employee, state, count in groups:
+                counts[employee.id][state] = count
+
         for emp in self:
-            goals = emp.appraisal_goal_ids
-            
-            if not goals:
+            emp_counts = counts[emp.id]
+            total = sum(emp_counts.values())
+            progress = emp_counts['progress'] + emp_counts['progress_done']
+            emp.objective_total_count = total
+            emp.objective_draft_count = emp_counts['draft']
+            emp.objective_submitted_count = emp_counts['submitted']
+            emp.objective_first_approved_count = emp_counts['first_approved']
+            emp.objective_progress_count = progress
+
+            if not total:
                 emp.objective_status = 'not_started'
-                emp.objective_status_color = '#dc3545'  # Danger red (muted)
-            elif any(g.state == 'first_approved' for g in goals):
+            elif emp_counts['first_approved']:
                 emp.objective_status = 'awaiting_hr'
-                emp.objective_status_color = '#6f42c1'  # Purple (muted)
-            elif any(g.state == 'submitted' for g in goals):
+            elif emp_counts['submitted']:
                 emp.objective_status = 'awaiting_manager'
-                emp.objective_status_color = '#0d6efd'  # Primary blue (muted)
-            elif any(g.state == 'draft' for g in goals):
+            elif emp_counts['draft']:
                 emp.objective_status = 'in_progress'
-                emp.objective_status_color = '#fd7e14'  # Orange (muted)
-            elif all(g.state in ['progress', 'progress_done'] for g in goals):
+            elif progress == total:
                 emp.objective_status = 'approved'
-                emp.objective_status_color = '#198754'  # Success green (muted)
             else:
                 # Mixed states - default to in progress
                 emp.objective_status = 'in_progress'
-                emp.objective_status_color = '#fd7e14'
-    
-    def _search_objective_status(self, operator, value):
-        """Search method for objective_status computed field"""
-        Goal = self.env['hr.appraisal.goal']
-        
-        if operator not in ['=', '!=', 'in', 'not in']:
-            return []
-        
-        # Get all employees with their objective statuses
-        all_employees = self.search([])
-        matching_employees = self.browse()
-        
-        for emp in all_employees:
-            goals = Goal.search([('employee_id', '=', emp.id)])
-            
-            # Determine status
-            if not goals:
-                status = 'not_started'
-            elif any(g.state == 'first_approved' for g in goals):
-                status = 'awaiting_hr'
-            elif any(g.state == 'submitted' for g in goals):
-                status = 'awaiting_manager'
-            elif any(g.state == 'draft' for g in goals):
-                status = 'in_progress'
-            elif all(g.state in ['progress', 'progress_done'] for g in goals):
-                status = 'approved'
-            else:
-                status = 'in_progress'
-            
-            # Check if matches search criteria
-            if operator == '=' and status == value:
-                matching_employees |= emp
-            elif operator == '!=' and status != value:
-                matching_employees |= emp
-            elif operator == 'in' and status in value:
-                matching_employees |= emp
-            elif operator == 'not in' and status not in value:
-                matching_employees |= emp
-        
-        return [('id', 'in', matching_employees.ids)]
+            emp.objective_status_color = OBJECTIVE_STATUS_COLORS[emp.objective_status]
     
     def action_view_employee_objectives(self):
         """Open employee's objectives for review and batch approval"""
@@ -246,6 +226,7 @@ class EmployeePublic(models.Model):
     )
 
     def _compute_objective_status_public(self):
-        for rec in self:
-            employee = self.env['hr.employee'].sudo().search([('id', '=', rec.id)], limit=1)
+        employees = self.env['hr.employee'].sudo().browse(self.ids)
+        employees.fetch(['objective_status'])
+        for rec, employee in zip(self, employees):
             rec.objective_status = employee.objective_status
@@ -160,6 +160,26 @@ class HrInstitutionalObjective(models.Model):
             )
         return super().create(vals)
 
+    def write(self, vals):
+        # The goals follow the fiscal year of the objective through a stored
+        # compute: the snapshots and rankings of their previous and new
+        # fiscal year are stale
+        goals = None
+        if {"fiscal_year_id", "start_date", "end_date"}.intersection(vals):
+            snapshots = self.env["hr.appraisal.dashboard.snapshot"].sudo()
+            goals = self.env["hr.appraisal.goal"].sudo().search(
+                [("institutional_objective_id", "in", self.ids)]
+            )
+            snapshots._mark_goals_dirty(goals)
+            ranked_departments = goals._get_ranked_departments()
+        result = super().write(vals)
+        if goals:
+            snapshots._mark_goals_dirty(goals)
+            ranked_departments |= goals._get_ranked_departments()
+            if ranked_departments:
+                self.env["hr.appraisal.department.rank"].sudo()._refresh_ranks(ranked_departments)
+        return result
+
     @api.depends("start_date", "end_date")
     def _compute_fiscal_year(self):
         FiscalYear = self.env["hr.fiscal.year"].sudo()
@@ -201,35 +221,35 @@ class HrInstitutionalObjective(models.Model):
         for rec in self:
             rec.department_objective_count = len(rec.department_objective_ids.filtered(lambda d: d.state != "draft"))
 
-    @api.depends("department_objective_ids", "department_objective_ids.state", "department_objective_ids.appraisal_goal_ids", "department_objective_ids.appraisal_goal_ids.state")
+    def _get_department_rollups(self, domain, aggregate):
+        """``{institutional objective id: aggregate}`` over their department objectives"""
+        ids = [id_ for id_ in self._origin.ids if id_]
+        if not ids:
+            return {}
+        groups = self.env["hr.department.objective"].sudo()._read_group(
+            [("institutional_objective_id", "in", ids)] + domain,
+            ["institutional_objective_id"],
+            [aggregate],
+        )
+        return {objective.id: value for objective, value in groups}
+
+    @api.depends("department_objective_ids.state", "department_objective_ids.active_goal_count")
     def _compute_total_individual_objectives(self):
+        totals = self._get_department_rollups([("state", "!=", "draft")], "active_goal_count:sum")
         for rec in self:
-            total = sum(
-                len(dept.appraisal_goal_ids.filtered(lambda g: g.state != "draft")) for dept in rec.department_objective_ids.filtered(lambda d: d.state != "draft")
-            )
-            rec.total_individual_objectives = total
+            rec.total_individual_objectives = totals.get(rec._origin.id) or 0
 
     @api.depends("department_objective_ids.progress")
     def _compute_progress(self):
+        progress = self._get_department_rollups([], "progress:avg")
         for record in self:
-            departments = record.department_objective_ids
-            vals = [
-                float(d.progress or 0) for d in departments if d.progress is not None
-            ]
-            if vals:
-                record.progress = sum(vals) / len(vals)
-            else:
-                record.progress = 0
+            record.progress = progress.get(record._origin.id) or 0
 
     @api.depends("department_objective_ids.avg_score")
     def _compute_avg_score(self):
+        scores = self._get_department_rollups([("avg_score", ">", 0)], "avg_score:avg")
         for record in self:
-            departments = record.department_objective_ids
-            scores = [d.avg_score for d in departments if d.avg_score > 0]
-            if scores:
-                record.avg_score = sum(scores) / len(scores)
-            else:
-                record.avg_score = 0
+            record.avg_score = scores.get(record._origin.id) or 0
 
     @api.model
     def _compute_all_analytics_fields(self):
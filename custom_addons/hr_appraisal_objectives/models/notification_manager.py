@@ -1,40 +1,99 @@
 from odoo import models, fields, api
 from datetime import timedelta
+from collections import defaultdict
 import logging
 from markupsafe import Markup
 
 _logger = logging.getLogger(__name__)
 
+# State each objective tier is moved to by the auto-completion
+COMPLETION_STATES = {
+    "institutional": "completed",
+    "department": "completed",
+    "individual": "final",
+}
+
 
 class NotificationManager(models.Model):
     _name = "performance.notification"
     _description = "Performance Notification Manager"
 
-    def _send_email_notification(self, partner_ids, subject, body_html):
-        """Helper method to send email notifications via mail.mail"""
-        if not partner_ids:
-            return
-        
+    def _queue_email_digests(self, digests, subject, intro,
+                             outro="Please review the completion status."):
+        """Queue one email per partner listing all its lines.
+
+        ``digests`` maps partners to lists of HTML lines; the mails are sent
+        by the mail queue.
+        """
+        vals_list = []
+        for partner, lines in digests.items():
+            if not partner.email:
+                continue
+            vals_list.append({
+                "subject": subject,
+                "body_html": Markup(
+                    "<p>Dear %s,</p><p>%s</p><ul>%s</ul><p>%s</p>"
+                ) % (partner.name, intro, Markup("").join(Markup("<li>%s</li>") % line for line in lines), outro),
+                "email_to": partner.email,
+                "recipient_ids": [(6, 0, partner.ids)],
+                "auto_delete": True,
+            })
+        if vals_list:
+            self.env["mail.mail"].sudo().create(vals_list)
+            _logger.info(f"Queued {len(vals_list)} email digest(s): {subject}")
+        return len(vals_list)
+
+    def _send_alert_digests(self, alert_type, alerts, config, subject, intro, activity_days):
+        """Send one digest per recipient for ``alerts`` and schedule their activities.
+
+        ``alerts`` is a list of ``(record, users, summary, message)``. Alerts
+        already sent to a user inside the configured repeat window (see the
+        alert ledger) are skipped; the activities are created in one batch.
+        Returns the number of alerts sent.
+        """
+        AlertLog = self.env["hr.appraisal.alert.log"].sudo()
+        today = fields.Date.today()
+        since = today - timedelta(days=config.alert_repeat_days - 1)
+
+        records_by_model = defaultdict(list)
+        for record, _users, _summary, _message in alerts:
+            records_by_model[record._name].append(record.id)
+        already_sent = set()
+        for model, ids in records_by_model.items():
+            already_sent |= AlertLog._get_recent_alerts(alert_type, self.env[model].browse(ids), since)
+
+        digests = defaultdict(list)
+        activity_vals_list = []
+        sent_keys = {}
+        activity_type = self.env.ref("mail.mail_activity_data_todo", raise_if_not_found=False)
+        for record, users, summary, message in alerts:
+            for user in users:
+                key = (record._name, record.id, user.id)
+                if key in already_sent or key in sent_keys:
+                    continue
+                sent_keys[key] = True
+                digests[user.partner_id].append(message)
+                if activity_type:
+                    activity_vals_list.append({
+                        "res_model_id": self.env["ir.model"]._get_id(record._name),
+                        "res_id": record.id,
+                        "activity_type_id": activity_type.id,
+                        "user_id": user.id,
+                        "date_deadline": today + timedelta(days=activity_days),
+                        "summary": summary,
+                        "note": message,
+                    })
+
         try:
-            partners = self.env['res.partner'].browse(partner_ids).filtered(lambda p: p.email)
-            if not partners:
-                _logger.warning(f"No valid email addresses found for partners {partner_ids}")
-                return
-            
-            # Create mail.mail record
-            mail_values = {
-                'subject': subject,
-                'body_html': body_html,
-                'email_to': ','.join(partners.mapped('email')),
-                'partner_ids': [(6, 0, partners.ids)],
-                'auto_delete': True,
-            }
-            
-            mail = self.env['mail.mail'].sudo().create(mail_values)
-            mail.send()
-            _logger.info(f"Sent email notification to {mail_values['email_to']}: {subject}")
+            with self.env.cr.savepoint():
+                self.env["mail.activity"].sudo().create(activity_vals_list)
         except Exception as e:
-            _logger.warning(f"Failed to send email notification: {str(e)}")
+            # Never block the digests on activity issues
+            _logger.warning(f"Failed to create {len(activity_vals_list)} alert activities: {e}")
+        self._queue_email_digests(digests, subject, intro, outro="Please take the necessary action.")
+        AlertLog._log_alerts(alert_type, list(sent_keys), today)
+        AlertLog._prune_alerts(alert_type, since)
+        return len(sent_keys)
 
     @api.model
     def send_deadline_reminders(self):
@@ -51,65 +110,54 @@ class NotificationManager(models.Model):
         inst_objectives = self.env["hr.institutional.objective"].search(
             [("end_date", "<=", deadline_date), ("state", "=", "active")]
         )
-        for obj in inst_objectives:
-            self._send_deadline_notification(obj, "institutional")
         goals = self.env["hr.appraisal.goal"].search(
             [("end_date", "<=", deadline_date), ("state", "in", ["scored"])]
         )
-        for goal in goals:
-            self._send_deadline_notification(goal, "individual")
-
-    def _send_deadline_notification(self, record, obj_type):
-        """Send deadline notification"""
-        try:
-            # Determine recipients: employee and/or line manager when available
-            partner_ids = []
-            user_ids = []
-
-            # For individual goal: notify employee and their parent (line manager)
-            if hasattr(record, 'employee_id') and record.employee_id and record.employee_id.user_id:
-                user_ids.append(record.employee_id.user_id.id)
-                partner_ids.append(record.employee_id.user_id.partner_id.id)
-                if record.employee_id.parent_id and record.employee_id.parent_id.user_id and record.employee_id.parent_id.user_id.partner_id:
-                    user_ids.append(record.employee_id.parent_id.user_id.id)
-                    partner_ids.append(record.employee_id.parent_id.user_id.partner_id.id)
-
-            # For department/inst objectives: keep department manager behaviour
-            if hasattr(record, 'department_id') and record.department_id and record.department_id.manager_id and record.department_id.manager_id.user_id:
-                user_ids.append(record.department_id.manager_id.user_id.id)
-                partner_ids.append(record.department_id.manager_id.user_id.partner_id.id)
-
-            # Post a chatter message on the record
-            title_map = {
-                'institutional': 'Institutional Objective Approaching Deadline',
-                'department': 'Department Objective Approaching Deadline',
-                'individual': 'Objective Approaching Deadline',
-            }
-            title = title_map.get(obj_type, 'Objective Approaching Deadline')
-            message = f'"{getattr(record, "name", "Objective")}" is approaching its deadline on {getattr(record, "end_date", False)}.'
-
-            record.sudo().message_post(
-                body=Markup(f"<p><strong>{title}</strong></p><p>{message}</p>"),
-                partner_ids=list(set(partner_ids)),
-                message_type='notification',
-                subtype_xmlid='mail.mt_comment',
-            )
+        alerts = self._get_deadline_alerts(inst_objectives, "institutional")
+        alerts += self._get_deadline_alerts(goals, "individual")
+        return self._send_alert_digests(
+            "deadline", alerts, config,
+            "Objectives Approaching Deadline",
+            "The following objectives are approaching their deadline:",
+            activity_days=3,
+        )
 
-            # Schedule To Do activities for recipients
-            for uid in set(user_ids):
-                try:
-                    record.activity_schedule(
-                        'mail.mail_activity_data_todo',
-                        date_deadline=fields.Date.today() + timedelta(days=3),
-                        user_id=uid,
-                        summary=title,
-                        note=message,
-                    )
-                except Exception:
-                    # Never block the flow on activity issues
-                    continue
-        except Exception as e:
-            _logger.error(f"Failed to send deadline notification for {record}: {e}")
+    def _get_deadline_alerts(self, records, obj_type):
+        """Deadline reminders of ``records``: ``(record, users, summary, message)``"""
+        if not records:
+            return []
+        title_map = {
+            'institutional': 'Institutional Objective Approaching Deadline',
+            'department': 'Department Objective Approaching Deadline',
+            'individual': 'Objective Approaching Deadline',
+        }
+        title = title_map.get(obj_type, 'Objective Approaching Deadline')
+        has_employee = "employee_id" in records._fields
+        has_department = "department_id" in records._fields
+        # Prefetch the recipients of all records at once
+        if has_employee:
+            records.employee_id.user_id
+            records.employee_id.parent_id.user_id
+        if has_department:
+            records.department_id.manager_id.user_id
+
+        alerts = []
+        for record in records:
+            # Individual goals: employee and their parent (line manager);
+            # department/inst objectives: department manager
+            users = self.env["res.users"]
+            if has_employee and record.employee_id.user_id:
+                users |= record.employee_id.user_id
+                users |= record.employee_id.parent_id.user_id
+            if has_department:
+                users |= record.department_id.manager_id.user_id
+            users = users.filtered("partner_id")
+            if users:
+                message = Markup('<strong>"%s"</strong> is approaching its deadline on %s.') % (
+                    record.name, record.end_date
+                )
+                alerts.append((record, users, title, message))
+        return alerts
 
     @api.model
     def send_performance_alerts(self):
@@ -125,55 +173,146 @@ class NotificationManager(models.Model):
                 ("state", "in", ["scored"]),
             ]
         )
-        for goal in low_progress_goals:
-            self._send_performance_alert(goal)
+        return self._send_alert_digests(
+            "performance", self._get_performance_alerts(low_progress_goals), config,
+            "Performance Alert",
+            "The following objectives show low progress close to their deadline:",
+            activity_days=2,
+        )
 
-    def _send_performance_alert(self, goal):
-        """Send performance alert"""
-        try:
-            if not goal:
-                return
+    def _get_performance_alerts(self, goals):
+        """Low progress alerts of ``goals``: ``(goal, users, summary, message)``"""
+        goals.employee_id.user_id
+        goals.employee_id.parent_id.user_id
+        alerts = []
+        for goal in goals:
             # Recipients: employee and line manager if available
-            partner_ids = []
-            user_ids = []
-            if goal.employee_id and goal.employee_id.user_id:
-                user_ids.append(goal.employee_id.user_id.id)
-                partner_ids.append(goal.employee_id.user_id.partner_id.id)
-            if goal.employee_id and goal.employee_id.parent_id and goal.employee_id.parent_id.user_id:
-                user_ids.append(goal.employee_id.parent_id.user_id.id)
-                partner_ids.append(goal.employee_id.parent_id.user_id.partner_id.id)
-
-            title = 'Performance Alert'
-            message = (
-                f'Objective "{goal.name}" for {goal.employee_id.name} shows low progress '
-                f'({goal.progression:.1f}%) with only {goal.deadline_days} day(s) left.'
-            )
+            users = (goal.employee_id.user_id | goal.employee_id.parent_id.user_id).filtered("partner_id")
+            if not users:
+                continue
+            message = Markup(
+                'Objective <strong>"%s"</strong> for %s shows low progress (%.1f%%) '
+                'with only %s day(s) left.'
+            ) % (goal.name, goal.employee_id.name, goal.progression, goal.deadline_days)
+            alerts.append((goal, users, "Performance Alert", message))
+        return alerts
+
+    def _get_expired_objectives(self, config):
+        """Objectives past their end date (plus the configured delay), per tier"""
+        completion_date = fields.Date.today() - timedelta(days=config.auto_complete_delay_days)
+        return {
+            "institutional": self.env["hr.institutional.objective"].search(
+                [("end_date", "<", completion_date), ("state", "=", "active")]
+            ),
+            "department": self.env["hr.department.objective"].search(
+                [("end_date", "<", completion_date), ("state", "=", "active")]
+            ),
+            "individual": self.env["hr.appraisal.goal"].search(
+                [("end_date", "<", completion_date), ("state", "in", ["progress", "scored"])]
+            ),
+        }
 
-            # Chatter notification on the goal (sends email if configured)
-            goal.sudo().message_post(
-                body=Markup(f"<p><strong>{title}</strong></p><p>{message}</p>"),
-                partner_ids=list(set(partner_ids)),
-                message_type='notification',
-                subtype_xmlid='mail.mt_comment',
-            )
+    def _complete_objectives(self, objectives):
+        """Move every tier to its completion state with a single write.
+
+        Returns the objectives actually completed per tier. When the write
+        of a tier fails, its objectives are completed one by one so only
+        the failing ones are skipped and logged.
+        """
+        completed = {}
+        for tier, records in objectives.items():
+            completed[tier] = records
+            if not records:
+                continue
+            vals = {"state": COMPLETION_STATES[tier]}
+            try:
+                with self.env.cr.savepoint():
+                    records.write(vals)
+            except Exception as e:
+                _logger.warning(f"Failed to complete {len(records)} {tier} objective(s) at once, "
+                                f"completing them one by one: {e}")
+                completed[tier] = records.browse()
+                for record in records:
+                    try:
+                        with self.env.cr.savepoint():
+                            record.write(vals)
+                        completed[tier] |= record
+                    except Exception as e:
+                        _logger.error(f"Failed to complete {tier} objective {record.id}: {e}")
+        return completed
+
+    def _get_completion_digests(self, objectives, high_progress=False):
+        """Digest lines per partner for the completed ``objectives``"""
+        digests = defaultdict(list)
+        for tier in ("institutional", "department"):
+            records = objectives.get(tier)
+            if not records or "department_id" not in records._fields:
+                continue
+            # Prefetch the managers of the whole tier at once
+            records.department_id.manager_id.user_id.partner_id
+            label = "Institutional objective" if tier == "institutional" else "Department objective"
+            for obj in records:
+                partner = obj.department_id.manager_id.user_id.partner_id
+                if partner:
+                    digests[partner].append(
+                        Markup('%s <strong>"%s"</strong> (end date: %s)') % (label, obj.name, obj.end_date)
+                    )
 
-            # Activities
-            for uid in set(user_ids):
-                try:
-                    goal.activity_schedule(
-                        'mail.mail_activity_data_todo',
-                        date_deadline=fields.Date.today() + timedelta(days=2),
-                        user_id=uid,
-                        summary=title,
-                        note=message,
+        goals = objectives.get("individual")
+        if goals:
+            goals.employee_id.user_id.partner_id
+            goals.employee_id.parent_id.user_id.partner_id
+            for goal in goals:
+                employee = goal.employee_id
+                if high_progress:
+                    detail = Markup("end date: %s, progress: %.1f%%") % (goal.end_date, goal.progression)
+                else:
+                    detail = Markup("end date: %s, final score: %.1f%%") % (goal.end_date, goal.final_score)
+                partner = employee.user_id.partner_id
+                if partner:
+                    digests[partner].append(
+                        Markup('Your objective <strong>"%s"</strong> (%s)') % (goal.name, detail)
                     )
-                except Exception:
+                if high_progress:
                     continue
-        except Exception as e:
-            _logger.error(f"Failed to send performance alert for goal {getattr(goal, 'id', '')}: {e}")
+                manager_partner = employee.parent_id.user_id.partner_id
+                if manager_partner:
+                    digests[manager_partner].append(
+                        Markup('<strong>"%s"</strong> for %s (%s)') % (goal.name, employee.name, detail)
+                    )
+        return digests
+
+    def _run_auto_completion(self, config, objectives, high_progress=False, dry_run=False):
+        """Complete ``objectives`` and queue the digests, or only report what
+        would happen when ``dry_run`` is set"""
+        if not dry_run:
+            objectives = self._complete_objectives(objectives)
+        digests = {}
+        if config.send_completion_notifications:
+            digests = self._get_completion_digests(objectives, high_progress=high_progress)
+        if digests and not dry_run:
+            if high_progress:
+                intro = "The following objectives have been automatically completed due to high progress:"
+            else:
+                intro = "The following objectives have been automatically completed:"
+            self._queue_email_digests(digests, "Objectives Automatically Completed", intro)
+
+        report = {
+            f"{tier}_completed": len(objectives.get(tier, [])) for tier in COMPLETION_STATES
+        }
+        report["total_completed"] = sum(report.values())
+        report["digest_count"] = len([partner for partner in digests if partner.email])
+        if dry_run:
+            report["dry_run"] = True
+            report["objectives"] = {
+                tier: records.mapped("display_name") for tier, records in objectives.items()
+            }
+        elif report["total_completed"]:
+            _logger.info(f"Auto-completed {report['total_completed']} objectives")
+        return report
 
     @api.model
-    def auto_complete_expired_objectives(self):
+    def auto_complete_expired_objectives(self, dry_run=False):
         """Automatically complete objectives when their end date has passed"""
         # Get configuration
         config = self.env["hr.appraisal.config"].get_config()
@@ -181,126 +320,12 @@ class NotificationManager(models.Model):
         if not config.auto_complete_enabled:
             return {"message": "Auto-completion is disabled"}
 
-        today = fields.Date.today()
-        completion_date = today - timedelta(days=config.auto_complete_delay_days)
-
-        # Complete expired institutional objectives
-        expired_inst_objectives = self.env["hr.institutional.objective"].search(
-            [("end_date", "<", completion_date), ("state", "=", "active")]
+        return self._run_auto_completion(
+            config, self._get_expired_objectives(config), dry_run=dry_run
         )
 
-        for obj in expired_inst_objectives:
-            try:
-                obj.write({"state": "completed"})
-                if config.send_completion_notifications:
-                    # Send email notification
-                    recipients = []
-                    if hasattr(obj, 'department_id') and obj.department_id and obj.department_id.manager_id:
-                        recipients.append(obj.department_id.manager_id.user_id.partner_id.id)
-                    if recipients:
-                        self._send_email_notification(
-                            recipients,
-                            f"Institutional Objective Completed: {obj.name}",
-                            f"""<p>Dear Manager,</p>
-                            <p>The institutional objective <strong>"{obj.name}"</strong> has been automatically completed.</p>
-                            <p>End Date: {obj.end_date}</p>
-                            <p>Please review the completion status.</p>"""
-                        )
-            except Exception as e:
-                _logger.error(
-                    f"Failed to complete institutional objective {obj.id}: {e}"
-                )
-
-        # Complete expired department objectives
-        expired_dept_objectives = self.env["hr.department.objective"].search(
-            [("end_date", "<", completion_date), ("state", "=", "active")]
-        )
-
-        for obj in expired_dept_objectives:
-            try:
-                obj.write({"state": "completed"})
-                if config.send_completion_notifications:
-                    # Send email notification
-                    recipients = []
-                    if obj.department_id and obj.department_id.manager_id and obj.department_id.manager_id.user_id:
-                        recipients.append(obj.department_id.manager_id.user_id.partner_id.id)
-                    if recipients:
-                        self._send_email_notification(
-                            recipients,
-                            f"Department Objective Completed: {obj.name}",
-                            f"""<p>Dear Manager,</p>
-                            <p>The department objective <strong>"{obj.name}"</strong> has been automatically completed.</p>
-                            <p>End Date: {obj.end_date}</p>
-                            <p>Please review the completion status.</p>"""
-                        )
-            except Exception as e:
-                _logger.error(f"Failed to complete department objective {obj.id}: {e}")
-
-        # Complete expired individual objectives (appraisal goals)
-        expired_goals = self.env["hr.appraisal.goal"].search(
-            [
-                ("end_date", "<", completion_date),
-                ("state", "in", ["progress", "scored"]),
-            ]
-        )
-
-        for goal in expired_goals:
-            try:
-                # If the goal has scores, finalize it; otherwise mark as completed
-                if goal.final_score > 0:
-                    goal.write({"state": "final"})
-                else:
-                    goal.write({"state": "final"})
-
-                # Send notification to relevant users
-                if config.send_completion_notifications:
-                    recipients = []
-                    # Notify employee
-                    if goal.employee_id.user_id and goal.employee_id.user_id.partner_id:
-                        recipients.append(goal.employee_id.user_id.partner_id.id)
-                        self._send_email_notification(
-                            [goal.employee_id.user_id.partner_id.id],
-                            f"Objective Completed: {goal.name}",
-                            f"""<p>Dear {goal.employee_id.name},</p>
-                            <p>Your objective <strong>"{goal.name}"</strong> has been automatically completed.</p>
-                            <p>End Date: {goal.end_date}</p>
-                            <p>Final Score: {goal.final_score:.1f}%</p>
-                            <p>Thank you for your work on this objective.</p>"""
-                        )
-
-                    # Notify line manager if exists
-                    if goal.employee_id and goal.employee_id.parent_id and goal.employee_id.parent_id.user_id and goal.employee_id.parent_id.user_id.partner_id:
-                        self._send_email_notification(
-                            [goal.employee_id.parent_id.user_id.partner_id.id],
-                            f"Team Objective Completed: {goal.name}",
-                            f"""<p>Dear Manager,</p>
-                            <p>The objective <strong>"{goal.name}"</strong> for {goal.employee_id.name} has been automatically completed.</p>
-                            <p>End Date: {goal.end_date}</p>
-                            <p>Final Score: {goal.final_score:.1f}%</p>
-                            <p>Please review the completion status.</p>"""
-                        )
-
-            except Exception as e:
-                _logger.error(f"Failed to complete individual goal {goal.id}: {e}")
-
-        # Log completion summary
-        total_completed = (
-            len(expired_inst_objectives)
-            + len(expired_dept_objectives)
-            + len(expired_goals)
-        )
-        if total_completed > 0:
-            _logger.info(f"Auto-completed {total_completed} expired objectives")
-
-        return {
-            "institutional_completed": len(expired_inst_objectives),
-            "department_completed": len(expired_dept_objectives),
-            "individual_completed": len(expired_goals),
-            "total_completed": total_completed,
-        }
-
     @api.model
-    def auto_complete_with_conditions(self):
+    def auto_complete_with_conditions(self, dry_run=False):
         """Auto-complete objectives with additional conditions"""
         # Get configuration
         config = self.env["hr.appraisal.config"].get_config()
@@ -308,11 +333,17 @@ class NotificationManager(models.Model):
         if not config.auto_complete_enabled:
             return {"message": "Auto-completion is disabled"}
 
-        today = fields.Date.today()
-        completion_date = today - timedelta(days=config.auto_complete_delay_days)
+        report = self._run_auto_completion(
+            config, {"individual": self._get_high_progress_goals(config)},
+            high_progress=True, dry_run=dry_run
+        )
+        return report if dry_run else report["total_completed"]
 
-        # Complete objectives that are past end date AND have sufficient progress
-        goals_with_progress = self.env["hr.appraisal.goal"].search(
+    def _get_high_progress_goals(self, config):
+        """Goals past their end date (plus the configured delay) with
+        sufficient progress"""
+        completion_date = fields.Date.today() - timedelta(days=config.auto_complete_delay_days)
+        return self.env["hr.appraisal.goal"].search(
             [
                 ("end_date", "<", completion_date),
                 ("state", "in", ["progress"]),
@@ -320,25 +351,45 @@ class NotificationManager(models.Model):
             ]
         )
 
-        for goal in goals_with_progress:
-            try:
-                goal.write({"state": "final"})
-
-                # Send notification
-                if config.send_completion_notifications and goal.employee_id.user_id and goal.employee_id.user_id.partner_id:
-                    self._send_email_notification(
-                        [goal.employee_id.user_id.partner_id.id],
-                        f"Objective Auto-Completed: {goal.name}",
-                        f"""<p>Dear {goal.employee_id.name},</p>
-                        <p>Your objective <strong>"{goal.name}"</strong> has been automatically completed due to high progress ({goal.progression:.1f}%).</p>
-                        <p>End Date: {goal.end_date}</p>
-                        <p>Progress: {goal.progression:.1f}%</p>
-                        <p>Congratulations on achieving this milestone!</p>"""
-                    )
-            except Exception as e:
-                _logger.error(f"Failed to auto-complete goal {goal.id}: {e}")
+    @api.model
+    def preview_auto_completion(self):
+        """Dry run of both auto-completion crons.
 
-        return len(goals_with_progress)
+        Goals matched by both crons are completed by whichever runs first;
+        they are only counted under "Expired".
+        """
+        config = self.env["hr.appraisal.config"].get_config()
+        if not config.auto_complete_enabled:
+            message = "Auto-completion is disabled"
+        else:
+            expired_objectives = self._get_expired_objectives(config)
+            expired = self._run_auto_completion(config, expired_objectives, dry_run=True)
+            high_progress = self._run_auto_completion(
+                config,
+                {"individual": self._get_high_progress_goals(config)
+                               - expired_objectives["individual"]},
+                high_progress=True, dry_run=True,
+            )
+            lines = []
+            for label, report in (("Expired", expired),
+                                  ("High progress (not already expired)", high_progress)):
+                lines.append(f"{label}: {report['total_completed']} objective(s), "
+                             f"{report['digest_count']} digest(s)")
+                for tier, names in report["objectives"].items():
+                    if names:
+                        shown = ", ".join(names[:10]) + (" ..." if len(names) > 10 else "")
+                        lines.append(f"  {tier.capitalize()}: {shown}")
+            message = "\n".join(lines)
+        return {
+            "type": "ir.actions.client",
+            "tag": "display_notification",
+            "params": {
+                "title": "Auto-Completion Preview (nothing was changed)",
+                "message": message,
+                "type": "info",
+                "sticky": True,
+            },
+        }
 
     @api.model
     def manual_trigger_auto_completion(self):
@@ -8,6 +8,11 @@ class HrAppraisalDashboard(models.TransientModel):
     _description = "HR Appraisal Dashboard"
 
     # Filter fields
+    fiscal_year_id = fields.Many2one(
+        "hr.fiscal.year",
+        string="Fiscal Year",
+        default=lambda self: self.env["hr.fiscal.year"].get_current_fiscal_year(),
+    )
     department_id = fields.Many2one("hr.department", string="Department")
     employee_id = fields.Many2one("hr.employee", string="Employee")
     date_from = fields.Date(
@@ -17,6 +22,7 @@ class HrAppraisalDashboard(models.TransientModel):
 
     # Dashboard data storage
     dashboard_data = fields.Text("Dashboard Data")
+    snapshot_date = fields.Datetime("Data As Of", readonly=True)
     
     # Computed fields for display
     total_employees = fields.Integer("Total Employees", compute="_compute_overview_metrics")
@@ -40,31 +46,74 @@ class HrAppraisalDashboard(models.TransientModel):
         record._refresh_dashboard_data()
         return record
 
+    @api.onchange("fiscal_year_id")
+    def _onchange_fiscal_year_id(self):
+        if self.fiscal_year_id:
+            self.date_from = self.fiscal_year_id.date_from
+            self.date_to = self.fiscal_year_id.date_to
+
+    @api.onchange("date_from", "date_to")
+    def _onchange_dates(self):
+        fiscal_year = self.fiscal_year_id
+        if fiscal_year and (self.date_from, self.date_to) != (fiscal_year.date_from, fiscal_year.date_to):
+            self.fiscal_year_id = False
+
+    def _use_snapshot(self):
+        """Fiscal year dashboards of HR users are served from the snapshots;
+        other users get a live build restricted by their access rules"""
+        self.ensure_one()
+        return bool(
+            self.fiscal_year_id
+            and self.env.user.has_group("hr_appraisal_objectives.group_hr_appraisal")
+        )
+
+    def _get_snapshot(self):
+        self.ensure_one()
+        return self.env["hr.appraisal.dashboard.snapshot"].sudo()._get_snapshot(
+            self.fiscal_year_id, self.department_id, self.employee_id
+        )
+
     def _refresh_dashboard_data(self):
         """Build and store dashboard data"""
+        if self._use_snapshot():
+            snapshot = self._get_snapshot()
+            self.write({
+                "dashboard_data": snapshot.data,
+                "snapshot_date": snapshot.computed_at,
+            })
+            return
         data = self._build_dashboard_data()
-        self.dashboard_data = json.dumps(data)
+        self.write({
+            "dashboard_data": json.dumps(data),
+            "snapshot_date": fields.Datetime.now(),
+        })
 
-    def _build_dashboard_data(self):
-        """Build comprehensive dashboard data"""
-        Goal = self.env["hr.appraisal.goal"]
-        
-        # Build domain for filtering
+    def _get_dashboard_domain(self):
+        """Goal domain of the dashboard filters"""
         domain = []
-        if self.date_from:
-            domain.append(("create_date", ">=", datetime.combine(self.date_from, datetime.min.time())))
-        if self.date_to:
-            domain.append(("create_date", "<=", datetime.combine(self.date_to, datetime.max.time())))
+        if self.fiscal_year_id:
+            domain.append(("fiscal_year_id", "=", self.fiscal_year_id.id))
+        else:
+            if self.date_from:
+                domain.append(("create_date", ">=", datetime.combine(self.date_from, datetime.min.time())))
+            if self.date_to:
+                domain.append(("create_date", "<=", datetime.combine(self.date_to, datetime.max.time())))
         if self.department_id:
             domain.append(("department_id", "=", self.department_id.id))
         if self.employee_id:
             domain.append(("employee_id", "=", self.employee_id.id))
+        return domain
 
-        # Get goals
-        goals = Goal.search(domain)
-        if not goals and not (self.department_id or self.employee_id):
-            # If no goals in date range, get all goals for better overview
-            goals = Goal.search([])
+    def _build_dashboard_data(self, domain=None):
+        """Build comprehensive dashboard data"""
+        Goal = self.env["hr.appraisal.goal"]
+        if domain is None:
+            goals = Goal.search(self._get_dashboard_domain())
+            if not goals and not (self.fiscal_year_id or self.department_id or self.employee_id):
+                # If no goals in date range, get all goals for better overview
+                goals = Goal.search([])
+        else:
+            goals = Goal.search(domain)
 
         # Overview metrics
         overview_metrics = self._compute_overview_data(goals)
@@ -143,8 +192,10 @@ class HrAppraisalDashboard(models.TransientModel):
                     "progress_sum": 0.0,
                     "score_sum": 0.0,
                     "score_count": 0,
+                    "employee_ids": set(),
                 }
             
+            dept_data[dept_key]["employee_ids"].add(goal.employee_id.id)
             dept_data[dept_key]["total_goals"] += 1
             if goal.state == "final":
                 dept_data[dept_key]["completed_goals"] += 1
@@ -158,8 +209,7 @@ class HrAppraisalDashboard(models.TransientModel):
         # Calculate averages and completion rates
         result = []
         for dept_key, data in dept_data.items():
-            employees_in_dept = goals.filtered(lambda g: g.department_id.id == dept_key).mapped("employee_id")
-            data["employee_count"] = len(employees_in_dept)
+            data["employee_count"] = len(data.pop("employee_ids") - {False})
             data["completion_rate"] = round((data["completed_goals"] / data["total_goals"] * 100), 2) if data["total_goals"] else 0.0
             data["avg_progress"] = round((data["progress_sum"] / data["total_goals"]), 2) if data["total_goals"] else 0.0
             data["avg_score"] = round((data["score_sum"] / data["score_count"]), 2) if data["score_count"] else 0.0
@@ -299,6 +349,13 @@ class HrAppraisalDashboard(models.TransientModel):
 
         return sorted(result, key=lambda x: x["period"])[-6:]  # Last 6 months
 
+    def action_recompute_snapshot(self):
+        """Rebuild the snapshot of the current filters now"""
+        self.ensure_one()
+        if self._use_snapshot():
+            self._get_snapshot()._recompute()
+        return self.action_refresh_dashboard()
+
     def action_refresh_dashboard(self):
         """Refresh dashboard data"""
         self.ensure_one()
@@ -1,7 +1,12 @@
 from odoo import models, fields
+from odoo.tools import SQL
 from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
 import json
 
+# Number of most recent and oldest goals compared for the performance trend
+TREND_SIZES = {"employee": 3, "department": 5}
+
 
 class PerformanceReportWizard(models.TransientModel):
     _name = "performance.report.wizard"
@@ -112,122 +117,201 @@ class PerformanceReportWizard(models.TransientModel):
 
     def _prepare_dashboard_data(self):
         """Prepare comprehensive dashboard data"""
+        # Goal aggregates shared by the sections of this build only
+        cache = {}
         return {
-            "overview_metrics": self._get_overview_metrics(),
-            "department_performance": self._get_department_data(),
-            "top_performers": self._get_top_performers(),
-            "performance_trends": self._get_performance_trends(),
-            "risk_analysis": self._get_risk_analysis(),
-            "completion_forecast": self._get_completion_forecast(),
+            "overview_metrics": self._get_overview_metrics(cache),
+            "department_performance": self._get_department_data(cache),
+            "top_performers": self._get_top_performers(cache),
+            "performance_trends": self._get_performance_trends(cache),
+            "risk_analysis": self._get_risk_analysis(cache),
+            "completion_forecast": self._get_completion_forecast(cache),
         }
 
-    def _get_overview_metrics(self):
-        """Get high-level overview metrics"""
-        total_employees = self.env["hr.employee"].search_count([])
-        total_departments = self.env["hr.department"].search_count([])
-
-        # Get objectives data
-        institutional_objs = self.env["hr.institutional.objective"].search(
-            [("start_date", ">=", self.date_from), ("end_date", "<=", self.date_to)]
+    # Aggregation layer: every section reads the goal figures from a few
+    # grouped queries shared for the whole report build
+    def _get_goal_domain(self):
+        return [("create_date", ">=", self.date_from), ("create_date", "<=", self.date_to)]
+
+    def _get_goal_stats(self, groupby=False, domain=None, cache=None):
+        """Return goal aggregates grouped by employee, department or month
+
+        :param groupby: "employee", "department", "month" or False for the
+            totals (key None)
+        :param domain: goals to aggregate, the report period by default
+        :param cache: dict of the current report build reusing the
+            aggregates already computed by other sections
+        :return: {key: stats} where stats holds the count, completed count,
+            progress and score sums, the average progress of the most recent
+            and oldest goals (trend) and the low score/progress flags
+        """
+        if domain is None:
+            domain = self._get_goal_domain()
+        cache_key = (groupby, repr(domain))
+        if cache is not None and cache_key in cache:
+            return cache[cache_key]
+
+        Goal = self.env["hr.appraisal.goal"]
+        Goal.flush_model(
+            ["employee_id", "department_id", "state", "final_score", "progression"]
         )
-
-        dept_objs = self.env["hr.department.objective"].search(
-            [("start_date", ">=", self.date_from), ("end_date", "<=", self.date_to)]
+        query = Goal._search(domain)
+        alias = query.table
+        create_date = SQL.identifier(alias, "create_date")
+        key = {
+            "employee": SQL.identifier(alias, "employee_id"),
+            "department": SQL.identifier(alias, "department_id"),
+            "month": SQL("date_trunc('month', %s)::date", create_date),
+        }.get(groupby, SQL("NULL::integer"))
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT key,
+                       count(*) AS count,
+                       count(*) FILTER (WHERE state = 'final') AS completed,
+                       sum(progress) AS progress_sum,
+                       sum(final_score) FILTER (WHERE final_score <> 0) AS score_sum,
+                       count(*) FILTER (WHERE final_score <> 0) AS score_count,
+                       avg(progress) FILTER (WHERE recent_rank <= %(trend)s) AS recent_progress,
+                       avg(progress) FILTER (WHERE older_rank <= %(trend)s) AS older_progress,
+                       bool_or(final_score <> 0 AND final_score < 3) AS has_low_score,
+                       bool_or(progress < 50) AS has_low_progress
+                FROM (
+                    SELECT %(key)s AS key,
+                           %(state)s AS state,
+                           COALESCE(%(final_score)s, 0) AS final_score,
+                           COALESCE(%(progression)s::text::numeric, 0) AS progress,
+                           row_number() OVER (
+                               PARTITION BY %(key)s ORDER BY %(create_date)s DESC, %(id)s DESC
+                           ) AS recent_rank,
+                           row_number() OVER (
+                               PARTITION BY %(key)s ORDER BY %(create_date)s, %(id)s
+                           ) AS older_rank
+                    FROM %(from_clause)s
+                    WHERE %(where_clause)s
+                ) goals
+                GROUP BY key
+                """,
+                key=key,
+                trend=TREND_SIZES.get(groupby, 0),
+                state=SQL.identifier(alias, "state"),
+                final_score=SQL.identifier(alias, "final_score"),
+                progression=SQL.identifier(alias, "progression"),
+                create_date=create_date,
+                id=SQL.identifier(alias, "id"),
+                from_clause=query.from_clause,
+                where_clause=query.where_clause or SQL("TRUE"),
+            )
         )
+        stats = {}
+        for row in self.env.cr.dictfetchall():
+            stats[row.pop("key")] = {
+                "count": row["count"],
+                "completed": row["completed"],
+                "progress_sum": float(row["progress_sum"] or 0),
+                "score_sum": float(row["score_sum"] or 0),
+                "score_count": row["score_count"],
+                "recent_progress": float(row["recent_progress"] or 0),
+                "older_progress": float(row["older_progress"] or 0),
+                "has_low_score": row["has_low_score"],
+                "has_low_progress": row["has_low_progress"],
+            }
+        if cache is not None:
+            cache[cache_key] = stats
+        return stats
+
+    def _merge_goal_stats(self, stats_list):
+        """Sum the aggregates of several groups (trend flags are dropped)"""
+        merged = dict.fromkeys(
+            ["count", "completed", "progress_sum", "score_sum", "score_count"], 0
+        )
+        for stats in stats_list:
+            for key in merged:
+                merged[key] += stats[key]
+        return merged
+
+    def _get_stats_figures(self, stats):
+        """Averages and rates of a group of goals"""
+        count = stats["count"] if stats else 0
+        return {
+            "goals_count": count,
+            "completed_goals": stats["completed"] if stats else 0,
+            "avg_progress": stats["progress_sum"] / count if count else 0,
+            "avg_score": (
+                stats["score_sum"] / stats["score_count"]
+                if stats and stats["score_count"]
+                else 0
+            ),
+            "completion_rate": stats["completed"] / count if count else 0,
+        }
 
-        individual_goals = self.env["hr.appraisal.goal"].search(
-            [("create_date", ">=", self.date_from), ("create_date", "<=", self.date_to)]
+    def _get_department_objective_stats(self):
+        """Department objectives of the period: {department_id: (count, avg progress)}"""
+        groups = self.env["hr.department.objective"]._read_group(
+            [("start_date", ">=", self.date_from), ("end_date", "<=", self.date_to)],
+            ["department_id"],
+            ["__count", "progress:avg"],
         )
+        return {
+            department.id: (count, avg_progress or 0)
+            for department, count, avg_progress in groups
+        }
 
-        completed_goals = individual_goals.filtered(lambda g: g.state == "final")
+    def _get_overview_metrics(self, cache=None):
+        """Get high-level overview metrics"""
+        total_employees = self.env["hr.employee"].search_count([])
+        total_departments = self.env["hr.department"].search_count([])
+
+        objective_domain = [
+            ("start_date", ">=", self.date_from),
+            ("end_date", "<=", self.date_to),
+        ]
+        [(institutional_count, institutional_progress)] = self.env[
+            "hr.institutional.objective"
+        ]._read_group(objective_domain, [], ["__count", "progress:avg"])
+        dept_objective_count = self.env["hr.department.objective"].search_count(
+            objective_domain
+        )
+        figures = self._get_stats_figures(self._get_goal_stats(cache=cache).get(None))
 
         return {
             "total_employees": total_employees,
             "total_departments": total_departments,
-            "total_institutional_objectives": len(institutional_objs),
-            "total_department_objectives": len(dept_objs),
-            "total_individual_goals": len(individual_goals),
-            "completed_goals": len(completed_goals),
-            "completion_rate": (
-                (len(completed_goals) / len(individual_goals) * 100)
-                if individual_goals
-                else 0
-            ),
-            "avg_progress": (
-                sum(obj.progress for obj in institutional_objs)
-                / len(institutional_objs)
-                if institutional_objs
-                else 0
-            ),
-            "avg_score": (
-                sum(goal.final_score for goal in individual_goals if goal.final_score)
-                / len([g for g in individual_goals if g.final_score])
-                if [g for g in individual_goals if g.final_score]
-                else 0
-            ),
+            "total_institutional_objectives": institutional_count,
+            "total_department_objectives": dept_objective_count,
+            "total_individual_goals": figures["goals_count"],
+            "completed_goals": figures["completed_goals"],
+            "completion_rate": figures["completion_rate"] * 100,
+            "avg_progress": institutional_progress or 0,
+            "avg_score": figures["avg_score"],
         }
 
-    def _get_department_data(self):
+    def _get_department_data(self, cache=None):
         """Enhanced department data with more metrics"""
         departments = self.department_ids or self.env["hr.department"].search([])
+        goal_stats = self._get_goal_stats("department", cache=cache)
+        objective_stats = self._get_department_objective_stats()
         data = []
         for dept in departments:
-            dept_objectives = self.env["hr.department.objective"].search(
-                [
-                    ("department_id", "=", dept.id),
-                    ("start_date", ">=", self.date_from),
-                    ("end_date", "<=", self.date_to),
-                ]
+            stats = goal_stats.get(dept.id)
+            figures = self._get_stats_figures(stats)
+            objectives_count, avg_progress = objective_stats.get(dept.id, (0, 0))
+            avg_score = figures["avg_score"]
+            completion_rate = figures["completion_rate"]
+
+            # Performance trend: latest goals against the oldest ones
+            trend = (
+                stats["recent_progress"] - stats["older_progress"] if stats else 0
             )
-            individual_goals = self.env["hr.appraisal.goal"].search(
-                [
-                    ("department_id", "=", dept.id),
-                    ("create_date", ">=", self.date_from),
-                    ("create_date", "<=", self.date_to),
-                ]
-            )
-
-            # Calculate additional metrics
-            completed_goals = individual_goals.filtered(lambda g: g.state == "final")
-            avg_progress = (
-                sum(obj.progress for obj in dept_objectives) / len(dept_objectives)
-                if dept_objectives
-                else 0
-            )
-            scored_goals = [g for g in individual_goals if g.final_score]
-            avg_score = (
-                sum(goal.final_score for goal in scored_goals) / len(scored_goals)
-                if scored_goals
-                else 0
-            )
-            completion_rate = (
-                len(completed_goals) / len(individual_goals) if individual_goals else 0
-            )
-
-            # Performance trend calculation
-            recent_goals = individual_goals.sorted("create_date", reverse=True)[:5]
-            older_goals = individual_goals.sorted("create_date")[:5]
-
-            recent_avg = (
-                sum(g.progression for g in recent_goals) / len(recent_goals)
-                if recent_goals
-                else 0
-            )
-            older_avg = (
-                sum(g.progression for g in older_goals) / len(older_goals)
-                if older_goals
-                else 0
-            )
-            trend = recent_avg - older_avg
 
             data.append(
                 {
                     "department": dept,
-                    "objectives_count": len(dept_objectives),
-                    "goals_count": len(individual_goals),
+                    "objectives_count": objectives_count,
+                    "goals_count": figures["goals_count"],
                     "avg_progress": avg_progress,
                     "avg_score": avg_score,
-                    "completed_goals": len(completed_goals),
+                    "completed_goals": figures["completed_goals"],
                     "completion_rate": completion_rate * 100,
                     "performance_trend": trend,
                     "employee_count": dept.total_employee,
@@ -241,40 +325,24 @@ class PerformanceReportWizard(models.TransientModel):
             )
         return data
 
-    def _get_institutional_data(self):
+    def _get_institutional_data(self, cache=None):
         """Enhanced institutional data"""
         institutional_objs = self.institutional_objective_ids or self.env[
             "hr.institutional.objective"
         ].search(
             [("start_date", ">=", self.date_from), ("end_date", "<=", self.date_to)]
         )
+        goal_stats = self._get_goal_stats("department", cache=cache)
         data = []
         for obj in institutional_objs:
-            # Calculate additional metrics
-            dept_objectives = obj.department_objective_ids
-            individual_goals = self.env["hr.appraisal.goal"].search(
-                [
-                    (
-                        "department_id",
-                        "in",
-                        dept_objectives.mapped("department_id").ids,
-                    ),
-                    ("create_date", ">=", self.date_from),
-                    ("create_date", "<=", self.date_to),
-                ]
-            )
-
-            scored_goals = [g for g in individual_goals if g.final_score]
-            avg_score = (
-                sum(goal.final_score for goal in scored_goals) / len(scored_goals)
-                if scored_goals
-                else 0
-            )
-            completion_rate = (
-                len(individual_goals.filtered(lambda g: g.state == "final"))
-                / len(individual_goals)
-                if individual_goals
-                else 0
+            # Goals of the departments involved in the objective
+            department_ids = obj.department_objective_ids.department_id.ids
+            figures = self._get_stats_figures(
+                self._merge_goal_stats(
+                    goal_stats[dept_id]
+                    for dept_id in department_ids
+                    if dept_id in goal_stats
+                )
             )
 
             data.append(
@@ -283,8 +351,8 @@ class PerformanceReportWizard(models.TransientModel):
                     "progress": obj.progress,
                     "departments_count": len(obj.department_objective_ids),
                     "total_individuals": obj.total_individual_objectives,
-                    "avg_score": avg_score,
-                    "completion_rate": completion_rate * 100,
+                    "avg_score": figures["avg_score"],
+                    "completion_rate": figures["completion_rate"] * 100,
                     "deadline_status": self._get_deadline_status(obj),
                     "risk_assessment": self._assess_institutional_risk(obj),
                     "impact_analysis": self._analyze_institutional_impact(obj),
@@ -292,218 +360,150 @@ class PerformanceReportWizard(models.TransientModel):
             )
         return data
 
-    def _get_individual_data(self):
+    def _get_individual_data(self, cache=None):
         """Enhanced individual data"""
         employees = self.employee_ids or self.env["hr.employee"].search([])
+        goal_stats = self._get_goal_stats("employee", cache=cache)
         data = []
         for employee in employees:
-            goals = self.env["hr.appraisal.goal"].search(
-                [
-                    ("employee_id", "=", employee.id),
-                    ("create_date", ">=", self.date_from),
-                    ("create_date", "<=", self.date_to),
-                ]
-            )
-
-            if goals:
-                completed_goals = goals.filtered(lambda g: g.state == "final")
-                avg_progress = sum(goal.progression for goal in goals) / len(goals)
-                scored_goals = [g for g in goals if g.final_score]
-                avg_score = (
-                    sum(goal.final_score for goal in scored_goals) / len(scored_goals)
-                    if scored_goals
-                    else 0
-                )
-                completion_rate = len(completed_goals) / len(goals)
-
-                # Performance trend
-                recent_goals = goals.sorted("create_date", reverse=True)[:3]
-                older_goals = goals.sorted("create_date")[:3]
+            stats = goal_stats.get(employee.id)
+            if not stats:
+                continue
+            figures = self._get_stats_figures(stats)
+            avg_progress = figures["avg_progress"]
+            avg_score = figures["avg_score"]
 
-                recent_avg = (
-                    sum(g.progression for g in recent_goals) / len(recent_goals)
-                    if recent_goals
-                    else 0
-                )
-                older_avg = (
-                    sum(g.progression for g in older_goals) / len(older_goals)
-                    if older_goals
-                    else 0
-                )
-                trend = recent_avg - older_avg
-
-                data.append(
-                    {
-                        "employee": employee,
-                        "goals_count": len(goals),
-                        "avg_progress": avg_progress,
-                        "avg_score": avg_score,
-                        "completed_goals": len(completed_goals),
-                        "completion_rate": completion_rate * 100,
-                        "performance_trend": trend,
-                        "department": (
-                            employee.department_id.name
-                            if employee.department_id
-                            else ""
-                        ),
-                        "position": employee.job_title or "",
-                        "performance_category": self._categorize_performance(
-                            avg_score, avg_progress
-                        ),
-                        "development_needs": self._identify_development_needs(goals),
-                    }
-                )
+            data.append(
+                {
+                    "employee": employee,
+                    "goals_count": figures["goals_count"],
+                    "avg_progress": avg_progress,
+                    "avg_score": avg_score,
+                    "completed_goals": figures["completed_goals"],
+                    "completion_rate": figures["completion_rate"] * 100,
+                    "performance_trend": stats["recent_progress"]
+                    - stats["older_progress"],
+                    "department": (
+                        employee.department_id.name if employee.department_id else ""
+                    ),
+                    "position": employee.job_title or "",
+                    "performance_category": self._categorize_performance(
+                        avg_score, avg_progress
+                    ),
+                    "development_needs": self._identify_development_needs(stats),
+                }
+            )
         return data
 
-    def _get_comparative_data(self):
+    def _get_comparative_data(self, cache=None):
         """Enhanced comparative data"""
         departments = self.env["hr.department"].search([])
+        goal_stats = self._get_goal_stats("department", cache=cache)
         data = []
         for dept in departments:
-            goals = self.env["hr.appraisal.goal"].search(
-                [
-                    ("department_id", "=", dept.id),
-                    ("create_date", ">=", self.date_from),
-                    ("create_date", "<=", self.date_to),
-                ]
-            )
-            if goals:
-                completed_goals = goals.filtered(lambda g: g.state == "final")
-                scored_goals = [g for g in goals if g.final_score]
-                avg_score = (
-                    sum(goal.final_score for goal in scored_goals) / len(scored_goals)
-                    if scored_goals
-                    else 0
-                )
-                completion_rate = len(completed_goals) / len(goals)
-                avg_progress = sum(goal.progression for goal in goals) / len(goals)
+            stats = goal_stats.get(dept.id)
+            if not stats:
+                continue
+            figures = self._get_stats_figures(stats)
+            avg_score = figures["avg_score"]
+            completion_rate = figures["completion_rate"]
+            avg_progress = figures["avg_progress"]
 
-                data.append(
-                    {
-                        "department": dept.name,
-                        "total_goals": len(goals),
-                        "avg_score": avg_score,
-                        "completion_rate": completion_rate,
-                        "avg_progress": avg_progress,
-                        "employee_count": len(dept.employee_ids),
-                        "efficiency_score": self._calculate_efficiency_score(
-                            completion_rate, avg_score, avg_progress
-                        ),
-                        "benchmark_comparison": self._compare_to_benchmark(
-                            avg_score, completion_rate
-                        ),
-                    }
-                )
+            data.append(
+                {
+                    "department": dept.name,
+                    "total_goals": figures["goals_count"],
+                    "avg_score": avg_score,
+                    "completion_rate": completion_rate,
+                    "avg_progress": avg_progress,
+                    "employee_count": dept.total_employee,
+                    "efficiency_score": self._calculate_efficiency_score(
+                        completion_rate, avg_score, avg_progress
+                    ),
+                    "benchmark_comparison": self._compare_to_benchmark(
+                        avg_score, completion_rate
+                    ),
+                }
+            )
         return sorted(data, key=lambda x: x["avg_score"], reverse=True)
 
-    def _get_top_performers(self):
+    def _get_top_performers(self, cache=None):
         """Get top performing employees and departments"""
-        employees = self.env["hr.employee"].search([])
+        goal_stats = self._get_goal_stats("employee", cache=cache)
+        employees = self.env["hr.employee"].browse(
+            [emp_id for emp_id in goal_stats if emp_id]
+        ).exists()
         top_employees = []
 
         for emp in employees:
-            goals = self.env["hr.appraisal.goal"].search(
-                [
-                    ("employee_id", "=", emp.id),
-                    ("create_date", ">=", self.date_from),
-                    ("create_date", "<=", self.date_to),
-                ]
-            )
-
-            if goals:
-                # Get goals with final scores
-                scored_goals = [g for g in goals if g.final_score]
-                if scored_goals:
-                    avg_score = sum(goal.final_score for goal in scored_goals) / len(
-                        scored_goals
-                    )
-                    if avg_score >= 4.0:  # Top performers threshold
-                        top_employees.append(
-                            {
-                                "employee": emp.name,
-                                "department": (
-                                    emp.department_id.name if emp.department_id else ""
-                                ),
-                                "avg_score": avg_score,
-                                "goals_count": len(goals),
-                            }
-                        )
+            figures = self._get_stats_figures(goal_stats[emp.id])
+            # Only goals with a final score count for the average
+            if goal_stats[emp.id]["score_count"] and figures["avg_score"] >= 4.0:
+                top_employees.append(
+                    {
+                        "employee": emp.name,
+                        "department": (
+                            emp.department_id.name if emp.department_id else ""
+                        ),
+                        "avg_score": figures["avg_score"],
+                        "goals_count": figures["goals_count"],
+                    }
+                )
 
         return sorted(top_employees, key=lambda x: x["avg_score"], reverse=True)[:10]
 
-    def _get_performance_trends(self):
+    def _get_performance_trends(self, cache=None):
         """Get performance trends over time"""
         # Monthly trends for the last 6 months
+        first_month = fields.Date.today().replace(day=1) - relativedelta(months=5)
+        goal_stats = self._get_goal_stats(
+            "month", domain=[("create_date", ">=", first_month)], cache=cache
+        )
         trends = []
         for i in range(6):
-            month_start = (datetime.now() - timedelta(days=30 * i)).replace(day=1)
-            month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(
-                days=1
-            )
-
-            goals = self.env["hr.appraisal.goal"].search(
-                [("create_date", ">=", month_start), ("create_date", "<=", month_end)]
+            month_start = first_month + relativedelta(months=i)
+            stats = goal_stats.get(month_start)
+            if not stats:
+                continue
+            figures = self._get_stats_figures(stats)
+            trends.append(
+                {
+                    "month": month_start.strftime("%B %Y"),
+                    "avg_progress": figures["avg_progress"],
+                    "avg_score": figures["avg_score"],
+                    "completion_rate": figures["completion_rate"] * 100,
+                    "goals_count": figures["goals_count"],
+                }
             )
 
-            if goals:
-                avg_progress = sum(g.progression for g in goals) / len(goals)
-                scored_goals = [g for g in goals if g.final_score]
-                avg_score = (
-                    sum(g.final_score for g in scored_goals) / len(scored_goals)
-                    if scored_goals
-                    else 0
-                )
-                completion_rate = len(
-                    goals.filtered(lambda g: g.state == "final")
-                ) / len(goals)
+        return trends
 
-                trends.append(
-                    {
-                        "month": month_start.strftime("%B %Y"),
-                        "avg_progress": avg_progress,
-                        "avg_score": avg_score,
-                        "completion_rate": completion_rate * 100,
-                        "goals_count": len(goals),
-                    }
-                )
-
-        return list(reversed(trends))
-
-    def _get_risk_analysis(self):
+    def _get_risk_analysis(self, cache=None):
         """Identify performance risks"""
         risks = []
 
         # Departments at risk
         departments = self.env["hr.department"].search([])
+        goal_stats = self._get_goal_stats("department", cache=cache)
         for dept in departments:
-            goals = self.env["hr.appraisal.goal"].search(
-                [
-                    ("department_id", "=", dept.id),
-                    ("create_date", ">=", self.date_from),
-                    ("create_date", "<=", self.date_to),
-                ]
-            )
-
-            if goals:
-                avg_progress = sum(g.progression for g in goals) / len(goals)
-                scored_goals = [g for g in goals if g.final_score]
-                avg_score = (
-                    sum(g.final_score for g in scored_goals) / len(scored_goals)
-                    if scored_goals
-                    else 0
+            stats = goal_stats.get(dept.id)
+            if not stats:
+                continue
+            figures = self._get_stats_figures(stats)
+            avg_progress = figures["avg_progress"]
+            avg_score = figures["avg_score"]
+
+            if avg_progress < 50 or avg_score < 2.5:
+                risks.append(
+                    {
+                        "type": "department",
+                        "name": dept.name,
+                        "risk_level": "high" if avg_progress < 30 else "medium",
+                        "issue": f"Low progress ({avg_progress:.1f}%) and score ({avg_score:.1f})",
+                        "recommendation": "Schedule performance review and provide support",
+                    }
                 )
 
-                if avg_progress < 50 or avg_score < 2.5:
-                    risks.append(
-                        {
-                            "type": "department",
-                            "name": dept.name,
-                            "risk_level": "high" if avg_progress < 30 else "medium",
-                            "issue": f"Low progress ({avg_progress:.1f}%) and score ({avg_score:.1f})",
-                            "recommendation": "Schedule performance review and provide support",
-                        }
-                    )
-
         # Overdue objectives
         overdue_objs = self.env["hr.institutional.objective"].search(
             [("end_date", "<", fields.Date.today()), ("state", "=", "active")]
@@ -522,20 +522,15 @@ class PerformanceReportWizard(models.TransientModel):
 
         return risks
 
-    def _get_completion_forecast(self):
+    def _get_completion_forecast(self, cache=None):
         """Forecast completion rates"""
         current_date = fields.Date.today()
         end_of_period = self.date_to
 
         # Calculate current completion rate
-        total_goals = self.env["hr.appraisal.goal"].search(
-            [("create_date", ">=", self.date_from), ("create_date", "<=", self.date_to)]
-        )
-
-        completed_goals = total_goals.filtered(lambda g: g.state == "final")
-        current_completion = (
-            len(completed_goals) / len(total_goals) if total_goals else 0
-        )
+        current_completion = self._get_stats_figures(
+            self._get_goal_stats(cache=cache).get(None)
+        )["completion_rate"]
 
         # Simple linear forecast
         days_elapsed = (current_date - self.date_from).days
@@ -627,18 +622,12 @@ class PerformanceReportWizard(models.TransientModel):
         else:
             return "needs_improvement"
 
-    def _identify_development_needs(self, goals):
-        """Identify development needs based on goals"""
+    def _identify_development_needs(self, stats):
+        """Identify development needs based on the goal aggregates"""
         needs = []
-        low_scoring_goals = goals.filtered(
-            lambda g: g.final_score and g.final_score < 3.0
-        )
-
-        if low_scoring_goals:
+        if stats["has_low_score"]:
             needs.append("Additional training in specific areas")
-
-        incomplete_goals = goals.filtered(lambda g: g.progression < 50)
-        if incomplete_goals:
+        if stats["has_low_progress"]:
             needs.append("Time management and prioritization skills")
 
         return needs